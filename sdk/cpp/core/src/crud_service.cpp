@@ -43,8 +43,18 @@ static string get_config_data_payload(Entity & entity, ydk::ServiceProvider & pr
 static string get_xml_subtree_filter_payload(Entity & entity, const path::Session & session);
 static std::shared_ptr<path::DataNode> execute_rpc(ydk::ServiceProvider & provider, Entity & entity,
         const string & operation, const string & data_tag, bool set_config_flag);
+static std::shared_ptr<path::DataNode> execute_rpc(ydk::ServiceProvider & provider, vector<Entity*> & entities,
+        const string & operation, const string & data_tag, bool set_config_flag);
+static bool supports_bulk_payload(ydk::ServiceProvider & provider);
+static string get_top_schema_path(Entity & top_entity);
 static shared_ptr<Entity> get_top_entity_from_filter(Entity & filter);
+static Entity & get_top_filter(Entity & filter);
 static bool operation_succeeded(shared_ptr<path::DataNode> node);
+static shared_ptr<ydk::path::Rpc> create_rpc(ydk::ServiceProvider & provider, vector<Entity*> & entities,
+        const string & operation, const string & data_tag, bool set_config_flag);
+static vector<string> get_path_segments(const string & path);
+static void find_entries(shared_ptr<Entity> entity, const vector<string> & segments, size_t level,
+        deque<shared_ptr<Entity>> & entries);
 
 CrudService::CrudService()
 {
@@ -90,6 +100,117 @@ shared_ptr<Entity> CrudService::read_config(ydk::ServiceProvider & provider, Ent
     return read_datanode(filter, execute_rpc(provider, filter, "ydk:read", "filter", true));
 }
 
+bool CrudService::create(ydk::ServiceProvider & provider, vector<Entity*> & entities)
+{
+    YLOG_INFO("Executing CRUD create operation on {} entities", entities.size());
+    if(!supports_bulk_payload(provider))
+    {
+        for(Entity* entity : entities)
+        {
+            if(!create(provider, *entity))
+                return false;
+        }
+        return true;
+    }
+    return operation_succeeded(
+            execute_rpc(provider, entities, "ydk:create", "entity", false)
+            );
+}
+
+bool CrudService::update(ydk::ServiceProvider & provider, vector<Entity*> & entities)
+{
+    YLOG_INFO("Executing CRUD update operation on {} entities", entities.size());
+    if(!supports_bulk_payload(provider))
+    {
+        for(Entity* entity : entities)
+        {
+            if(!update(provider, *entity))
+                return false;
+        }
+        return true;
+    }
+    return operation_succeeded(
+            execute_rpc(provider, entities, "ydk:update", "entity", false)
+            );
+}
+
+bool CrudService::delete_(ydk::ServiceProvider & provider, vector<Entity*> & entities)
+{
+    YLOG_INFO("Executing CRUD delete operation on {} entities", entities.size());
+    if(!supports_bulk_payload(provider))
+    {
+        for(Entity* entity : entities)
+        {
+            if(!delete_(provider, *entity))
+                return false;
+        }
+        return true;
+    }
+    return operation_succeeded(
+            execute_rpc(provider, entities, "ydk:delete", "entity", false)
+            );
+}
+
+vector<shared_ptr<Entity>> CrudService::read(ydk::ServiceProvider & provider, vector<Entity*> & filters)
+{
+    YLOG_INFO("Executing CRUD read operation on {} filters", filters.size());
+    if(!supports_bulk_payload(provider))
+    {
+        vector<shared_ptr<Entity>> entities;
+        for(Entity* filter : filters)
+            entities.push_back(read(provider, *filter));
+        return entities;
+    }
+    return read_datanode(filters, execute_rpc(provider, filters, "ydk:read", "filter", false));
+}
+
+vector<shared_ptr<Entity>> CrudService::read_config(ydk::ServiceProvider & provider, vector<Entity*> & filters)
+{
+    YLOG_INFO("Executing CRUD config read operation on {} filters", filters.size());
+    if(!supports_bulk_payload(provider))
+    {
+        vector<shared_ptr<Entity>> entities;
+        for(Entity* filter : filters)
+            entities.push_back(read_config(provider, *filter));
+        return entities;
+    }
+    return read_datanode(filters, execute_rpc(provider, filters, "ydk:read", "filter", true));
+}
+
+unique_ptr<EntityStream> CrudService::read_iter(ydk::ServiceProvider & provider, Entity & filter, const string & path)
+{
+    YLOG_INFO("Executing CRUD streaming read operation on {}", path);
+    return read_stream(provider, filter, path, false);
+}
+
+unique_ptr<EntityStream> CrudService::read_config_iter(ydk::ServiceProvider & provider, Entity & filter, const string & path)
+{
+    YLOG_INFO("Executing CRUD streaming config read operation on {}", path);
+    return read_stream(provider, filter, path, true);
+}
+
+unique_ptr<EntityStream> CrudService::read_stream(ydk::ServiceProvider & provider, Entity & filter, const string & path, bool config)
+{
+    vector<string> segments = get_path_segments(path);
+    shared_ptr<Entity> top_entity = get_top_entity_from_filter(filter);
+    if(segments.empty() || segments[0] != top_entity->yang_name)
+    {
+        YLOG_ERROR("Path '{}' does not start at '{}'", path, top_entity->yang_name);
+        throw(YCPPInvalidArgumentError{"Path '" + path + "' does not start at '" + top_entity->yang_name + "'"});
+    }
+
+    auto netconf_session = dynamic_cast<const path::NetconfSession*>(&provider.get_session());
+    if(netconf_session == nullptr)
+    {
+        shared_ptr<Entity> entity = config ? read_config(provider, filter) : read(provider, filter);
+        return make_unique<EntityStream>(entity, segments);
+    }
+
+    vector<Entity*> filters{&filter};
+    auto rpc = create_rpc(provider, filters, "ydk:read", "filter", config);
+    return make_unique<EntityStream>(top_entity, segments, netconf_session->stream_read(*rpc, path));
+}
+
 shared_ptr<Entity> CrudService::read_datanode(Entity & filter, shared_ptr<path::DataNode> read_data_node)
 {
     if (read_data_node == nullptr)
@@ -99,6 +220,56 @@ shared_ptr<Entity> CrudService::read_datanode(Entity & filter, shared_ptr<path::
     return top_entity;
 }
 
+vector<shared_ptr<Entity>> CrudService::read_datanode(vector<Entity*> & filters, shared_ptr<path::DataNode> read_data_node)
+{
+    vector<shared_ptr<Entity>> entities(filters.size());
+    if (read_data_node == nullptr)
+        return entities;
+
+    // the reply merges the data of the filters of the same top level node,
+    // each filter takes the data it selects from it
+    auto children = read_data_node->get_children();
+    for(size_t i = 0; i < filters.size(); i++)
+    {
+        Entity & top_filter = get_top_filter(*filters[i]);
+        shared_ptr<Entity> top_entity = get_top_entity_from_filter(*filters[i]);
+        string path = "/" + top_entity->get_segment_path();
+        string schema_path = get_top_schema_path(*top_entity);
+        path::DataNode* data_node = nullptr;
+        for(auto const & child : children)
+        {
+            if(child->get_path() == path)
+            {
+                data_node = child.get();
+                break;
+            }
+            if(data_node == nullptr && child->get_schema_node().get_path() == schema_path)
+                data_node = child.get();
+        }
+        if(data_node == nullptr)
+        {
+            YLOG_DEBUG("No data in reply for filter {}", schema_path);
+            continue;
+        }
+        get_entity_from_data_node(data_node, top_filter, top_entity);
+        entities[i] = top_entity;
+    }
+    return entities;
+}
+
+// The entities of a bulk operation can only share one payload over NETCONF,
+// RESTCONF addresses each top level entity by its own URL.
+static bool supports_bulk_payload(ydk::ServiceProvider & provider)
+{
+    return dynamic_cast<const path::NetconfSession*>(&provider.get_session()) != nullptr;
+}
+
+static string get_top_schema_path(Entity & top_entity)
+{
+    string path = "/" + top_entity.get_segment_path();
+    return path.substr(0, path.find('['));
+}
+
 static bool operation_succeeded(shared_ptr<path::DataNode> node)
 {
     YLOG_INFO("Operation {}", ((node == nullptr)?"succeeded":"failed"));
@@ -113,8 +284,36 @@ static shared_ptr<Entity> get_top_entity_from_filter(Entity & filter)
     return get_top_entity_from_filter(*(filter.parent));
 }
 
+static Entity & get_top_filter(Entity & filter)
+{
+    if(filter.parent == nullptr)
+        return filter;
+
+    return get_top_filter(*(filter.parent));
+}
+
 static shared_ptr<path::DataNode> execute_rpc(ydk::ServiceProvider & provider, Entity & entity,
         const string & operation, const string & data_tag, bool set_config_flag)
+{
+    vector<Entity*> entities{&entity};
+    return execute_rpc(provider, entities, operation, data_tag, set_config_flag);
+}
+
+static shared_ptr<path::DataNode> execute_rpc(ydk::ServiceProvider & provider, vector<Entity*> & entities,
+        const string & operation, const string & data_tag, bool set_config_flag)
+{
+    if(entities.empty())
+    {
+        YLOG_DEBUG("No entities given, nothing to send");
+        return nullptr;
+    }
+
+    auto ydk_rpc = create_rpc(provider, entities, operation, data_tag, set_config_flag);
+    return (*ydk_rpc)(provider.get_session());
+}
+
+static shared_ptr<ydk::path::Rpc> create_rpc(ydk::ServiceProvider & provider, vector<Entity*> & entities,
+        const string & operation, const string & data_tag, bool set_config_flag)
 {
     const path::Session& session = provider.get_session();
 //    if(data_tag == "entity")
@@ -125,13 +324,16 @@ static shared_ptr<path::DataNode> execute_rpc(ydk::ServiceProvider & provider, E
     path::RootSchemaNode& root_schema = session.get_root_schema();
     shared_ptr<ydk::path::Rpc> ydk_rpc { root_schema.create_rpc(operation) };
     string data;
-    if(data_tag == "filter" && provider.get_encoding() == EncodingFormat::XML)
+    for(Entity* entity : entities)
     {
-        data = get_xml_subtree_filter_payload(entity, session);
-    }
-    else
-    {
-        data = get_config_data_payload(entity, provider);
+        if(data_tag == "filter" && provider.get_encoding() == EncodingFormat::XML)
+        {
+            data += get_xml_subtree_filter_payload(*entity, session);
+        }
+        else
+        {
+            data += get_config_data_payload(*entity, provider);
+        }
     }
 
     if(set_config_flag)
@@ -139,7 +341,87 @@ static shared_ptr<path::DataNode> execute_rpc(ydk::ServiceProvider & provider, E
         ydk_rpc->get_input_node().create_datanode("only-config");
     }
     ydk_rpc->get_input_node().create_datanode(data_tag, data);
-    return (*ydk_rpc)(session);
+    return ydk_rpc;
+}
+
+static vector<string> get_path_segments(const string & path)
+{
+    vector<string> segments;
+    string::size_type start = 0;
+    while(start <= path.size())
+    {
+        auto end = path.find('/', start);
+        if(end == string::npos)
+            end = path.size();
+        if(end > start)
+        {
+            string segment = path.substr(start, end - start);
+            segments.push_back(segment.substr(segment.find(':') + 1));
+        }
+        start = end + 1;
+    }
+    return segments;
+}
+
+static void find_entries(shared_ptr<Entity> entity, const vector<string> & segments, size_t level,
+        deque<shared_ptr<Entity>> & entries)
+{
+    if(level == segments.size())
+    {
+        entries.push_back(entity);
+        return;
+    }
+    for(auto const & child : entity->get_children())
+    {
+        if(child.second != nullptr && child.second->yang_name == segments[level])
+            find_entries(child.second, segments, level + 1, entries);
+    }
+}
+
+EntityStream::EntityStream(shared_ptr<Entity> top_entity, const vector<string> & segments,
+                           unique_ptr<path::DataNodeStream> data_nodes)
+    : prototype{top_entity}, segments{segments}, data_nodes{move(data_nodes)}
+{
+}
+
+EntityStream::EntityStream(shared_ptr<Entity> top_entity, const vector<string> & segments)
+    : current{top_entity}, segments{segments}
+{
+    if(current != nullptr)
+        find_entries(current, segments, 1, entries);
+}
+
+EntityStream::~EntityStream()
+{
+}
+
+shared_ptr<Entity> EntityStream::next()
+{
+    while(entries.empty() && data_nodes != nullptr)
+    {
+        auto data_node = data_nodes->next();
+        if(data_node == nullptr)
+        {
+            data_nodes.reset();
+            break;
+        }
+        auto children = data_node->get_children();
+        if(children.empty())
+        {
+            YLOG_DEBUG("Skipping streamed entry without data");
+            continue;
+        }
+        // every entry is decoded into a new top level entity
+        current = prototype->clone_ptr();
+        get_entity_from_data_node(children[0].get(), current);
+        find_entries(current, segments, 1, entries);
+    }
+
+    if(entries.empty())
+        return nullptr;
+    shared_ptr<Entity> entry = entries.front();
+    entries.pop_front();
+    return entry;
 }
 
 static string get_config_data_payload(Entity & entity, ydk::ServiceProvider & provider)
@@ -28,7 +28,10 @@
 #ifndef CRUD_SERVICE_HPP
 #define CRUD_SERVICE_HPP
 
+#include <deque>
 #include <memory>
+#include <string>
+#include <vector>
 
 #include "path_api.hpp"
 #include "service_provider.hpp"
@@ -40,9 +43,11 @@ namespace ydk
 namespace path
 {
 class DataNode;
+class DataNodeStream;
 }
 
 class Entity;
+class EntityStream;
 
 class CrudService
 {
@@ -60,8 +65,54 @@ class CrudService
 
         std::shared_ptr<Entity> read_config(ydk::ServiceProvider & provider, Entity & filter);
 
+        // Bulk operations. Over NETCONF the entities are sent in a single
+        // edit-config, and the filters in a single get/get-config whose reply
+        // is split back into one entity per filter, in the order of the filters.
+        bool create(ydk::ServiceProvider & provider, std::vector<Entity*> & entities);
+
+        bool update(ydk::ServiceProvider & provider, std::vector<Entity*> & entities);
+
+        bool delete_(ydk::ServiceProvider & provider, std::vector<Entity*> & entities);
+
+        std::vector<std::shared_ptr<Entity>> read(ydk::ServiceProvider & provider, std::vector<Entity*> & filters);
+
+        std::vector<std::shared_ptr<Entity>> read_config(ydk::ServiceProvider & provider, std::vector<Entity*> & filters);
+
+        // Streaming reads, returning the entries of the list at path one at a
+        // time. path names the nodes from the top level entity of filter down
+        // to the list, e.g. "interfaces/interface". Over NETCONF each entry is
+        // decoded on its own, other providers read the whole data first.
+        std::unique_ptr<EntityStream> read_iter(ydk::ServiceProvider & provider, Entity & filter, const std::string & path);
+
+        std::unique_ptr<EntityStream> read_config_iter(ydk::ServiceProvider & provider, Entity & filter, const std::string & path);
+
     private:
         std::shared_ptr<Entity> read_datanode(Entity & filter, std::shared_ptr<path::DataNode> read_data_node);
+        std::vector<std::shared_ptr<Entity>> read_datanode(std::vector<Entity*> & filters, std::shared_ptr<path::DataNode> read_data_node);
+        std::unique_ptr<EntityStream> read_stream(ydk::ServiceProvider & provider, Entity & filter, const std::string & path, bool config);
+};
+
+class EntityStream
+{
+    public:
+        // Streams the entries decoded from data_nodes
+        EntityStream(std::shared_ptr<Entity> top_entity, const std::vector<std::string> & segments,
+                     std::unique_ptr<path::DataNodeStream> data_nodes);
+        // Iterates over the entries of a top level entity read as a whole
+        EntityStream(std::shared_ptr<Entity> top_entity, const std::vector<std::string> & segments);
+        ~EntityStream();
+
+        // Returns the next entry, or nullptr once all entries were returned.
+        // The ancestors of an entry are owned by its top level entity, which
+        // the stream keeps only until the following call.
+        std::shared_ptr<Entity> next();
+
+    private:
+        std::shared_ptr<Entity> prototype;
+        std::shared_ptr<Entity> current;
+        std::vector<std::string> segments;
+        std::unique_ptr<path::DataNodeStream> data_nodes;
+        std::deque<std::shared_ptr<Entity>> entries;
 };
 
 }
@@ -82,6 +82,42 @@ std::map<std::pair<std::string, std::string>, std::string> Entity::get_namespace
     return {};
 }
 
+std::vector<EntityTreeNode> Entity::get_entity_tree() const
+{
+    return {};
+}
+
+bool get_list_entry_key(const std::string & segment_path, std::string & key, bool & complete)
+{
+    bool found = false;
+    key.clear();
+    complete = true;
+
+    // predicates are [name='value'] or [name="value"], values are not escaped
+    size_t pos = segment_path.find('[');
+    while(pos != std::string::npos && pos < segment_path.size() && segment_path[pos] == '[')
+    {
+        size_t eq = segment_path.find('=', pos);
+        if(eq == std::string::npos || eq + 1 >= segment_path.size())
+            break;
+        char quote = segment_path[eq + 1];
+        if(quote != '\'' && quote != '"')
+            break;
+        size_t end = segment_path.find(std::string{quote, ']'}, eq + 2);
+        if(end == std::string::npos)
+            break;
+
+        if(found)
+            key += '\0';
+        key.append(segment_path, eq + 2, end - eq - 2);
+        if(end == eq + 2)
+            complete = false;
+        found = true;
+        pos = end + 2;
+    }
+    return found;
+}
+
 bool Entity::operator == (Entity & other) const
 {
     if(!has_data() && !other.has_data())
@@ -179,6 +215,19 @@ EntityPath::~EntityPath()
 {
 }
 
+//////////////////////////////////////////////////////////////////
+/// EntityTreeNode
+//////////////////////////////////////////////////////////////////
+
+EntityTreeNode::EntityTreeNode(size_t parent, EntityPath path, YFilter yfilter)
+    : parent(parent), path(path), yfilter(yfilter)
+{
+}
+
+EntityTreeNode::~EntityTreeNode()
+{
+}
+
 bool EntityPath::operator == (EntityPath & other) const
 {
     return path == other.path && value_paths == other.value_paths;
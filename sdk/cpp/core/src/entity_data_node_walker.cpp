@@ -27,6 +27,7 @@
 
 #include <assert.h>
 #include <iostream>
+#include <set>
 
 #include "entity_data_node_walker.hpp"
 #include "entity_util.hpp"
@@ -46,9 +47,13 @@ static void populate_name_values(path::DataNode & parent_data_node, EntityPath &
 static bool data_node_is_leaf(path::DataNode & data_node);
 static bool data_node_is_list(path::DataNode & data_node);
 static string get_segment_path(const string & path);
+static bool filter_selects_entry(path::DataNode & data_node, Entity & filter);
+static bool is_key(path::DataNode & data_node, const string & name);
 static void add_annotation_to_datanode(const Entity & entity, path::DataNode & data_node);
 static void add_annotation_to_datanode(const std::pair<std::string, LeafData> & name_value, path::DataNode & data_node);
+static void add_annotation_to_datanode(const EntityTreeNode & tree_node, path::DataNode & data_node);
 static path::Annotation get_annotation(YFilter yfilter);
+static path::DataNode& get_data_node_from_entity_tree(std::vector<EntityTreeNode> & tree, path::RootSchemaNode & root_schema);
 
 
 //////////////////////////////////////////////////////////////////////////
@@ -56,6 +61,12 @@ static path::Annotation get_annotation(YFilter yfilter);
 //////////////////////////////////////////////////////////////////////////
 path::DataNode& get_data_node_from_entity(Entity & entity, path::RootSchemaNode & root_schema)
 {
+    std::vector<EntityTreeNode> tree = entity.get_entity_tree();
+    if(!tree.empty())
+    {
+        return get_data_node_from_entity_tree(tree, root_schema);
+    }
+
     EntityPath root_path = entity.get_entity_path(nullptr);
     auto & root_data_node = root_schema.create_datanode(root_path.path);
     if(is_set(entity.yfilter))
@@ -69,6 +80,29 @@ path::DataNode& get_data_node_from_entity(Entity & entity, path::RootSchemaNode
     return root_data_node;
 }
 
+// Same data nodes as walking the entity, in the same order, from the
+// flattened tree of an entity
+static path::DataNode& get_data_node_from_entity_tree(std::vector<EntityTreeNode> & tree, path::RootSchemaNode & root_schema)
+{
+    YLOG_DEBUG("Root entity: {}, tree of {} entities", tree[0].path.path, tree.size());
+    std::vector<path::DataNode*> data_nodes(tree.size());
+    data_nodes[0] = &root_schema.create_datanode(tree[0].path.path);
+    for(size_t index = 0; index < tree.size(); index++)
+    {
+        EntityTreeNode & tree_node = tree[index];
+        if(index > 0)
+        {
+            data_nodes[index] = &data_nodes[tree_node.parent]->create_datanode(tree_node.path.path);
+        }
+        if(is_set(tree_node.yfilter))
+        {
+            add_annotation_to_datanode(tree_node, *data_nodes[index]);
+        }
+        populate_name_values(*data_nodes[index], tree_node.path);
+    }
+    return *data_nodes[0];
+}
+
 static void walk_children(Entity & entity, path::DataNode & data_node)
 {
     std::map<string, shared_ptr<Entity>> children = entity.get_children();
@@ -146,6 +180,17 @@ static void add_annotation_to_datanode(const std::pair<std::string, LeafData> &
     }
 }
 
+static void add_annotation_to_datanode(const EntityTreeNode & tree_node, path::DataNode & data_node)
+{
+    if (tree_node.yfilter != YFilter::read)
+    {
+        data_node.add_annotation(
+                                 get_annotation(tree_node.yfilter)
+                                 );
+        YLOG_DEBUG("Set yfilter '{}' for {}", to_string(tree_node.yfilter), tree_node.path.path);
+    }
+}
+
 static path::Annotation get_annotation(YFilter yfilter)
 {
     if(yfilter == YFilter::not_set)
@@ -193,6 +238,94 @@ void get_entity_from_data_node(path::DataNode * node, std::shared_ptr<Entity> en
     }
 }
 
+void get_entity_from_data_node(path::DataNode * node, Entity & filter, std::shared_ptr<Entity> entity)
+{
+    if (entity == nullptr || node == nullptr)
+        return;
+
+    set<string> leaf_names{};
+    for(auto & name_value : filter.get_entity_path(filter.parent).value_paths)
+    {
+        leaf_names.insert(name_value.first.substr(0, name_value.first.find('[')));
+    }
+    vector<shared_ptr<Entity>> filter_children{};
+    for(auto & child : filter.get_children())
+    {
+        if(child.second->has_data() || child.second->has_operation())
+            filter_children.push_back(child.second);
+    }
+    if(leaf_names.empty() && filter_children.empty())
+    {
+        // a selection node selects all of its data
+        get_entity_from_data_node(node, entity);
+        return;
+    }
+
+    for(auto & child_data_node:node->get_children())
+    {
+        std::string child_name = child_data_node->get_schema_node().get_statement().arg;
+        if(data_node_is_leaf(*child_data_node))
+        {
+            if(leaf_names.count(child_name) > 0 || is_key(*node, child_name))
+            {
+                entity->set_value(child_name, child_data_node->get_value());
+            }
+            continue;
+        }
+
+        std::string segment_path{};
+        if(data_node_is_list(*child_data_node))
+        {
+            segment_path = get_segment_path(child_data_node->get_path());
+        }
+        for(auto & filter_child : filter_children)
+        {
+            if(filter_child->yang_name != child_name
+               || !filter_selects_entry(*child_data_node, *filter_child))
+                continue;
+
+            YLOG_DEBUG("Going into filtered child {} in parent {}", child_name, node->get_path());
+            std::shared_ptr<Entity> child_entity = entity->get_child_by_name(child_name, segment_path);
+            if(child_entity == nullptr)
+            {
+                YLOG_ERROR("Couldn't fetch child entity {} in parent {}!", child_name, node->get_path());
+                continue;
+            }
+            child_entity->parent = entity.get();
+            get_entity_from_data_node(child_data_node.get(), *filter_child, child_entity);
+        }
+    }
+}
+
+// A list entry of the filter selects the entry of the reply with its keys,
+// or every entry if its keys are not set.
+static bool filter_selects_entry(path::DataNode & data_node, Entity & filter)
+{
+    if(!data_node_is_list(data_node) || filter.get_segment_path() == get_segment_path(data_node.get_path()))
+        return true;
+
+    auto value_paths = filter.get_entity_path(filter.parent).value_paths;
+    for(auto & key : data_node.get_schema_node().get_keys())
+    {
+        for(auto & name_value : value_paths)
+        {
+            if(name_value.first == key.arg && name_value.second.is_set)
+                return false;
+        }
+    }
+    return true;
+}
+
+static bool is_key(path::DataNode & data_node, const string & name)
+{
+    for(auto & key : data_node.get_schema_node().get_keys())
+    {
+        if(key.arg == name)
+            return true;
+    }
+    return false;
+}
+
 static bool data_node_is_leaf(path::DataNode & data_node)
 {
     return (data_node.get_schema_node().get_statement().keyword == "leaf"
@@ -40,5 +40,8 @@ path::DataNode& get_data_node_from_entity(Entity & entity, path::RootSchemaNode
 
 void get_entity_from_data_node(path::DataNode * node, std::shared_ptr<Entity> entity);
 
+// Populates entity with the data of node which the subtree filter selects.
+void get_entity_from_data_node(path::DataNode * node, Entity & filter, std::shared_ptr<Entity> entity);
+
 }
 #endif /* _WALKER_HPP_ */
@@ -50,7 +50,7 @@ class Logger
         void loglevel(const char* fmt, const Args&... args) \
         { \
             logging_callback func = get_logging_callback(STRINGIFY(loglevel)); \
-            if(func != nullptr) \
+            if(func != nullptr && is_logging_callback_enabled(STRINGIFY(loglevel))) \
                 { \
                     std::stringstream buffer; \
                     write_fmt_msg<Args...>(internal_logger->name(), \
@@ -69,7 +69,7 @@ class Logger
         void loglevel(const T& msg) \
         { \
             logging_callback func = get_logging_callback(STRINGIFY(loglevel)); \
-            if(func != nullptr) { func(msg); } \
+            if(func != nullptr && is_logging_callback_enabled(STRINGIFY(loglevel))) { func(msg); } \
             if(!lazy_check()) { return; } \
             internal_logger->loglevel<T>(msg); \
         }
@@ -88,6 +88,15 @@ class Logger
         YDKLOGLEVELNOARGS(error)
         YDKLOGLEVELNOARGS(critical)
 
+        // Whether a message of level would be passed to a logging callback
+        // or to the spdlog logger
+        bool is_enabled(const char* level)
+        {
+            if(is_logging_callback_enabled(level))
+                return true;
+            return lazy_check() && internal_logger->should_log(get_logging_level(level));
+        }
+
         #undef YDKLOGLEVELARGS
         #undef YDKLOGLEVELNOARGS
         #undef _STRINGIFY
@@ -118,12 +127,14 @@ class Logger
 
 static Logger logger{};
 
-#define YLOG_TRACE(...) logger.trace(__VA_ARGS__)
-#define YLOG_DEBUG(...) logger.debug(__VA_ARGS__)
-#define YLOG_INFO(...) logger.info(__VA_ARGS__)
-#define YLOG_WARN(...) logger.warn(__VA_ARGS__)
-#define YLOG_ERROR(...) logger.error(__VA_ARGS__)
-#define YLOG_CRITICAL(...) logger.critical(__VA_ARGS__)
+// The arguments are only evaluated if the level is enabled
+#define YLOG(level, ...) do { if(ydk::logger.is_enabled(ydk::level)) { ydk::logger.level(__VA_ARGS__); } } while(0)
+#define YLOG_TRACE(...) YLOG(trace, __VA_ARGS__)
+#define YLOG_DEBUG(...) YLOG(debug, __VA_ARGS__)
+#define YLOG_INFO(...) YLOG(info, __VA_ARGS__)
+#define YLOG_WARN(...) YLOG(warn, __VA_ARGS__)
+#define YLOG_ERROR(...) YLOG(error, __VA_ARGS__)
+#define YLOG_CRITICAL(...) YLOG(critical, __VA_ARGS__)
 
 }
 
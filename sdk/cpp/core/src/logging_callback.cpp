@@ -14,6 +14,8 @@
  limitations under the License.
 ------------------------------------------------------------------*/
 
+#include <atomic>
+
 #include "spdlog/spdlog.h"
 #include "logging_callback.hpp"
 
@@ -25,6 +27,7 @@ static logging_callback ydk_logging_info_function = nullptr;
 static logging_callback ydk_logging_warn_function = nullptr;
 static logging_callback ydk_logging_error_function = nullptr;
 static logging_callback ydk_logging_critical_function = nullptr;
+static std::atomic<int> ydk_logging_callback_level{spdlog::level::level_enum::trace};
 
 void set_logging_callback(const char* level, logging_callback func)
 {
@@ -47,4 +50,25 @@ logging_callback get_logging_callback(const char* level)
     return nullptr;
 }
 
+void set_logging_callback_level(const char* level)
+{
+    ydk_logging_callback_level = get_logging_level(level);
+}
+
+bool is_logging_callback_enabled(const char* level)
+{
+    return get_logging_level(level) >= ydk_logging_callback_level && get_logging_callback(level) != nullptr;
+}
+
+spdlog::level::level_enum get_logging_level(const char* level)
+{
+    if(!strcmp(level, trace)) { return spdlog::level::level_enum::trace; }
+    if(!strcmp(level, debug)) { return spdlog::level::level_enum::debug; }
+    if(!strcmp(level, info)) { return spdlog::level::level_enum::info; }
+    if(!strcmp(level, warn)) { return spdlog::level::level_enum::warn; }
+    if(!strcmp(level, error)) { return spdlog::level::level_enum::err; }
+    if(!strcmp(level, critical)) { return spdlog::level::level_enum::critical; }
+    return spdlog::level::level_enum::off;
+}
+
 }
@@ -28,26 +28,24 @@ typedef void (*logging_callback)(const char *msg);
 void set_logging_callback(const char* level, logging_callback func);
 logging_callback get_logging_callback(const char* level);
 
+// The logging callbacks are only called for messages of level or above,
+// messages below are neither formatted nor passed on. Defaults to trace.
+void set_logging_callback_level(const char* level);
+bool is_logging_callback_enabled(const char* level);
+spdlog::level::level_enum get_logging_level(const char* level);
+
 static const char trace [] = "trace";
 static const char debug [] = "debug";
 static const char info [] = "info";
 static const char warn [] = "warn";
 static const char error[] = "error";
 static const char critical[] = "critical";
+static const char off[] = "off";
 
 template <typename... Args>
 void write_fmt_msg(const std::string& name, const char* level, const char* fmt, std::stringstream& buffer, const Args&... args)
 {
-    spdlog::level::level_enum lvl;
-
-    if (!strcmp(level, trace)) { lvl = spdlog::level::level_enum::trace ; }
-    if (!strcmp(level, debug)) { lvl = spdlog::level::level_enum::debug ; }
-    if (!strcmp(level, info)) { lvl = spdlog::level::level_enum::info ; }
-    if (!strcmp(level, warn)) { lvl = spdlog::level::level_enum::warn ; }
-    if (!strcmp(level, error)) { lvl = spdlog::level::level_enum::err ; }
-    if (!strcmp(level, critical)) { lvl = spdlog::level::level_enum::critical ; }
-
-    spdlog::details::log_msg log_msg(&name, lvl);
+    spdlog::details::log_msg log_msg(&name, get_logging_level(level));
     log_msg.raw.write(fmt, args...);
 
     // need to keep buffer alive until logging callback function finished execution
@@ -21,12 +21,57 @@
 //
 //////////////////////////////////////////////////////////////////
 
+#include <algorithm>
+#include <cstring>
+#include <utility>
+
 #include "netconf_client.hpp"
 
 namespace ydk
 {
 
+namespace
+{
+class StringReplyReader : public NetconfReplyReader
+{
+public:
+    explicit StringReplyReader(std::string reply)
+        : reply{std::move(reply)}, position{0}
+    {
+    }
+
+    size_t read(char* buffer, size_t size)
+    {
+        size = std::min(size, reply.size() - position);
+        memcpy(buffer, reply.data() + position, size);
+        position += size;
+        return size;
+    }
+
+private:
+    std::string reply;
+    size_t position;
+};
+}
+
+NetconfReplyReader::~NetconfReplyReader() {}
+
 NetconfClient::NetconfClient() {}
 NetconfClient::~NetconfClient() {}
 
+std::vector<std::string> NetconfClient::execute_payloads(const std::vector<std::string> & payloads)
+{
+    std::vector<std::string> replies;
+    for(auto & payload : payloads)
+    {
+        replies.push_back(execute_payload(payload));
+    }
+    return replies;
+}
+
+std::unique_ptr<NetconfReplyReader> NetconfClient::stream_payload(const std::string & payload)
+{
+    return std::unique_ptr<NetconfReplyReader>{new StringReplyReader{execute_payload(payload)}};
+}
+
 }
@@ -24,12 +24,24 @@
 #ifndef _YDK_NETCONF_CLIENT_H_
 #define _YDK_NETCONF_CLIENT_H_
 
+#include <memory>
 #include <string>
 #include <vector>
 
 namespace ydk
 {
 
+// Reply to a payload, read as it is received
+class NetconfReplyReader
+{
+public:
+    virtual ~NetconfReplyReader();
+
+    // Copies up to size bytes of the reply to buffer and returns their
+    // number, 0 once the reply ends.
+    virtual size_t read(char* buffer, size_t size) = 0;
+};
+
 class NetconfClient
 {
 public:
@@ -38,6 +50,14 @@ public:
 
     virtual int connect() = 0;
     virtual std::string execute_payload(const std::string & payload) = 0;
+    // Executes payloads in order and returns their replies. Clients which
+    // can keep several rpcs outstanding on a session override it.
+    virtual std::vector<std::string> execute_payloads(const std::vector<std::string> & payloads);
+    // Sends payload and returns a reader of its reply, which must be read
+    // or destroyed before the next payload is sent. Clients which can hand
+    // out a reply while it is received override it, the default reads the
+    // whole reply first.
+    virtual std::unique_ptr<NetconfReplyReader> stream_payload(const std::string & payload);
     virtual std::vector<std::string> get_capabilities() = 0;
     virtual std::string get_hostname_port() = 0;
 };
@@ -66,6 +66,17 @@ NetconfServiceProvider::NetconfServiceProvider(path::Repository & repo,
     YLOG_INFO("Connected to {} on port {} using {}", address, port, protocol);
 }
 
+NetconfServiceProvider::NetconfServiceProvider(const std::shared_ptr<path::RootSchemaNode>& root_schema,
+                                               const string& address,
+                                               const string& username,
+                                               const string& password,
+                                               int port,
+                                               const string& protocol)
+    : session{root_schema, address, username, password, port, protocol}
+{
+    YLOG_INFO("Connected to {} on port {} using {}", address, port, protocol);
+}
+
 NetconfServiceProvider::~NetconfServiceProvider()
 {
     YLOG_INFO("Disconnected from device");
@@ -81,6 +92,11 @@ const path::Session& NetconfServiceProvider::get_session() const
     return session;
 }
 
+std::shared_ptr<path::RootSchemaNode> NetconfServiceProvider::get_root_schema_ptr() const
+{
+    return session.get_root_schema_ptr();
+}
+
 std::vector<std::string> NetconfServiceProvider::get_capabilities() const
 {
     return session.get_capabilities();
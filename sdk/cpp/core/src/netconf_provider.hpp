@@ -42,9 +42,16 @@ public:
                                const std::string& protocol = "ssh",
                                bool on_demand = true,
                                bool common_cache = false);
+        NetconfServiceProvider(const std::shared_ptr<path::RootSchemaNode>& root_schema,
+                               const std::string& address,
+                               const std::string& username,
+                               const std::string& password,
+                               int port = 830,
+                               const std::string& protocol = "ssh");
         ~NetconfServiceProvider();
         EncodingFormat get_encoding() const;
         const path::Session& get_session() const;
+        std::shared_ptr<path::RootSchemaNode> get_root_schema_ptr() const;
         std::vector<std::string> get_capabilities() const;
 
 private:
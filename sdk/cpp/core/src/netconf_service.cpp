@@ -178,7 +178,14 @@ bool NetconfService::discard_changes(NetconfServiceProvider& provider)
 bool NetconfService::edit_config(NetconfServiceProvider& provider, DataStore target,
     Entity& config, std::string default_operation, std::string test_option, std::string error_option)
 {
-    YLOG_INFO("Executing edit-config RPC");
+    std::vector<Entity*> entities{&config};
+    return edit_config(provider, target, entities, default_operation, test_option, error_option);
+}
+
+bool NetconfService::edit_config(NetconfServiceProvider& provider, DataStore target,
+    std::vector<Entity*>& config, std::string default_operation, std::string test_option, std::string error_option)
+{
+    YLOG_INFO("Executing edit-config RPC on {} entities", config.size());
 //  ValidationService validation{}; //TODO
 //  validation.validate(session, config, ValidationService::Option::DATASTORE);
 
@@ -189,7 +196,11 @@ bool NetconfService::edit_config(NetconfServiceProvider& provider, DataStore tar
     create_input_leaf(rpc->get_input_node(), target, "target");
 
     //config
-    std::string entity_string = get_data_payload(config, provider.get_session().get_root_schema());
+    std::string entity_string;
+    for(Entity* entity : config)
+    {
+        entity_string += get_data_payload(*entity, provider.get_session().get_root_schema());
+    }
     rpc->get_input_node().create_datanode("config", entity_string);
 
     if (default_operation.size() > 0)
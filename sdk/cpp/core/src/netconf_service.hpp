@@ -31,6 +31,7 @@
 #include <map>
 #include <memory>
 #include <string>
+#include <vector>
 #include "netconf_provider.hpp"
 #include "types.hpp"
 
@@ -76,6 +77,10 @@ class NetconfService
         bool edit_config(NetconfServiceProvider& provider, DataStore target, Entity& config,
             std::string default_operation = "", std::string test_option = "", std::string error_option = "");
 
+        // Sends the entities in the config of a single edit-config
+        bool edit_config(NetconfServiceProvider& provider, DataStore target, std::vector<Entity*>& config,
+            std::string default_operation = "", std::string test_option = "", std::string error_option = "");
+
         std::shared_ptr<Entity> get_config(NetconfServiceProvider& provider, DataStore source, Entity& filter);
 
         std::shared_ptr<Entity> get(NetconfServiceProvider& provider, Entity& filter);
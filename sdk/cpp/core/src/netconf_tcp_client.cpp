@@ -14,8 +14,12 @@
  limitations under the License.
 ------------------------------------------------------------------*/
 
+#include <algorithm>
+#include <cerrno>
 #include <cstdio>
 #include <map>
+#include <poll.h>
+#include <set>
 #include <string.h>
 #include <sstream>
 #include <string>
@@ -37,19 +41,20 @@ namespace ydk
 {
 static const long TIMEOUT = 6000L;
 static const int EIGHT_K = 8196;
+static const size_t READ_SIZE = 64 * 1024;
+// RFC 6242, chunk-size is at most 4294967295
+static const size_t MAX_CHUNK_SIZE_DIGITS = 10;
 
 static const char EOM_10[] = "]]>]]>";
 static const char EOM_11[] = "\n##\n";
 static const char LF_HASH[] = "\n#";
 static const char LF[] = "\n";
 
-
-static const std::map<const std::string, const std::string> PATTERN_MAP{{"&quot;", "\""},
-                                                                       {"&amp;", "&"},
-                                                                       {"&apos;", "'"},
-                                                                       {"&lt;", "<"},
-                                                                       {"&gt;", ">"},
-                                                                       {"\n##\n", ""}};
+static const std::vector<std::pair<std::string, char>> ENTITIES{{"&quot;", '"'},
+                                                                {"&amp;", '&'},
+                                                                {"&apos;", '\''},
+                                                                {"&lt;", '<'},
+                                                                {"&gt;", '>'}};
 
 static const std::string NETCONF_11("urn:ietf:params:netconf:base:1.1");
 
@@ -62,17 +67,96 @@ static const char *HELLO_11 = "\n<hello xmlns=\"urn:ietf:params:xml:ns:netconf:b
 
 
 static int wait_on_socket(curl_socket_t sockfd, int for_recv, long timeout_ms);
-static bool ends_with_framing(const char* buf, size_t nread, int version);
 static void xml_to_string(xmlDocPtr doc, xmlNodePtr root, std::string &out);
 static xmlDocPtr get_xml_doc(const std::string &payload);
-static std::string trim_chunk(std::string str);
-static std::string trim_reply(std::string str);
-static void replace(std::string& subject, const std::string& search, const std::string& replace);
+static void trim_reply(std::string& str);
+static size_t find_root_tag(const std::string & reply);
+static std::string get_reply_message_id(const std::string & reply);
+
+// Replies of a session by message-id. They are shared with the futures
+// returned by NetconfTCPClient::submit, which drop their reply when they
+// are destroyed without reading it.
+struct NetconfTCPReplies
+{
+    // sent and not received yet
+    std::set<std::string> outstanding;
+    // outstanding, dropped when received
+    std::set<std::string> abandoned;
+    // received before they were waited for
+    std::map<std::string, std::string> read_ahead;
+};
+
+namespace
+{
+// Held by the future of a submitted rpc
+struct NetconfTCPReplyTicket
+{
+    NetconfTCPReplyTicket(const std::shared_ptr<NetconfTCPReplies> & replies, const std::string & message_id)
+        : replies(replies), message_id(message_id)
+    {
+    }
+
+    ~NetconfTCPReplyTicket()
+    {
+        if (replies->outstanding.count(message_id) > 0)
+        {
+            replies->abandoned.insert(message_id);
+        }
+        replies->read_ahead.erase(message_id);
+    }
+
+    std::shared_ptr<NetconfTCPReplies> replies;
+    std::string message_id;
+};
+}
+
+// Hands out a reply read by NetconfTCPClient::stream_payload
+class NetconfTCPReplyReader : public NetconfReplyReader
+{
+public:
+    explicit NetconfTCPReplyReader(NetconfTCPClient & client)
+        : client(client)
+    {
+    }
+
+    ~NetconfTCPReplyReader()
+    {
+        // read the rest of the reply, so the session is left at the start
+        // of the next one
+        try
+        {
+            char buffer[EIGHT_K];
+            while (client.streaming && client.read_reply(buffer, sizeof(buffer)) > 0)
+            {
+            }
+        }
+        catch (const YCPPError & err)
+        {
+            YLOG_ERROR("Failed to read the rest of a streamed reply: {}", err.what());
+            client.connected = false;
+        }
+        client.streaming = false;
+    }
+
+    size_t read(char* buffer, size_t size)
+    {
+        if (!client.streaming)
+        {
+            return 0;
+        }
+        return client.read_reply(buffer, size);
+    }
+
+private:
+    NetconfTCPClient & client;
+};
 
 
 NetconfTCPClient::NetconfTCPClient(const std::string& username, const std::string& password,
                                    const std::string& address, int port)
     : NetconfClient(),
+      read_timeout_ms(-1), write_timeout_ms(TIMEOUT),
+      replies(std::make_shared<NetconfTCPReplies>()),
       username(username), hostname(address), password(password), port(port), msgid(0)
 {
     initialize(address, port);
@@ -145,6 +229,12 @@ std::vector<std::string> NetconfTCPClient::get_capabilities()
     return server_capabilities;
 }
 
+void NetconfTCPClient::set_timeouts(long read_timeout_ms, long write_timeout_ms)
+{
+    this->read_timeout_ms = read_timeout_ms;
+    this->write_timeout_ms = write_timeout_ms;
+}
+
 std::string NetconfTCPClient::get_hostname_port()
 {
     std::ostringstream os;
@@ -157,7 +247,7 @@ int NetconfTCPClient::connect()
 
     char buf[EIGHT_K];
     size_t nread = 0;
-    std::stringstream hello_ss;
+    NetconfFramingReader hello_reader{false};
     CURLcode res;
 
     for(;;)
@@ -176,14 +266,12 @@ int NetconfTCPClient::connect()
         }
         else if(nread)
         {
-            buf[nread] = '\0';
-            hello_ss << buf;
+            hello_reader.append(buf, nread);
 
-            if (ends_with_framing(buf, nread, 11))
+            if (hello_reader.has_message())
             {
                 send_value(HELLO_11, strlen(HELLO_11));
-                auto found = hello_ss.str().find(EOM_10);
-                hello_msg = hello_ss.str().substr(0, found);
+                hello_msg = hello_reader.take_message();
                 YLOG_DEBUG("Received hello message from device:\n{}", hello_msg);
                 break;
             }
@@ -199,66 +287,244 @@ int NetconfTCPClient::connect()
 
 std::string NetconfTCPClient::execute_payload(const std::string & payload)
 {
-    if(!connected)
+    return submit(payload).get();
+}
+
+std::vector<std::string> NetconfTCPClient::execute_payloads(const std::vector<std::string> & payloads)
+{
+    std::vector<std::future<std::string>> futures;
+    std::vector<std::string> replies;
+    for(auto & payload : payloads)
     {
-        auto err_msg = "Could not execute payload. Not connected to " + hostname;
-        throw(YCPPClientError{err_msg});
+        if (futures.size() - replies.size() == MAX_OUTSTANDING_RPCS)
+        {
+            replies.push_back(futures[replies.size()].get());
+        }
+        futures.push_back(submit(payload));
+    }
+    while (replies.size() < futures.size())
+    {
+        replies.push_back(futures[replies.size()].get());
     }
-    send(payload);
-    return recv();
+    return replies;
 }
 
-std::string NetconfTCPClient::recv()
+std::future<std::string> NetconfTCPClient::submit(const std::string & payload)
+{
+    check_ready();
+    auto ticket = std::make_shared<NetconfTCPReplyTicket>(replies, send(payload));
+    return std::async(std::launch::deferred, [this, ticket]() { return wait_reply(ticket->message_id); });
+}
+
+std::unique_ptr<NetconfReplyReader> NetconfTCPClient::stream_payload(const std::string & payload)
+{
+    check_ready();
+    auto message_id = send(payload);
+    // the replies to rpcs sent before come first
+    wait_reply_start(message_id);
+    streaming = true;
+    return std::unique_ptr<NetconfReplyReader>{new NetconfTCPReplyReader{*this}};
+}
+
+// Reads replies until the one to message_id, keeping the others for
+// their own futures.
+std::string NetconfTCPClient::wait_reply(const std::string & message_id)
 {
-    auto reply = trim_reply(trim_chunk(recv_value()));
+    std::string reply;
+    while (!take_reply_to(message_id, reply))
+    {
+        wait_readable();
+    }
     return reply;
 }
 
-std::string NetconfTCPClient::recv_value()
+// Takes the replies received without blocking until the one to
+// message_id, returns false if it is not received yet.
+bool NetconfTCPClient::take_reply_to(const std::string & message_id, std::string & reply)
 {
-    std::stringstream ss;
-    char buf[EIGHT_K];
-    CURLcode res;
-    size_t nread = 0;
-    size_t total_read = 0;
-    bool found = false;
+    auto found = replies->read_ahead.find(message_id);
+    if (found != replies->read_ahead.end())
+    {
+        reply = std::move(found->second);
+        replies->read_ahead.erase(found);
+        return true;
+    }
+    check_ready();
+    while (read_available())
+    {
+        auto received = take_reply();
+        auto reply_id = get_reply_id(received);
+        if (reply_id == message_id)
+        {
+            replies->outstanding.erase(reply_id);
+            reply = std::move(received);
+            return true;
+        }
+        keep_reply(reply_id, std::move(received));
+    }
+    return false;
+}
+
+// Returns the message-id of a reply. A reply without one cannot be
+// matched to its rpc, so the replies of the session cannot be trusted.
+std::string NetconfTCPClient::get_reply_id(const std::string & reply)
+{
+    auto reply_id = get_reply_message_id(reply);
+    if (reply_id.empty())
+    {
+        YLOG_ERROR("Received a reply without message-id from {}, closing the session", hostname);
+        connected = false;
+        throw(YCPPClientError{"Received a reply without message-id"});
+    }
+    return reply_id;
+}
+
+void NetconfTCPClient::keep_reply(const std::string & reply_id, std::string reply)
+{
+    replies->outstanding.erase(reply_id);
+    if (replies->abandoned.erase(reply_id) > 0)
+    {
+        YLOG_DEBUG("Dropping reply to rpc {}, its future was destroyed", reply_id);
+        return;
+    }
+    replies->read_ahead[reply_id] = std::move(reply);
+}
 
+// Reads replies until the start tag of the one to message_id is
+// received, keeping the others for their own futures.
+void NetconfTCPClient::wait_reply_start(const std::string & message_id)
+{
     for(;;)
     {
-        do
+        auto received = reader.peek_payload();
+        auto start = find_root_tag(received);
+        if (reader.has_message() || (start != std::string::npos && received.find('>', start) != std::string::npos))
+        {
+            auto reply_id = get_reply_id(received);
+            if (reply_id == message_id)
+            {
+                replies->outstanding.erase(reply_id);
+                return;
+            }
+            keep_reply(reply_id, recv());
+            continue;
+        }
+        if (!receive())
+        {
+            wait_readable();
+        }
+    }
+}
+
+// Reads the reply found by wait_reply_start as it is received. The
+// reply is handed out as sent by the device, its XML parser replaces
+// the entities.
+size_t NetconfTCPClient::read_reply(char* out, size_t size)
+{
+    while (size > 0)
+    {
+        size_t nread = reader.read_payload(out, size);
+        if (nread > 0)
         {
-            bzero(&buf, sizeof(buf));
-            nread = 0;
-            res = curl_easy_recv(curl, buf, sizeof(buf)-1, &nread);
-            buf[nread] = '\0';
-            ss << buf;
-            total_read += nread;
-            found = ends_with_framing(ss.str().c_str(), total_read, 10);
-        } while(!found
-                && !wait_on_socket(sockfd, 1, TIMEOUT));
-
-        if (nread == 0 && ss.str().size() != 0)
+            return nread;
+        }
+        if (reader.has_message())
         {
+            // the whole payload was read, drop the framing
+            reader.take_message();
+            streaming = false;
             break;
         }
-
-        if (ss.str().size() == 0)
+        if (!receive())
         {
-            // wait on socket
-            unsigned int sleep_time = 1000;
-            usleep(sleep_time);
+            wait_readable();
         }
-        else
+    }
+    return 0;
+}
+
+void NetconfTCPClient::check_ready()
+{
+    if(!connected)
+    {
+        auto err_msg = "Could not execute payload. Not connected to " + hostname;
+        throw(YCPPClientError{err_msg});
+    }
+    if(streaming)
+    {
+        YLOG_ERROR("Could not execute payload while a reply is streamed from {}", hostname);
+        throw(YCPPClientError{"Could not execute payload while a reply is streamed"});
+    }
+}
+
+std::string NetconfTCPClient::recv()
+{
+    while(!read_available())
+    {
+        wait_readable();
+    }
+    return take_reply();
+}
+
+void NetconfTCPClient::wait_readable()
+{
+    int res = wait_on_socket(sockfd, 1, read_timeout_ms);
+    if (res == 0)
+    {
+        YLOG_ERROR("TCP client timed out waiting {} ms for a reply", read_timeout_ms);
+        throw(YCPPClientError{"Timed out waiting for a reply"});
+    }
+    else if (res < 0)
+    {
+        YLOG_ERROR("TCP client error: {}", strerror(errno));
+        throw(YCPPClientError{strerror(errno)});
+    }
+}
+
+// Reads once from the socket without blocking, returns false if there
+// was nothing to read.
+bool NetconfTCPClient::receive()
+{
+    size_t nread = 0;
+    CURLcode res = curl_easy_recv(curl, reader.prepare(READ_SIZE), READ_SIZE, &nread);
+    if (res == CURLE_AGAIN)
+    {
+        return false;
+    }
+    check_ok(res, "TCP client error: {}");
+    if (nread == 0)
+    {
+        YLOG_ERROR("Connection to {} closed by the device", hostname);
+        throw(YCPPClientError{"Connection closed by the device"});
+    }
+    YLOG_DEBUG("libcurl read {} bytes.", (curl_off_t)nread);
+    reader.commit(nread);
+    return true;
+}
+
+// Reads what is available on the socket without blocking, returns true
+// once the reader holds a complete reply.
+bool NetconfTCPClient::read_available()
+{
+    while(!reader.has_message())
+    {
+        if (!receive())
         {
-            check_ok(res, "TCP client error: {}");
+            return false;
         }
-        YLOG_DEBUG("libcurl read {} bytes.\n", (curl_off_t)nread);
     }
-    YLOG_DEBUG("TCP client received {} bytes:\n{}", ss.str().length(), ss.str());
-    return ss.str();
+    return true;
 }
 
-void NetconfTCPClient::send(const std::string &payload)
+std::string NetconfTCPClient::take_reply()
+{
+    auto reply = reader.take_message();
+    YLOG_DEBUG("TCP client received {} bytes:\n{}", reply.size(), reply);
+    trim_reply(reply);
+    return reply;
+}
+
+std::string NetconfTCPClient::send(const std::string &payload)
 {
     // add message id to payload
     auto new_payload = add_message_id(payload);
@@ -266,7 +532,11 @@ void NetconfTCPClient::send(const std::string &payload)
     // add chunk size
     std::ostringstream ss;
     ss << LF_HASH << new_payload.size() << LF << new_payload << EOM_11;
-    send_value(ss.str().c_str(), ss.str().size());
+    auto framed = ss.str();
+    send_value(framed.c_str(), framed.size());
+    auto message_id = std::to_string(msgid);
+    replies->outstanding.insert(message_id);
+    return message_id;
 }
 
 void NetconfTCPClient::send_value(const char* value, size_t value_len)
@@ -287,7 +557,7 @@ void NetconfTCPClient::send_value(const char* value, size_t value_len)
         check_ok(res, "TCP client error: {}");
         YLOG_DEBUG("libcurl sent {} bytes.\n", (curl_off_t)nsent);
 
-    } while (nsent_total < value_len &&wait_on_socket(sockfd, 0, TIMEOUT));
+    } while (nsent_total < value_len && wait_on_socket(sockfd, 0, write_timeout_ms) > 0);
     YLOG_DEBUG("TCP client sent total {} bytes:\n{}", nsent_total, value);
 }
 
@@ -319,56 +589,283 @@ void NetconfTCPClient::check_ok(CURLcode res, const char* fmt)
 
 void NetconfTCPClient::check_timeout(CURLcode res, int for_recv, const char* fmt)
 {
-    if (res == CURLE_AGAIN && !wait_on_socket(sockfd, for_recv, TIMEOUT))
+    // used for the handshake and sends, which always time out
+    long timeout_ms = for_recv ? read_timeout_ms : write_timeout_ms;
+    if (timeout_ms < 0)
+    {
+        timeout_ms = TIMEOUT;
+    }
+    if (res == CURLE_AGAIN && wait_on_socket(sockfd, for_recv, timeout_ms) <= 0)
     {
         YLOG_ERROR(fmt, curl_easy_strerror(res));
         throw(YCPPClientError(curl_easy_strerror(res)));
     }
 }
 
-// from libcurl examples
-/* Auxiliary function that waits on the socket. */
-static int wait_on_socket(curl_socket_t sockfd, int for_recv, long timeout_ms)
+NetconfTCPMultiplexer::NetconfTCPMultiplexer(long timeout_ms)
+    : timeout_ms(timeout_ms)
 {
-    struct timeval tv;
-    fd_set infd, outfd, errfd;
-    int res;
+}
+
+std::vector<std::string> NetconfTCPMultiplexer::execute_payloads(const std::vector<NetconfTCPClient*> & clients,
+                                                                 const std::vector<std::string> & payloads)
+{
+    if (clients.size() != payloads.size())
+    {
+        YLOG_ERROR("Got {} clients and {} payloads", clients.size(), payloads.size());
+        throw(YCPPInvalidArgumentError{"Number of clients and payloads differ"});
+    }
+    for(auto client : clients)
+    {
+        client->check_ready();
+    }
+
+    std::vector<struct pollfd> fds(clients.size());
+    std::vector<size_t> pending(clients.size());
+    std::vector<std::string> message_ids(clients.size());
+    for(size_t i = 0; i < clients.size(); i++)
+    {
+        message_ids[i] = clients[i]->send(payloads[i]);
+        fds[i].fd = clients[i]->sockfd;
+        fds[i].events = POLLIN;
+        // a reply may already be buffered by the client, look before polling
+        fds[i].revents = POLLIN;
+        pending[i] = i;
+    }
+
+    std::vector<std::string> replies(clients.size());
+    for(;;)
+    {
+        // keep the sessions still waiting on a reply at the front
+        size_t waiting = 0;
+        for(size_t j = 0; j < fds.size(); j++)
+        {
+            auto i = pending[j];
+            if (fds[j].revents != 0 && clients[i]->take_reply_to(message_ids[i], replies[i]))
+            {
+                continue;
+            }
+            fds[waiting] = fds[j];
+            pending[waiting] = i;
+            waiting++;
+        }
+        fds.resize(waiting);
+        pending.resize(waiting);
+        if (fds.empty())
+        {
+            break;
+        }
+
+        int res = poll(fds.data(), fds.size(), timeout_ms < 0 ? -1 : (int)timeout_ms);
+        if (res == 0)
+        {
+            YLOG_ERROR("TCP multiplexer timed out waiting {} ms for {} replies", timeout_ms, fds.size());
+            throw(YCPPClientError{"Timed out waiting for a reply"});
+        }
+        else if (res < 0)
+        {
+            if (errno == EINTR)
+            {
+                for(auto & fd : fds)
+                {
+                    fd.revents = 0;
+                }
+                continue;
+            }
+            YLOG_ERROR("TCP multiplexer error: {}", strerror(errno));
+            throw(YCPPClientError{strerror(errno)});
+        }
+    }
+    return replies;
+}
+
+NetconfFramingReader::NetconfFramingReader(bool chunked)
+    : chunked(chunked), end(0), parsed(0), payload_end(0), payload_read(0), chunk_left(0), message_end(0)
+{
+}
+
+char* NetconfFramingReader::prepare(size_t size)
+{
+    if (buffer.size() - end < size)
+    {
+        // grow geometrically, so receiving n bytes costs O(n)
+        buffer.resize(std::max(buffer.size() * 2, end + size));
+    }
+    return &buffer[end];
+}
 
-    tv.tv_sec = timeout_ms / 1000;
-    tv.tv_usec= (timeout_ms % 1000) * 1000;
+void NetconfFramingReader::commit(size_t size)
+{
+    end += size;
+    parse();
+}
 
-    FD_ZERO(&infd);
-    FD_ZERO(&outfd);
-    FD_ZERO(&errfd);
+void NetconfFramingReader::append(const char* data, size_t size)
+{
+    memcpy(prepare(size), data, size);
+    commit(size);
+}
 
-    FD_SET(sockfd, &errfd); /* always check for error */
+bool NetconfFramingReader::has_message() const
+{
+    return message_end != 0;
+}
 
-    if(for_recv) {
-        FD_SET(sockfd, &infd);
+std::string NetconfFramingReader::take_message()
+{
+    if (!has_message())
+    {
+        return {};
     }
-    else {
-        FD_SET(sockfd, &outfd);
+    std::string message = buffer.substr(payload_read, payload_end - payload_read);
+
+    // bytes received after the message belong to the next ones, move them
+    // to the front and keep the room of the buffer for those
+    size_t rest = end - message_end;
+    memmove(&buffer[0], &buffer[message_end], rest);
+    end = parsed = payload_end = payload_read = chunk_left = message_end = 0;
+    if (rest != 0)
+    {
+        commit(rest);
     }
-    /* select() returns the number of signalled sockets or -1 */
-    res = select((int)sockfd + 1, &infd, &outfd, &errfd, &tv);
-    return res;
+    return message;
 }
 
-static bool ends_with_framing(const char* buf, size_t nread, int version)
+size_t NetconfFramingReader::read_payload(char* out, size_t size)
 {
-    const char* last_several = NULL;
-    const char* framing = NULL;
-    if (version == 10)
+    size = std::min(size, payload_end - payload_read);
+    if (size == 0)
     {
-        last_several = &buf[nread-4];
-        framing = EOM_11;
+        return 0;
     }
-    else if(version == 11)
+    memcpy(out, &buffer[payload_read], size);
+    payload_read += size;
+    if (payload_read == payload_end && message_end == 0)
     {
-        last_several = &buf[nread-6];
-        framing = EOM_10;
+        // all of the payload received so far is read, move the bytes
+        // still to parse to the front
+        memmove(&buffer[0], &buffer[parsed], end - parsed);
+        end -= parsed;
+        parsed = payload_end = payload_read = 0;
     }
-    return strcmp(last_several, framing) == 0;
+    return size;
+}
+
+std::string NetconfFramingReader::peek_payload() const
+{
+    return buffer.substr(payload_read, payload_end - payload_read);
+}
+
+void NetconfFramingReader::parse()
+{
+    if (!chunked)
+    {
+        // the delimiter may straddle the previous end
+        size_t from = parsed < sizeof(EOM_10) - 1 ? 0 : parsed - (sizeof(EOM_10) - 1);
+        auto found = std::search(buffer.begin() + from, buffer.begin() + end, EOM_10, EOM_10 + sizeof(EOM_10) - 1);
+        parsed = end;
+        if (found != buffer.begin() + end)
+        {
+            payload_end = found - buffer.begin();
+            message_end = payload_end + sizeof(EOM_10) - 1;
+        }
+        return;
+    }
+
+    while (message_end == 0 && parsed < end)
+    {
+        if (chunk_left == 0)
+        {
+            if (!parse_chunk_header())
+            {
+                return;
+            }
+            continue;
+        }
+        size_t size = std::min(chunk_left, end - parsed);
+        if (payload_end != parsed)
+        {
+            memmove(&buffer[payload_end], &buffer[parsed], size);
+        }
+        payload_end += size;
+        parsed += size;
+        chunk_left -= size;
+    }
+}
+
+// Parses "\n#<chunk-size>\n" or the end of chunks "\n##\n" at parsed,
+// returns false if it is not received in full yet.
+bool NetconfFramingReader::parse_chunk_header()
+{
+    const char* header = &buffer[parsed];
+    size_t available = end - parsed;
+    if ((available > 0 && header[0] != '\n') || (available > 1 && header[1] != '#'))
+    {
+        YLOG_ERROR("Invalid NETCONF chunk header");
+        throw(YCPPClientError{"Invalid NETCONF chunk header"});
+    }
+    if (available < 3)
+    {
+        return false;
+    }
+    if (header[2] == '#')
+    {
+        if (available < 4)
+        {
+            return false;
+        }
+        if (header[3] != '\n')
+        {
+            YLOG_ERROR("Invalid NETCONF end of chunks");
+            throw(YCPPClientError{"Invalid NETCONF end of chunks"});
+        }
+        message_end = parsed + 4;
+        parsed = message_end;
+        return true;
+    }
+
+    size_t size = 0;
+    size_t i = 2;
+    for (; i < available && header[i] != '\n'; i++)
+    {
+        if (header[i] < '0' || header[i] > '9' || i - 2 >= MAX_CHUNK_SIZE_DIGITS)
+        {
+            YLOG_ERROR("Invalid NETCONF chunk size");
+            throw(YCPPClientError{"Invalid NETCONF chunk size"});
+        }
+        size = size * 10 + (header[i] - '0');
+    }
+    if (i == available)
+    {
+        return false;
+    }
+    if (i == 2 || size == 0)
+    {
+        YLOG_ERROR("Invalid NETCONF chunk size");
+        throw(YCPPClientError{"Invalid NETCONF chunk size"});
+    }
+    parsed += i + 1;
+    chunk_left = size;
+    return true;
+}
+
+/* Auxiliary function that waits on the socket. poll() is used instead of
+   select(), which cannot watch descriptors above FD_SETSIZE. Returns the
+   number of signalled sockets, 0 on timeout or -1 on error. A negative
+   timeout waits indefinitely. */
+static int wait_on_socket(curl_socket_t sockfd, int for_recv, long timeout_ms)
+{
+    struct pollfd fd;
+    fd.fd = sockfd;
+    fd.events = for_recv ? POLLIN : POLLOUT;
+    fd.revents = 0;
+
+    int res;
+    do
+    {
+        res = poll(&fd, 1, timeout_ms < 0 ? -1 : (int)timeout_ms);
+    } while (res < 0 && errno == EINTR);
+    return res;
 }
 
 static xmlDocPtr get_xml_doc(const std::string &payload)
@@ -394,50 +891,80 @@ static void xml_to_string(xmlDocPtr doc, xmlNodePtr root, std::string &out)
     }
 }
 
-static std::string trim_chunk(std::string str)
+// Returns the position of the start tag of the root element of reply
+static size_t find_root_tag(const std::string & reply)
 {
-    std::string ret;
-    size_t start = 0;
-    size_t end = 0;
-    while((start = str.find('#', start)) && start != std::string::npos)
+    size_t start = reply.find('<');
+    // skip the XML declaration and comments
+    while (start != std::string::npos && start + 1 < reply.size()
+           && (reply[start + 1] == '?' || reply[start + 1] == '!'))
     {
-        std::size_t num_end = str.find_first_not_of("0123456789", start+1);
-        if (num_end == std::string::npos || str[num_end] != '\n')
-        {
-            start = num_end+1;
-            if (num_end != std::string::npos && str[num_end] == '#')
-                start += 1;
-            end = start;
-            continue;
-        }
-        auto len = std::stoi(str.substr(start+1, num_end-start-1));
-        if(len)
-        {
-            ret.append(str.substr(num_end+1, len));
-        }
-        end = num_end+1+len;
-        start = end;
+        start = reply.find('<', start + 1);
     }
-    return ret;
+    return start;
 }
 
-static std::string trim_reply(std::string str)
+// Returns the message-id attribute of the root element of reply
+static std::string get_reply_message_id(const std::string & reply)
 {
-    for (auto val: PATTERN_MAP)
+    size_t start = find_root_tag(reply);
+    if (start == std::string::npos)
+    {
+        return {};
+    }
+    size_t end = reply.find('>', start);
+    size_t value = reply.find("message-id=", start);
+    if (value == std::string::npos || value > end || value + 12 >= reply.size())
     {
-        replace(str, val.first, val.second);
+        return {};
     }
-    return str;
+    value += 11;
+    size_t value_end = reply.find(reply[value], value + 1);
+    if (value_end == std::string::npos)
+    {
+        return {};
+    }
+    return reply.substr(value + 1, value_end - value - 1);
 }
 
-static void replace(std::string& subject, const std::string& search, const std::string& replace)
+// Replaces the predefined XML entities in one pass
+static void trim_reply(std::string& str)
 {
-    size_t pos = 0;
-    while ((pos = subject.find(search, pos)) != std::string::npos)
+    size_t out = 0;
+    size_t in = 0;
+    while (in < str.size())
     {
-         subject.replace(pos, search.size(), replace);
-         pos += replace.size();
+        size_t amp = str.find('&', in);
+        if (amp == std::string::npos)
+        {
+            amp = str.size();
+        }
+        if (out != in)
+        {
+            std::copy(str.begin() + in, str.begin() + amp, str.begin() + out);
+        }
+        out += amp - in;
+        in = amp;
+        if (in == str.size())
+        {
+            break;
+        }
+        char replacement = '&';
+        size_t length = 1;
+        for (auto & entity : ENTITIES)
+        {
+            if (str.compare(in, entity.first.size(), entity.first) == 0)
+            {
+                replacement = entity.second;
+                length = entity.first.size();
+                break;
+            }
+        }
+        str[out++] = replacement;
+        in += length;
     }
+    str.resize(out);
 }
 
+
 }
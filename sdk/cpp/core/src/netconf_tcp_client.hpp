@@ -17,7 +17,8 @@
 #ifndef _YDK_NETCONF_TCP_CLIENT_H_
 #define _YDK_NETCONF_TCP_CLIENT_H_
 
-#include <map>
+#include <future>
+#include <memory>
 #include <string>
 #include <vector>
 #include <curl/curl.h>
@@ -28,6 +29,55 @@
 namespace ydk
 {
 
+class NetconfTCPMultiplexer;
+class NetconfTCPReplyReader;
+struct NetconfTCPReplies;
+
+// Incremental reader of NETCONF messages framed by the 1.0 end of message
+// delimiter or by RFC 6242 chunks. Data is received into one growable
+// buffer and parsed as it arrives, chunk headers are cut out in place, so
+// every byte is looked at once and the buffer is reused from message to
+// message.
+class NetconfFramingReader
+{
+
+public:
+    NetconfFramingReader(bool chunked = true);
+
+    // Returns room for size bytes at the end of the buffer, commit tells
+    // how many of them were received.
+    char* prepare(size_t size);
+    void commit(size_t size);
+    void append(const char* data, size_t size);
+
+    bool has_message() const;
+    // Returns the payload of the first complete message, without framing.
+    // The bytes already handed out by read_payload are not included.
+    std::string take_message();
+
+    // Copies up to size bytes of the payload of the first message, which
+    // may not be complete yet, to out and returns their number. The room
+    // they took in the buffer is reused, so a message read as it arrives
+    // is never held whole.
+    size_t read_payload(char* out, size_t size);
+    // Returns the payload of the first message received and not read yet.
+    std::string peek_payload() const;
+
+private:
+    void parse();
+    bool parse_chunk_header();
+
+private:
+    bool chunked;
+    std::string buffer;
+    size_t end;          // received bytes are buffer[0, end)
+    size_t parsed;       // raw bytes before parsed are decoded
+    size_t payload_end;  // payload of the message is buffer[0, payload_end)
+    size_t payload_read; // buffer[0, payload_read) was handed out by read_payload
+    size_t chunk_left;
+    size_t message_end;  // end of the raw message once it is complete, else 0
+};
+
 class NetconfTCPClient : public NetconfClient
 {
 
@@ -38,10 +88,33 @@ public:
 
     int connect();
     virtual std::string execute_payload(const std::string & payload);
+    // Keeps up to MAX_OUTSTANDING_RPCS rpcs outstanding on the session.
+    virtual std::vector<std::string> execute_payloads(const std::vector<std::string> & payloads);
     virtual std::vector<std::string> get_capabilities();
     virtual std::string get_hostname_port();
 
+    // Timeouts in milliseconds for waiting on the socket. A negative read
+    // timeout waits for replies indefinitely, the default.
+    void set_timeouts(long read_timeout_ms, long write_timeout_ms);
+
+    // Sends payload without waiting for the reply, which get() on the
+    // returned future reads. Several rpcs can be outstanding on the
+    // session, replies are matched to them by message-id. The reply to a
+    // future destroyed before get() returns is dropped, and a reply
+    // without message-id closes the session.
+    std::future<std::string> submit(const std::string & payload);
+
+    // Sends payload and returns a reader handing out its reply as it is
+    // received. Other payloads cannot be sent until the reader is
+    // destroyed, which reads the rest of the reply.
+    virtual std::unique_ptr<NetconfReplyReader> stream_payload(const std::string & payload);
+
+    static const size_t MAX_OUTSTANDING_RPCS = 32;
+
 private:
+    friend class NetconfTCPMultiplexer;
+    friend class NetconfTCPReplyReader;
+
     void initialize(const std::string& address, int port);
     void initialize_curl(const std::string& address, int port);
     void init_capabilities();
@@ -51,14 +124,28 @@ private:
 
     std::string add_message_id(const std::string &payload);
 
-    void send(const std::string & payload);
+    void check_ready();
+    std::string send(const std::string & payload);
     void send_value(const char* value, size_t value_len);
     std::string recv();
-    std::string recv_value();
+    bool take_reply_to(const std::string & message_id, std::string & reply);
+    std::string get_reply_id(const std::string & reply);
+    void keep_reply(const std::string & reply_id, std::string reply);
+    bool receive();
+    void wait_readable();
+    bool read_available();
+    std::string take_reply();
+    std::string wait_reply(const std::string & message_id);
+    void wait_reply_start(const std::string & message_id);
+    size_t read_reply(char* out, size_t size);
 
 private:
     CURL *curl;
     curl_socket_t sockfd;
+    long read_timeout_ms;
+    long write_timeout_ms;
+    NetconfFramingReader reader;
+    std::shared_ptr<NetconfTCPReplies> replies;
     std::vector<std::string> server_capabilities;
 
     std::string hello_msg;
@@ -69,6 +156,26 @@ private:
 
     long long unsigned int msgid;
     bool connected = false;
+    // a reply is handed out by a NetconfTCPReplyReader
+    bool streaming = false;
+};
+
+// Waits on the replies of many NetconfTCPClient sessions from one thread,
+// with poll() so the number of sessions is not limited by FD_SETSIZE.
+class NetconfTCPMultiplexer
+{
+
+public:
+    // A negative timeout waits for replies indefinitely.
+    NetconfTCPMultiplexer(long timeout_ms = -1);
+
+    // Sends payloads[i] on clients[i], then returns the replies in the same
+    // order once all of them are received.
+    std::vector<std::string> execute_payloads(const std::vector<NetconfTCPClient*> & clients,
+                                              const std::vector<std::string> & payloads);
+
+private:
+    long timeout_ms;
 };
 
 }
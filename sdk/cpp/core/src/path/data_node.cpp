@@ -96,6 +96,7 @@ ydk::path::DataNodeImpl::populate_new_schemas_from_path(const std::string& path)
 ydk::path::DataNode&
 ydk::path::DataNodeImpl::create_datanode(const std::string& path, const std::string& value)
 {
+    std::lock_guard<std::recursive_mutex> guard{get_schema_mutex(get_schema_node())};
     populate_new_schemas_from_path(path);
     populate_new_schemas_from_path(value);
     return create_helper(path, value);
@@ -279,6 +280,7 @@ ydk::path::DataNodeImpl::get_value() const
 std::vector<std::shared_ptr<ydk::path::DataNode>>
 ydk::path::DataNodeImpl::find(const std::string& path)
 {
+    std::lock_guard<std::recursive_mutex> guard{get_schema_mutex(get_schema_node())};
     populate_new_schemas_from_path(path);
 
     std::vector<std::shared_ptr<DataNode>> results;
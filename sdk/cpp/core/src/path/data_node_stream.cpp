@@ -0,0 +1,516 @@
+/// YANG Development Kit
+// Copyright 2017 Cisco Systems. All rights reserved
+//
+////////////////////////////////////////////////////////////////
+// Licensed to the Apache Software Foundation (ASF) under one
+// or more contributor license agreements.  See the NOTICE file
+// distributed with this work for additional information
+// regarding copyright ownership.  The ASF licenses this file
+// to you under the Apache License, Version 2.0 (the
+// "License"); you may not use this file except in compliance
+// with the License.  You may obtain a copy of the License at
+//
+//   http://www.apache.org/licenses/LICENSE-2.0
+//
+//  Unless required by applicable law or agreed to in writing,
+// software distributed under the License is distributed on an
+// "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+// KIND, either express or implied.  See the License for the
+// specific language governing permissions and limitations
+// under the License.
+//
+//////////////////////////////////////////////////////////////////
+
+#include <exception>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <libxml/xmlreader.h>
+
+#include "../errors.hpp"
+#include "../logger.hpp"
+#include "path_private.hpp"
+
+
+namespace ydk
+{
+
+namespace path
+{
+
+typedef std::vector<std::pair<std::string, std::string>> NamespaceDeclarations;
+
+namespace
+{
+std::string escape(const std::string& text)
+{
+    xmlChar* escaped = xmlEncodeSpecialChars(nullptr, reinterpret_cast<const xmlChar*>(text.c_str()));
+    std::string result{reinterpret_cast<const char*>(escaped)};
+    xmlFree(escaped);
+    return result;
+}
+
+std::string start_tag(const std::string& name, const NamespaceDeclarations& namespaces, bool empty = false)
+{
+    std::string tag = "<" + name;
+    for(auto const & ns : namespaces)
+    {
+        tag += " " + ns.first + "=\"" + escape(ns.second) + "\"";
+    }
+    return tag + (empty ? "/>" : ">");
+}
+
+// Declarations of outer elements, unless redeclared by the inner ones
+void merge(NamespaceDeclarations& inner, const NamespaceDeclarations& outer)
+{
+    for(auto const & ns : outer)
+    {
+        bool declared = false;
+        for(auto const & d : inner)
+        {
+            if(d.first == ns.first)
+            {
+                declared = true;
+                break;
+            }
+        }
+        if(!declared)
+            inner.push_back(ns);
+    }
+}
+
+std::string get_local_name(const std::string& name)
+{
+    auto colon = name.find(':');
+    return colon == std::string::npos ? name : name.substr(colon + 1);
+}
+}
+
+//////////////////////////////////////////////////////////////////////////
+// XmlEntryReader
+//////////////////////////////////////////////////////////////////////////
+// Scans a rpc-reply with a libxml2 text reader, which keeps only the
+// current node in memory, and cuts out the entries of the list at path.
+// The reply is held in memory, or pulled from read as it is parsed.
+class XmlEntryReader
+{
+public:
+    XmlEntryReader(std::string reply, const std::string& path);
+    XmlEntryReader(std::function<size_t(char*, size_t)> read, const std::string& path);
+    ~XmlEntryReader();
+
+    // Sets entry to a self contained document holding the next entry,
+    // returns false once the data element ends.
+    bool next_entry(std::string& entry);
+
+private:
+    // An open element on the path down to the list
+    struct Frame
+    {
+        std::string name;
+        NamespaceDeclarations namespaces;
+        // leaf children seen before the next element on the path, which
+        // hold the keys when the element is a list entry
+        std::string leafs;
+        bool descended;
+    };
+
+    static int read_input(void* context, char* buffer, int size);
+    void parse_path(const std::string& path);
+    void check_read_error();
+    bool advance();
+    bool skip();
+    std::string read_outer_xml();
+    int node_type() const;
+    int depth() const;
+    std::string local_name() const;
+    NamespaceDeclarations namespace_declarations();
+    void find_data();
+    void read_leaf(Frame& frame);
+    std::string wrap(std::string entry);
+    void throw_reply_error(const std::string& error) const;
+
+    std::string reply;
+    std::function<size_t(char*, size_t)> read;
+    // thrown by read, which cannot unwind through libxml2
+    std::exception_ptr read_error;
+    std::vector<std::string> segments;
+    xmlTextReaderPtr reader;
+    // the current node was reached by skip() and is not processed yet
+    bool pending;
+    bool started;
+    bool finished;
+    int data_depth;
+    NamespaceDeclarations inherited;
+    std::vector<Frame> frames;
+};
+
+XmlEntryReader::XmlEntryReader(std::string reply, const std::string& path)
+    : reply{std::move(reply)}, reader{nullptr}, pending{false}, started{false}, finished{false}, data_depth{0}
+{
+    parse_path(path);
+    reader = xmlReaderForMemory(this->reply.c_str(), static_cast<int>(this->reply.size()), nullptr, nullptr, XML_PARSE_NONET);
+    if(reader == nullptr)
+    {
+        YLOG_ERROR("Failed to create XML reader for reply");
+        throw(YCPPError{"Failed to create XML reader for reply"});
+    }
+}
+
+XmlEntryReader::XmlEntryReader(std::function<size_t(char*, size_t)> read, const std::string& path)
+    : read{std::move(read)}, reader{nullptr}, pending{false}, started{false}, finished{false}, data_depth{0}
+{
+    parse_path(path);
+    reader = xmlReaderForIO(&XmlEntryReader::read_input, nullptr, this, nullptr, nullptr, XML_PARSE_NONET);
+    if(reader == nullptr)
+    {
+        check_read_error();
+        YLOG_ERROR("Failed to create XML reader for reply");
+        throw(YCPPError{"Failed to create XML reader for reply"});
+    }
+}
+
+void XmlEntryReader::parse_path(const std::string& path)
+{
+    std::string::size_type start = 0;
+    while(start <= path.size())
+    {
+        auto end = path.find('/', start);
+        if(end == std::string::npos)
+            end = path.size();
+        if(end > start)
+            segments.push_back(get_local_name(path.substr(start, end - start)));
+        start = end + 1;
+    }
+    if(segments.empty())
+    {
+        YLOG_ERROR("Path of the list to stream is empty");
+        throw(YCPPInvalidArgumentError{"Path of the list to stream is empty"});
+    }
+}
+
+XmlEntryReader::~XmlEntryReader()
+{
+    if(reader != nullptr)
+        xmlFreeTextReader(reader);
+}
+
+int XmlEntryReader::read_input(void* context, char* buffer, int size)
+{
+    auto entry_reader = static_cast<XmlEntryReader*>(context);
+    try
+    {
+        return static_cast<int>(entry_reader->read(buffer, static_cast<size_t>(size)));
+    }
+    catch(...)
+    {
+        entry_reader->read_error = std::current_exception();
+        return -1;
+    }
+}
+
+void XmlEntryReader::check_read_error()
+{
+    if(read_error)
+    {
+        auto error = read_error;
+        read_error = nullptr;
+        std::rethrow_exception(error);
+    }
+}
+
+bool XmlEntryReader::advance()
+{
+    if(pending)
+    {
+        pending = false;
+        return true;
+    }
+    int ret = xmlTextReaderRead(reader);
+    if(ret < 0)
+    {
+        check_read_error();
+        YLOG_ERROR("Failed to parse reply sent by device");
+        throw(YCPPServiceProviderError{"Failed to parse reply sent by device"});
+    }
+    return ret == 1;
+}
+
+// Skips the subtree of the current element, the reader is left on the
+// node after it
+bool XmlEntryReader::skip()
+{
+    int ret = xmlTextReaderNext(reader);
+    if(ret < 0)
+    {
+        check_read_error();
+        YLOG_ERROR("Failed to parse reply sent by device");
+        throw(YCPPServiceProviderError{"Failed to parse reply sent by device"});
+    }
+    pending = (ret == 1);
+    return pending;
+}
+
+int XmlEntryReader::node_type() const
+{
+    return xmlTextReaderNodeType(reader);
+}
+
+int XmlEntryReader::depth() const
+{
+    return xmlTextReaderDepth(reader);
+}
+
+std::string XmlEntryReader::local_name() const
+{
+    return reinterpret_cast<const char*>(xmlTextReaderConstLocalName(reader));
+}
+
+NamespaceDeclarations XmlEntryReader::namespace_declarations()
+{
+    NamespaceDeclarations namespaces;
+    while(xmlTextReaderMoveToNextAttribute(reader) == 1)
+    {
+        if(xmlTextReaderIsNamespaceDecl(reader) == 1)
+        {
+            const xmlChar* value = xmlTextReaderConstValue(reader);
+            namespaces.emplace_back(reinterpret_cast<const char*>(xmlTextReaderConstName(reader)),
+                                    value ? reinterpret_cast<const char*>(value) : "");
+        }
+    }
+    xmlTextReaderMoveToElement(reader);
+    return namespaces;
+}
+
+// Reads the subtree of the current element, the reader stays on it
+std::string XmlEntryReader::read_outer_xml()
+{
+    xmlChar* outer = xmlTextReaderReadOuterXml(reader);
+    if(outer == nullptr || *outer == '\0')
+    {
+        xmlFree(outer);
+        check_read_error();
+        YLOG_ERROR("Failed to parse reply sent by device");
+        throw(YCPPServiceProviderError{"Failed to parse reply sent by device"});
+    }
+    std::string xml{reinterpret_cast<const char*>(outer)};
+    xmlFree(outer);
+    return xml;
+}
+
+void XmlEntryReader::throw_reply_error(const std::string& error) const
+{
+    YLOG_ERROR("Can't find data tag in reply sent by device {}", error);
+    throw(YCPPServiceProviderError{error});
+}
+
+// Moves the reader into the data element of the reply, keeping the
+// namespaces declared by the enclosing elements
+void XmlEntryReader::find_data()
+{
+    started = true;
+    while(advance())
+    {
+        if(node_type() != XML_READER_TYPE_ELEMENT)
+            continue;
+        std::string name = local_name();
+        if(name == "rpc-error")
+            // a streamed reply is not kept, only the error is reported
+            throw_reply_error(read ? read_outer_xml() : reply);
+        if(depth() == 1 && name == "data")
+        {
+            data_depth = 1;
+            auto namespaces = namespace_declarations();
+            merge(namespaces, inherited);
+            inherited = namespaces;
+            if(xmlTextReaderIsEmptyElement(reader) == 1)
+            {
+                YLOG_INFO("Found empty data tag");
+                finished = true;
+            }
+            return;
+        }
+        if(depth() == 0)
+            inherited = namespace_declarations();
+        else
+            skip();
+    }
+    throw_reply_error(read ? "No data in reply sent by device" : reply);
+}
+
+// The reader is on a non empty child element of frame, which is
+// appended to the leafs of frame if it has no element children
+void XmlEntryReader::read_leaf(Frame& frame)
+{
+    int leaf_depth = depth();
+    std::string name = reinterpret_cast<const char*>(xmlTextReaderConstName(reader));
+    auto namespaces = namespace_declarations();
+    if(xmlTextReaderIsEmptyElement(reader) == 1)
+    {
+        frame.leafs += start_tag(name, namespaces, true);
+        return;
+    }
+
+    std::string text;
+    while(advance())
+    {
+        int type = node_type();
+        if(type == XML_READER_TYPE_TEXT || type == XML_READER_TYPE_CDATA
+           || type == XML_READER_TYPE_WHITESPACE || type == XML_READER_TYPE_SIGNIFICANT_WHITESPACE)
+        {
+            const xmlChar* value = xmlTextReaderConstValue(reader);
+            if(value)
+                text += reinterpret_cast<const char*>(value);
+            continue;
+        }
+        if(type == XML_READER_TYPE_END_ELEMENT && depth() == leaf_depth)
+        {
+            frame.leafs += start_tag(name, namespaces) + escape(text) + "</" + name + ">";
+            return;
+        }
+        break;
+    }
+
+    // a container, skip the rest of it
+    while(true)
+    {
+        int type = node_type();
+        if(type == XML_READER_TYPE_END_ELEMENT && depth() == leaf_depth)
+            return;
+        if(type == XML_READER_TYPE_ELEMENT)
+        {
+            if(!skip())
+                return;
+        }
+        if(!advance())
+            return;
+    }
+}
+
+// Encloses entry in the open frames, the outermost element gets the
+// namespaces declared by the rpc-reply and data elements
+std::string XmlEntryReader::wrap(std::string entry)
+{
+    if(frames.empty())
+    {
+        // add the declarations missing from the start tag of entry
+        auto end = entry.find('>');
+        if(end != std::string::npos && end > 0 && entry[end - 1] == '/')
+            end--;
+        std::string tag = entry.substr(0, end);
+        std::string declarations;
+        for(auto const & ns : inherited)
+        {
+            if(tag.find(" " + ns.first + "=") == std::string::npos)
+                declarations += " " + ns.first + "=\"" + escape(ns.second) + "\"";
+        }
+        return entry.insert(end, declarations);
+    }
+
+    std::string payload;
+    for(size_t i = 0; i < frames.size(); i++)
+    {
+        auto namespaces = frames[i].namespaces;
+        if(i == 0)
+            merge(namespaces, inherited);
+        payload += start_tag(frames[i].name, namespaces) + frames[i].leafs;
+    }
+    payload += entry;
+    for(size_t i = frames.size(); i > 0; i--)
+    {
+        payload += "</" + frames[i - 1].name + ">";
+    }
+    return payload;
+}
+
+bool XmlEntryReader::next_entry(std::string& entry)
+{
+    if(!started)
+        find_data();
+
+    while(!finished && advance())
+    {
+        int type = node_type();
+        int level = depth() - data_depth - 1;
+        if(type == XML_READER_TYPE_END_ELEMENT)
+        {
+            if(level < 0)
+                break;
+            if(!frames.empty() && static_cast<size_t>(level) == frames.size() - 1)
+                frames.pop_back();
+            continue;
+        }
+        if(type != XML_READER_TYPE_ELEMENT)
+            continue;
+
+        if(static_cast<size_t>(level) != frames.size())
+        {
+            skip();
+            continue;
+        }
+        if(local_name() == segments[level])
+        {
+            if(static_cast<size_t>(level) + 1 == segments.size())
+            {
+                entry = wrap(read_outer_xml());
+                skip();
+                return true;
+            }
+            if(!frames.empty())
+                frames.back().descended = true;
+            bool empty = xmlTextReaderIsEmptyElement(reader) == 1;
+            std::string name = reinterpret_cast<const char*>(xmlTextReaderConstName(reader));
+            frames.push_back(Frame{name, namespace_declarations(), "", false});
+            if(empty)
+                frames.pop_back();
+            continue;
+        }
+        if(!frames.empty() && !frames.back().descended)
+            read_leaf(frames.back());
+        else
+            skip();
+    }
+
+    finished = true;
+    frames.clear();
+    return false;
+}
+
+//////////////////////////////////////////////////////////////////////////
+// DataNodeStream
+//////////////////////////////////////////////////////////////////////////
+DataNodeStream::DataNodeStream(RootSchemaNode & root_schema, std::string reply, const std::string & path)
+    : root_schema{root_schema}, reader{std::make_unique<XmlEntryReader>(std::move(reply), path)}
+{
+}
+
+DataNodeStream::DataNodeStream(RootSchemaNode & root_schema, std::function<size_t(char*, size_t)> read, const std::string & path)
+    : root_schema{root_schema}, reader{std::make_unique<XmlEntryReader>(std::move(read), path)}
+{
+}
+
+DataNodeStream::~DataNodeStream()
+{
+}
+
+std::shared_ptr<DataNode> DataNodeStream::next()
+{
+    std::string entry;
+    if(!reader->next_entry(entry))
+        return nullptr;
+
+    YLOG_DEBUG("Decoding streamed entry {}", entry);
+    Codec codec{};
+    auto datanode = codec.decode(root_schema, entry, EncodingFormat::XML);
+    if(!datanode)
+    {
+        YLOG_ERROR("Codec service failed to decode datanode");
+        throw(YCPPError{"Problems deserializing output"});
+    }
+    return datanode;
+}
+
+}
+
+}
@@ -62,6 +62,7 @@ static std::shared_ptr<path::DataNode> handle_edit_reply(string reply, NetconfCl
 static string get_read_rpc_name(bool config);
 static bool is_config(path::Rpc & rpc);
 static string get_filter_payload(path::Rpc & ydk_rpc);
+static string get_read_payload(path::Rpc & ydk_rpc, path::Rpc & netconf_rpc, bool config);
 static string get_netconf_payload(path::DataNode & input, const string& data_tag, const string& data_value);
 static std::shared_ptr<path::DataNode> handle_rpc_output(const string & reply, path::RootSchemaNode & root_schema, path::Rpc & rpc);
 
@@ -102,6 +103,26 @@ NetconfSession::NetconfSession(const string& address,
     YLOG_INFO("Connected to {} on port {} using {}", address, port, protocol);
 }
 
+NetconfSession::NetconfSession(const std::shared_ptr<path::RootSchemaNode>& root_schema,
+                               const string& address,
+                               const string& username,
+                               const string& password,
+                               int port,
+                               const string& protocol)
+    : root_schema{root_schema}
+{
+    if(root_schema.get() == nullptr)
+    {
+        YLOG_ERROR("Root schema cannot be null");
+        throw(YCPPInvalidArgumentError{"Root schema cannot be null"});
+    }
+    initialize_client(address, username, password, port, protocol);
+    client->connect();
+    server_capabilities = client->get_capabilities();
+    candidate_supported = is_candidate_supported(server_capabilities);
+    YLOG_INFO("Connected to {} on port {} using {}", address, port, protocol);
+}
+
 void NetconfSession::initialize_client(const string& address,
                                        const string& username,
                                        const string& password,
@@ -129,6 +150,7 @@ void NetconfSession::initialize(path::Repository & repo, bool on_demand)
     IetfCapabilitiesParser capabilities_parser{};
     client->connect();
     server_capabilities = client->get_capabilities();
+    candidate_supported = is_candidate_supported(server_capabilities);
 
     for(std::string &c : server_capabilities )
     {
@@ -172,24 +194,44 @@ path::RootSchemaNode& NetconfSession::get_root_schema() const
     return *root_schema;
 }
 
-std::shared_ptr<path::DataNode> NetconfSession::handle_read(path::Rpc& ydk_rpc) const
+std::shared_ptr<path::RootSchemaNode> NetconfSession::get_root_schema_ptr() const
+{
+    return root_schema;
+}
+
+NetconfSession::PreparedRpc NetconfSession::prepare_read(path::Rpc& ydk_rpc) const
 {
     //for now we only support crud rpc's
     bool config = is_config(ydk_rpc);
     auto netconf_rpc = create_rpc_instance(*root_schema, get_read_rpc_name(config));
-    auto & input = create_rpc_input(*netconf_rpc);
-    create_input_source(input, config);
-    std::string filter_value = get_filter_payload(ydk_rpc);
+    string netconf_payload = get_read_payload(ydk_rpc, *netconf_rpc, config);
+    auto schema = root_schema;
+    return {netconf_payload, [schema, netconf_rpc](const string & reply) {
+        return handle_rpc_output(reply, *schema, *netconf_rpc);
+    }};
+}
+
+std::unique_ptr<path::DataNodeStream> NetconfSession::stream_read(path::Rpc& ydk_rpc, const std::string& path) const
+{
+    path::SchemaNode* read_schema = get_schema_for_operation(*root_schema, "ydk:read");
+    if(&(ydk_rpc.get_schema_node()) != read_schema)
+    {
+        YLOG_ERROR("Only ydk:read can be streamed");
+        throw(YCPPInvalidArgumentError{"Only ydk:read can be streamed"});
+    }
+    bool config = is_config(ydk_rpc);
+    auto netconf_rpc = create_rpc_instance(*root_schema, get_read_rpc_name(config));
+    string netconf_payload = get_read_payload(ydk_rpc, *netconf_rpc, config);
 
-    string netconf_payload = get_netconf_payload(input, "filter", filter_value);
-    return handle_rpc_output(execute_payload(netconf_payload), *root_schema, *netconf_rpc );
+    // the reply is parsed as it is received, so it is never held whole
+    std::shared_ptr<NetconfReplyReader> reply = client->stream_payload(netconf_payload);
+    return std::make_unique<path::DataNodeStream>(*root_schema,
+        [reply](char* buffer, size_t size) { return reply->read(buffer, size); }, path);
 }
 
-std::shared_ptr<path::DataNode> NetconfSession::handle_edit(path::Rpc& ydk_rpc, path::Annotation annotation) const
+NetconfSession::PreparedRpc NetconfSession::prepare_edit(path::Rpc& ydk_rpc, path::Annotation annotation) const
 {
     //for now we only support crud rpc's
-    bool candidate_supported = is_candidate_supported(server_capabilities);
-
     auto netconf_rpc = create_rpc_instance(*root_schema, "ietf-netconf:edit-config");
     auto & input = create_rpc_input(*netconf_rpc);
     create_input_target(input, candidate_supported);
@@ -200,10 +242,14 @@ std::shared_ptr<path::DataNode> NetconfSession::handle_edit(path::Rpc& ydk_rpc,
     string netconf_payload = get_netconf_payload(input, "config", config_payload);
     ly_verb(LY_LLVRB); // enable libyang logging after payload has been created
 
-    return handle_edit_reply(execute_payload(netconf_payload), *client, candidate_supported);
+    NetconfClient* edit_client = client.get();
+    bool commit = candidate_supported;
+    return {netconf_payload, [edit_client, commit](const string & reply) {
+        return handle_edit_reply(reply, *edit_client, commit);
+    }};
 }
 
-std::shared_ptr<path::DataNode> NetconfSession::handle_netconf_operation(path::Rpc& ydk_rpc) const
+NetconfSession::PreparedRpc NetconfSession::prepare_netconf_operation(path::Rpc& ydk_rpc) const
 {
     path::Codec codec_service{};
     auto netconf_payload = codec_service.encode(ydk_rpc.get_input_node(), EncodingFormat::XML, true);
@@ -214,20 +260,48 @@ std::shared_ptr<path::DataNode> NetconfSession::handle_netconf_operation(path::R
     YLOG_INFO("{}", netconf_payload);
     YLOG_INFO("\n");
 
-    std::string reply = execute_payload(netconf_payload);
-    if (ydk_rpc.has_output_node())
+    auto schema = root_schema;
+    path::Rpc* rpc = &ydk_rpc;
+    return {netconf_payload, [schema, rpc](const string & reply) -> std::shared_ptr<path::DataNode> {
+        if (rpc->has_output_node())
+        {
+            return handle_rpc_output(reply, *schema, *rpc);
+        }
+        if(reply.find("<ok/>") == std::string::npos)
+        {
+            YLOG_ERROR("No ok in reply ");
+            throw(YCPPServiceProviderError{reply});
+        }
+        return nullptr;
+    }};
+}
+
+std::shared_ptr<path::DataNode> NetconfSession::invoke(path::Rpc& rpc) const
+{
+    auto prepared = prepare(rpc);
+    return prepared.second(execute_payload(prepared.first));
+}
+
+std::vector<std::shared_ptr<path::DataNode>> NetconfSession::invoke_many(const std::vector<path::Rpc*> & rpcs) const
+{
+    std::vector<PreparedRpc> prepared;
+    std::vector<std::string> payloads;
+    for(auto rpc : rpcs)
     {
-        return handle_rpc_output(reply, *root_schema, ydk_rpc);
+        prepared.push_back(prepare(*rpc));
+        payloads.push_back(prepared.back().first);
     }
-    if(reply.find("<ok/>") == std::string::npos)
+
+    auto replies = execute_payloads(payloads);
+    std::vector<std::shared_ptr<path::DataNode>> outputs;
+    for(size_t i = 0; i < replies.size(); i++)
     {
-        YLOG_ERROR("No ok in reply ");
-        throw(YCPPServiceProviderError{reply});
+        outputs.push_back(prepared[i].second(replies[i]));
     }
-    return nullptr;
+    return outputs;
 }
 
-std::shared_ptr<path::DataNode> NetconfSession::invoke(path::Rpc& rpc) const
+NetconfSession::PreparedRpc NetconfSession::prepare(path::Rpc& rpc) const
 {
     path::SchemaNode* create_schema = get_schema_for_operation(*root_schema, "ydk:create");
     path::SchemaNode* read_schema = get_schema_for_operation(*root_schema, "ydk:read");
@@ -236,24 +310,21 @@ std::shared_ptr<path::DataNode> NetconfSession::invoke(path::Rpc& rpc) const
 
     //for now we only support crud rpc's
     path::SchemaNode* rpc_schema = &(rpc.get_schema_node());
-    std::shared_ptr<path::DataNode> datanode = nullptr;
 
     if(rpc_schema == create_schema || rpc_schema == delete_schema || rpc_schema == update_schema)
     {
         //for each child node in datanode add the nc:operation attribute
         path::Annotation an{IETF_NETCONF_MODULE_NAME, "operation", rpc_schema == delete_schema ? "delete" : "merge"};
-        return handle_edit(rpc, an);
+        return prepare_edit(rpc, an);
     }
     else if(rpc_schema == read_schema)
     {
-        return handle_read(rpc);
+        return prepare_read(rpc);
     }
     else
     {
-       return handle_netconf_operation(rpc);
+       return prepare_netconf_operation(rpc);
     }
-
-    return datanode;
 }
 
 std::string NetconfSession::execute_payload(const std::string & payload) const
@@ -265,6 +336,18 @@ std::string NetconfSession::execute_payload(const std::string & payload) const
     return reply;
 }
 
+std::vector<std::string> NetconfSession::execute_payloads(const std::vector<std::string> & payloads) const
+{
+    std::vector<std::string> replies = client->execute_payloads(payloads);
+    for(auto & reply : replies)
+    {
+        YLOG_INFO("=============Reply payload received from device=============");
+        YLOG_INFO("{}", reply);
+        YLOG_INFO("\n");
+    }
+    return replies;
+}
+
 static shared_ptr<path::Rpc> create_rpc_instance(path::RootSchemaNode & root_schema, string rpc_name)
 {
     auto rpc = shared_ptr<path::Rpc>(root_schema.create_rpc(rpc_name));
@@ -486,6 +569,15 @@ static string get_read_rpc_name(bool config)
     return "ietf-netconf:get";
 }
 
+static string get_read_payload(path::Rpc & ydk_rpc, path::Rpc & netconf_rpc, bool config)
+{
+    auto & input = create_rpc_input(netconf_rpc);
+    create_input_source(input, config);
+    std::string filter_value = get_filter_payload(ydk_rpc);
+
+    return get_netconf_payload(input, "filter", filter_value);
+}
+
 static bool is_config(path::Rpc & rpc)
 {
     if(!rpc.get_input_node().find("only-config").empty())
@@ -22,73 +22,100 @@
 //////////////////////////////////////////////////////////////////
 
 
-#include <pcre.h>
 #include <fstream>
+#include <list>
+#include <mutex>
 #include <sstream>
+#include <unordered_map>
 
 #include "../logger.hpp"
 #include "path_private.hpp"
 
-#define SLASH_CHAR "##SLASH##"
+#define SEGMENT_CACHE_SIZE 4096
 
 ////////////////////////////////////////////////////////////////////
 /// Function segmentalize()
 ////////////////////////////////////////////////////////////////////
 namespace ydk
 {
-static bool replace(std::string& subject, const std::string& search, const std::string& replace)
+namespace
 {
-    size_t pos = 0;
-    int replace_count = 0;
-    while ((pos = subject.find(search, pos)) != std::string::npos)
+// Thread-safe LRU cache of path segments. The same relative paths are
+// segmentalized over and over when encoding lists, e.g. for every neighbor
+// of a BGP instance.
+class SegmentCache
+{
+public:
+    explicit SegmentCache(size_t capacity) : capacity{capacity}
     {
-         subject.replace(pos, search.length(), replace);
-         pos += replace.length();
-         replace_count+=1;
     }
-    return replace_count>0;
-}
 
-static void escape_slashes(std::string& data)
-{
-    pcre *re = NULL;
-    const char *err_msg;
-    int err;
-    int offsets[3000];
-    const char* pattern = "'[^\[]+'";
-    const char *psubStrMatchStr = NULL;
-    unsigned int offset = 0;
-    int rc;
-
-    re = pcre_compile(pattern, 0, &err_msg, &err, NULL);
-    if(re == NULL)
+    bool get(const std::string& path, std::vector<std::string>& segments)
+    {
+        std::lock_guard<std::mutex> guard{mutex};
+        auto found = index.find(path);
+        if(found == index.end())
+        {
+            return false;
+        }
+        entries.splice(entries.begin(), entries, found->second);
+        segments = found->second->second;
+        return true;
+    }
+
+    void put(const std::string& path, const std::vector<std::string>& segments)
     {
-        YLOG_ERROR("ERROR: Could not compile '{}': {}", pattern, err_msg);
-        return;
+        std::lock_guard<std::mutex> guard{mutex};
+        if(index.find(path) != index.end())
+        {
+            return;
+        }
+        entries.emplace_front(path, segments);
+        index.emplace(path, entries.begin());
+        if(entries.size() > capacity)
+        {
+            index.erase(entries.back().first);
+            entries.pop_back();
+        }
     }
 
-    while (offset < data.size() && (rc = pcre_exec(re, 0, data.c_str(), data.size(), offset, 0, offsets, sizeof(offsets))) >= 0)
+private:
+    typedef std::list<std::pair<std::string, std::vector<std::string>>> Entries;
+
+    size_t capacity;
+    std::mutex mutex;
+    Entries entries;
+    std::unordered_map<std::string, Entries::iterator> index;
+};
+}
+
+// Splits the path on '/' in a single pass. Slashes inside quoted predicate
+// values, e.g. [name='GigabitEthernet0/0/0/0'], do not separate segments.
+static std::vector<std::string> split_path(const std::string& path)
+{
+    std::vector<std::string> output;
+    size_t start = 0;
+    char quote = 0;
+    for(size_t i = 0; i < path.size(); ++i)
     {
-       for(int i = 0; i < rc; ++i)
-       {
-           pcre_get_substring(data.c_str(), offsets, rc, i, &(psubStrMatchStr));
-           std::string original{psubStrMatchStr};
-           std::string s{psubStrMatchStr};
-           if(replace(s,"/",SLASH_CHAR))
-           {
-               replace(data, original, s);
-           }
-           if(psubStrMatchStr != NULL)
-           {
-                pcre_free_substring(psubStrMatchStr);
-                psubStrMatchStr = NULL;
-           }
-       }
-       offset = offsets[1];
+        char c = path[i];
+        if(quote != 0)
+        {
+            if(c == quote)
+                quote = 0;
+        }
+        else if(c == '\'' || c == '"')
+        {
+            quote = c;
+        }
+        else if(c == '/')
+        {
+            output.emplace_back(path, start, i - start);
+            start = i + 1;
+        }
     }
-    if(psubStrMatchStr != NULL)
-        pcre_free_substring(psubStrMatchStr);
-    free(re);
+    output.emplace_back(path, start, std::string::npos);
+    return output;
 }
 }
 
@@ -112,21 +139,13 @@ std::unordered_set<std::string> ydk::path::segmentalize_module_names(const std::
 
 std::vector<std::string> ydk::path::segmentalize(const std::string& path)
 {
-    const std::string token {"/"};
+    static SegmentCache cache{SEGMENT_CACHE_SIZE};
     std::vector<std::string> output;
-    size_t pos = std::string::npos; // size_t to avoid improbable overflow
-    std::string data{path};
-    escape_slashes(data);
-    do
+    if(!cache.get(path, output))
     {
-        pos = data.find(token);
-        auto q=data.substr(0, pos);
-        replace(q, SLASH_CHAR, "/");
-        output.push_back(q);
-        if (std::string::npos != pos)
-            data = data.substr(pos + token.size());
-    } while (std::string::npos != pos);
-
+        output = split_path(path);
+        cache.put(path, output);
+    }
     return output;
 }
 
@@ -248,12 +267,12 @@ static LYD_FORMAT get_ly_format(ydk::EncodingFormat format)
     LYD_FORMAT scheme = LYD_XML;
     if (format == ydk::EncodingFormat::JSON)
     {
-        ydk::YLOG_DEBUG("Performing decode operation on JSON");
+        YLOG_DEBUG("Performing decode operation on JSON");
         scheme = LYD_JSON;
     }
     else
     {
-        ydk::YLOG_DEBUG("Performing decode operation on XML");
+        YLOG_DEBUG("Performing decode operation on XML");
     }
     return scheme;
 }
@@ -266,14 +285,14 @@ static ydk::path::RootSchemaNodeImpl & get_root_schema_impl(ydk::path::RootSchem
 
 static std::shared_ptr<ydk::path::DataNode> perform_decode(ydk::path::RootSchemaNodeImpl & rs_impl, struct lyd_node *root)
 {
-    ydk::YLOG_DEBUG("Performing decode operation");
+    YLOG_DEBUG("Performing decode operation");
     ydk::path::RootDataImpl* rd = new ydk::path::RootDataImpl{rs_impl, rs_impl.m_ctx, "/"};
     rd->m_node = root;
 
     struct lyd_node* dnode = rd->m_node;
     do
     {
-        rd->child_map.insert(std::make_pair(rd->m_node, std::make_shared<ydk::path::DataNodeImpl>(rd, rd->m_node, nullptr)));
+        rd->child_map.insert(std::make_pair(dnode, std::make_shared<ydk::path::DataNodeImpl>(rd, dnode, nullptr)));
         dnode = dnode->next;
     } while(dnode && dnode != nullptr && dnode != root);
 
@@ -284,6 +303,7 @@ std::shared_ptr<ydk::path::DataNode>
 ydk::path::Codec::decode(RootSchemaNode & root_schema, const std::string& buffer, EncodingFormat format)
 {
     RootSchemaNodeImpl & rs_impl = get_root_schema_impl(root_schema);
+    std::lock_guard<std::recursive_mutex> guard{rs_impl.m_mutex};
     rs_impl.populate_new_schemas_from_payload(buffer, format);
     struct lyd_node *root = lyd_parse_mem(rs_impl.m_ctx, buffer.c_str(),
                 get_ly_format(format), LYD_OPT_TRUSTED |  LYD_OPT_GET);
@@ -301,7 +321,7 @@ static const struct lyd_node* create_ly_rpc_node(ydk::path::RootSchemaNodeImpl &
     const struct lyd_node* rpc = lyd_new_path(NULL, rs_impl.m_ctx, rpc_path.c_str(), NULL, LYD_ANYDATA_SXML, 0);
     if( rpc == nullptr || ly_errno )
     {
-        ydk::YLOG_ERROR( "Parsing failed with message {}", ly_errmsg());
+        YLOG_ERROR( "Parsing failed with message {}", ly_errmsg());
         throw(ydk::path::YCPPCodecError{ydk::path::YCPPCodecError::Error::XML_INVAL});
     }
     return rpc;
@@ -312,6 +332,7 @@ ydk::path::Codec::decode_rpc_output(RootSchemaNode & root_schema, const std::str
             const std::string & rpc_path, EncodingFormat format)
 {
     RootSchemaNodeImpl & rs_impl = get_root_schema_impl(root_schema);
+    std::lock_guard<std::recursive_mutex> guard{rs_impl.m_mutex};
     rs_impl.populate_new_schemas_from_payload(buffer, format);
     const struct lyd_node* rpc = create_ly_rpc_node(rs_impl, rpc_path);
 
@@ -325,4 +346,4 @@ ydk::path::Codec::decode_rpc_output(RootSchemaNode & root_schema, const std::str
 
     return perform_decode(rs_impl, root);
 }
-#undef SLASH_CHAR
+#undef SEGMENT_CACHE_SIZE
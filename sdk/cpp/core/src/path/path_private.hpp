@@ -29,6 +29,7 @@
 #include <functional>
 #include <cstring>
 #include <cassert>
+#include <mutex>
 #include <unordered_set>
 #include <unordered_map>
 
@@ -47,6 +48,13 @@ namespace ydk {
 
         std::unordered_set<std::string> segmentalize_module_names(const std::string& value);
 
+        std::unordered_set<std::string> get_namespaces_from_xml_payload(const std::string& payload);
+
+        std::unordered_set<std::string> get_module_names_from_json_payload(const std::string& payload);
+
+        // Mutex of the root schema schema belongs to, see RootSchemaNodeImpl::m_mutex
+        std::recursive_mutex& get_schema_mutex(const SchemaNode& schema);
+
         class RepositoryPtr : public std::enable_shared_from_this<RepositoryPtr> {
         public:
             explicit RepositoryPtr(ModelCachingOption caching_option);
@@ -145,6 +153,11 @@ namespace ydk {
             struct ly_ctx* m_ctx;
             std::vector<std::unique_ptr<DataNode>> m_root_data_nodes;
             std::vector<std::unique_ptr<SchemaNode>> m_children;
+            // A root schema may be shared by sessions used from several
+            // threads. Loading a module changes m_ctx and m_children, so it
+            // and everything resolving paths or parsing data in m_ctx holds
+            // this mutex.
+            mutable std::recursive_mutex m_mutex;
 
         private:
 
@@ -64,6 +64,7 @@ ydk::path::RootDataImpl::populate_new_schemas_from_path(const std::string& path)
 ydk::path::DataNode&
 ydk::path::RootDataImpl::create_datanode(const std::string& path, const std::string& value)
 {
+    std::lock_guard<std::recursive_mutex> guard{get_schema_mutex(m_schema)};
     populate_new_schemas_from_path(path);
     populate_new_schemas_from_path(value);
 
@@ -196,6 +197,7 @@ ydk::path::RootDataImpl::get_root() const
 std::vector<std::shared_ptr<ydk::path::DataNode>>
 ydk::path::RootDataImpl::find(const std::string& path)
 {
+    std::lock_guard<std::recursive_mutex> guard{get_schema_mutex(m_schema)};
     populate_new_schemas_from_path(path);
 
     std::vector<std::shared_ptr<DataNode>> results;
@@ -23,93 +23,211 @@
 
 #include <unordered_set>
 
-#include <libxml/parser.h>
-#include <libxml/tree.h>
-#include <json.hpp>
-
 #include "../logger.hpp"
 #include "path_private.hpp"
 
 
-static void get_namespaces_from_xml_doc(xmlNodePtr root, std::unordered_set<std::string>& namespaces)
+namespace
+{
+inline bool is_space(char c)
+{
+    return c == ' ' || c == '\t' || c == '\n' || c == '\r';
+}
+
+inline const char* skip_space(const char* p, const char* end)
+{
+    while (p < end && is_space(*p))
+        ++p;
+    return p;
+}
+
+// Returns the position after the first occurrence of token at or after p,
+// or end if there is none
+const char* skip_past(const char* p, const char* end, const char* token)
+{
+    auto length = std::strlen(token);
+    auto found = std::search(p, end, token, token + length);
+    return found == end ? end : found + length;
+}
+
+bool starts_with(const char* p, const char* end, const char* token)
+{
+    auto length = std::strlen(token);
+    return static_cast<size_t>(end - p) >= length && std::strncmp(p, token, length) == 0;
+}
+
+// Replaces the predefined XML entities, the only ones expected in a namespace
+std::string unescape_xml(const char* begin, const char* end)
 {
-    xmlNodePtr curr = nullptr;
-    for (curr = root; curr; curr = curr->next)
+    std::string value{begin, end};
+    if (value.find('&') == std::string::npos)
+        return value;
+
+    static const std::pair<const char*, char> entities[] = {
+        {"&lt;", '<'}, {"&gt;", '>'}, {"&quot;", '"'}, {"&apos;", '\''}, {"&amp;", '&'}};
+    std::string result;
+    for (size_t i = 0; i < value.size(); i++)
     {
-        if (curr->type == XML_ELEMENT_NODE && curr->ns && curr->ns->href)
+        bool replaced = false;
+        if (value[i] == '&')
         {
-            namespaces.insert(std::string{reinterpret_cast<const char*>(curr->ns->href)});
+            for (auto & entity : entities)
+            {
+                if (value.compare(i, std::strlen(entity.first), entity.first) == 0)
+                {
+                    result += entity.second;
+                    i += std::strlen(entity.first) - 1;
+                    replaced = true;
+                    break;
+                }
+            }
         }
-        get_namespaces_from_xml_doc(curr->children, namespaces);
+        if (!replaced)
+            result += value[i];
     }
+    return result;
 }
 
-namespace ydk
+// Unescapes a JSON string, \uXXXX escapes are kept as they are, they are
+// not expected in module names
+std::string unescape_json(const char* begin, const char* end)
 {
+    std::string value;
+    for (const char* p = begin; p < end; ++p)
+    {
+        if (*p != '\\' || p + 1 == end)
+        {
+            value += *p;
+            continue;
+        }
+        ++p;
+        switch (*p)
+        {
+            case 'b': value += '\b'; break;
+            case 'f': value += '\f'; break;
+            case 'n': value += '\n'; break;
+            case 'r': value += '\r'; break;
+            case 't': value += '\t'; break;
+            case 'u': value += "\\u"; break;
+            default: value += *p; break;
+        }
+    }
+    return value;
+}
+}
 
-using json = nlohmann::json;
-
-    static std::unordered_set<std::string>
-    get_namespaces_from_xml_payload(const std::string& payload)
+namespace ydk
+{
+    // Collects the namespaces declared in the start tags of an XML payload.
+    // The payload is scanned once, text content is skipped with memchr and
+    // no document is built, libyang parses the payload afterwards.
+    std::unordered_set<std::string>
+    path::get_namespaces_from_xml_payload(const std::string& payload)
     {
         YLOG_DEBUG("Extracting module namespaces from XML payload");
-        xmlDocPtr doc = xmlParseDoc(reinterpret_cast<const xmlChar*>(payload.c_str()));
-        xmlNodePtr root = xmlDocGetRootElement(doc);
         std::unordered_set<std::string> namespaces;
+        const char* p = payload.data();
+        const char* end = p + payload.size();
 
-        get_namespaces_from_xml_doc(root, namespaces);
-
-        xmlFreeDoc(doc);
-        xmlCleanupParser();
-
+        while ((p = static_cast<const char*>(std::memchr(p, '<', end - p))) != nullptr)
+        {
+            if (++p == end)
+                break;
+            if (*p == '!')
+            {
+                if (starts_with(p, end, "!--"))
+                    p = skip_past(p, end, "-->");
+                else if (starts_with(p, end, "![CDATA["))
+                    p = skip_past(p, end, "]]>");
+                else
+                    p = skip_past(p, end, ">");
+                continue;
+            }
+            if (*p == '?')
+            {
+                p = skip_past(p, end, "?>");
+                continue;
+            }
+            if (*p == '/')
+                continue;
+
+            // element name
+            while (p < end && !is_space(*p) && *p != '>' && *p != '/')
+                ++p;
+            // attributes
+            while (true)
+            {
+                p = skip_space(p, end);
+                if (p == end || *p == '>' || *p == '/')
+                    break;
+                const char* name = p;
+                while (p < end && *p != '=' && !is_space(*p) && *p != '>' && *p != '/')
+                    ++p;
+                const char* name_end = p;
+                p = skip_space(p, end);
+                if (p == end || *p != '=')
+                    break;
+                p = skip_space(p + 1, end);
+                if (p == end || (*p != '"' && *p != '\''))
+                    break;
+                const char* value = p + 1;
+                p = static_cast<const char*>(std::memchr(value, *p, end - value));
+                if (p == nullptr)
+                    return namespaces;
+
+                std::string attribute{name, name_end};
+                if ((attribute == "xmlns" || attribute.compare(0, 6, "xmlns:") == 0) && p > value)
+                    namespaces.insert(unescape_xml(value, p));
+                ++p;
+            }
+        }
         return namespaces;
     }
 
-    static void
-    get_module_names_from_json_object(json& o, std::unordered_set<std::string>& module_names)
+    // Collects the module names prefixing the member names of a JSON
+    // payload, and the ones found in string values such as identities and
+    // instance identifiers, in a single pass over its string tokens.
+    std::unordered_set<std::string>
+    path::get_module_names_from_json_payload(const std::string& payload)
     {
-        for (json::iterator it = o.begin(); it != o.end(); ++it)
+        YLOG_DEBUG("Extracting module names from JSON payload");
+        std::unordered_set<std::string> module_names;
+        const char* p = payload.data();
+        const char* end = p + payload.size();
+
+        while ((p = static_cast<const char*>(std::memchr(p, '"', end - p))) != nullptr)
         {
-            if (it->is_array())
+            const char* begin = ++p;
+            bool escaped = false;
+            while (p < end && *p != '"')
             {
-                for (auto i = it->begin(); i != it->end(); i++)
+                if (*p == '\\')
                 {
-                    get_module_names_from_json_object(*i, module_names);
+                    escaped = true;
+                    if (++p == end)
+                        break;
                 }
+                ++p;
+            }
+            if (p >= end)
+                break;
+            const char* string_end = p++;
+            if (std::memchr(begin, ':', string_end - begin) == nullptr)
+                continue;
+
+            std::string token = escaped ? unescape_json(begin, string_end) : std::string{begin, string_end};
+            const char* next = skip_space(p, end);
+            if (next < end && *next == ':')
+            {
+                // member name
+                module_names.insert(token.substr(0, token.find(':')));
             }
             else
             {
-                // extract module name from key
-                auto identifier = std::string(it.key());
-                auto found = identifier.find(":");
-                if (found != std::string::npos)
-                {
-                    module_names.insert(identifier.substr(0, found));
-                }
-                // extract module name from primitive type value
-                if (it->is_primitive())
-                {
-                    auto v = it->dump();
-                    if (v.find("\"") == 0)
-                        v = v.substr(1);
-                    auto ns = path::segmentalize_module_names(v);
-                    module_names.insert(ns.begin(), ns.end());
-                }
-                else
-                {
-                    get_module_names_from_json_object(*it, module_names);
-                }
+                auto names = segmentalize_module_names(token);
+                module_names.insert(names.begin(), names.end());
             }
         }
-    }
-
-    static std::unordered_set<std::string>
-    get_module_names_from_json_payload(const std::string& payload)
-    {
-        YLOG_DEBUG("Extracting module names from JSON payload");
-        std::unordered_set<std::string> module_names;
-        auto o = json::parse(payload);
-        get_module_names_from_json_object(o, module_names);
         return module_names;
     }
 }
@@ -158,6 +276,13 @@ ydk::path::RootSchemaNode::get_keys() const
 /////////////////////////////////////////////////////////////////////////////////////
 // class RootSchemaNodeImpl
 /////////////////////////////////////////////////////////////////////////////////////
+std::recursive_mutex&
+ydk::path::get_schema_mutex(const SchemaNode& schema)
+{
+    auto& root = static_cast<const RootSchemaNodeImpl&>(schema.get_root());
+    return root.m_mutex;
+}
+
 ydk::path::RootSchemaNodeImpl::RootSchemaNodeImpl(struct ly_ctx* ctx, const std::shared_ptr<RepositoryPtr> & repo)
     : m_ctx{ctx}, m_priv_repo{repo}, m_name_lookup(), m_namespace_lookup()
 {
@@ -204,6 +329,7 @@ ydk::path::RootSchemaNodeImpl::populate_module_schema(const struct lys_module* m
 void
 ydk::path::RootSchemaNodeImpl::populate_new_schemas_from_payload(const std::string& payload, ydk::EncodingFormat format)
 {
+    std::lock_guard<std::recursive_mutex> guard{m_mutex};
     std::vector<const lys_module*> modules;
     if (format == ydk::EncodingFormat::XML)
     {
@@ -213,7 +339,7 @@ ydk::path::RootSchemaNodeImpl::populate_new_schemas_from_payload(const std::stri
     else
     {
         auto module_names = get_module_names_from_json_payload(payload);
-        auto modules = m_priv_repo->get_new_ly_modules_from_lookup(m_ctx, module_names, m_name_lookup);
+        modules = m_priv_repo->get_new_ly_modules_from_lookup(m_ctx, module_names, m_name_lookup);
     }
 
     populate_new_schemas(modules);
@@ -221,6 +347,7 @@ ydk::path::RootSchemaNodeImpl::populate_new_schemas_from_payload(const std::stri
 
 void
 ydk::path::RootSchemaNodeImpl::populate_new_schemas_from_path(const std::string& path) {
+    std::lock_guard<std::recursive_mutex> guard{m_mutex};
     auto new_modules = m_priv_repo->get_new_ly_modules_from_path(m_ctx, path, m_name_lookup);
     populate_new_schemas(new_modules);
 }
@@ -269,6 +396,7 @@ ydk::path::RootSchemaNodeImpl::populate_augmented_schema_node(std::vector<lys_no
 std::vector<ydk::path::SchemaNode*>
 ydk::path::RootSchemaNodeImpl::find(const std::string& path)
 {
+    std::lock_guard<std::recursive_mutex> guard{m_mutex};
     populate_new_schemas_from_path(path);
 
     if(path.empty()) {
@@ -314,6 +442,7 @@ ydk::path::RootSchemaNodeImpl::create_datanode(const std::string& path)
 ydk::path::DataNode&
 ydk::path::RootSchemaNodeImpl::create_datanode(const std::string& path, const std::string& value)
 {
+    std::lock_guard<std::recursive_mutex> guard{m_mutex};
     populate_new_schemas_from_path(path);
 
     auto root_data_node = std::make_unique<RootDataImpl>(*this, m_ctx, "/", m_priv_repo);
@@ -324,6 +453,7 @@ ydk::path::RootSchemaNodeImpl::create_datanode(const std::string& path, const st
 std::shared_ptr<ydk::path::Rpc>
 ydk::path::RootSchemaNodeImpl::create_rpc(const std::string& path)
 {
+    std::lock_guard<std::recursive_mutex> guard{m_mutex};
     auto c = find(path);
     if(c.empty()){
         throw(YCPPInvalidArgumentError{"Path is invalid: "+ path});
@@ -29,6 +29,7 @@
 #define YDK_CORE_HPP
 
 #include <algorithm>
+#include <functional>
 #include <memory>
 #include <string>
 #include <unordered_map>
@@ -304,6 +305,51 @@ public:
     std::shared_ptr<DataNode> decode_rpc_output(RootSchemaNode & root_schema, const std::string& buffer, const std:: string & rpc_path, EncodingFormat format);
 };
 
+class XmlEntryReader;
+
+///
+/// @brief Stream of the entries of a list in a NETCONF get reply
+///
+/// The reply is scanned without building a document, and each entry of
+/// the list is decoded on its own, wrapped in its ancestors and their
+/// keys. Memory use is bounded by the size of an entry instead of the
+/// size of the reply.
+///
+class DataNodeStream
+{
+public:
+    ///
+    /// @param[in] root_schema The root schema to decode with, which must outlive the stream.
+    /// @param[in] reply The rpc-reply to a get or get-config.
+    /// @param[in] path The names of the nodes from the top level node down
+    /// to the list, separated by '/', for example "interfaces/interface".
+    /// Module prefixes are ignored.
+    ///
+    DataNodeStream(RootSchemaNode & root_schema, std::string reply, const std::string & path);
+    ///
+    /// @param[in] root_schema The root schema to decode with, which must outlive the stream.
+    /// @param[in] read Reads the rpc-reply as it is received: copies up to
+    /// size bytes of it to the buffer and returns their number, 0 once the
+    /// reply ends. Only the part of the reply being parsed is kept.
+    /// @param[in] path The path of the list, as above.
+    ///
+    DataNodeStream(RootSchemaNode & root_schema, std::function<size_t(char*, size_t)> read, const std::string & path);
+    ~DataNodeStream();
+
+    ///
+    /// @brief decode the next entry
+    ///
+    /// @return The root of a DataNode tree holding one entry of the list,
+    /// or nullptr once the reply is exhausted.
+    /// @throws YCPPServiceProviderError if the reply holds an error.
+    ///
+    std::shared_ptr<DataNode> next();
+
+private:
+    RootSchemaNode & root_schema;
+    std::unique_ptr<XmlEntryReader> reader;
+};
+
 ///
 /// @brief Base class for YCPP Errors
 ///
@@ -1022,17 +1068,60 @@ public:
                    bool on_demand = true,
                    bool common_cache = false);
 
+    ///
+    /// @brief Connect to the device reusing the given root schema
+    ///
+    /// The capability exchange is still performed, but no models are
+    /// loaded. Used to share one root schema among several sessions to
+    /// the same device. Models downloaded on demand are fetched through
+    /// the session which created root_schema, which must outlive it.
+    ///
+    NetconfSession(const std::shared_ptr<RootSchemaNode>& root_schema,
+                   const std::string& address,
+                   const std::string& username,
+                   const std::string& password,
+                   int port = 830,
+                   const std::string& protocol = "ssh");
+
     virtual ~NetconfSession();
 
     virtual RootSchemaNode& get_root_schema() const;
+    std::shared_ptr<RootSchemaNode> get_root_schema_ptr() const;
     virtual std::shared_ptr<DataNode> invoke(Rpc& rpc) const;
+
+    ///
+    /// @brief Send several rpcs without waiting for each reply
+    ///
+    /// The payloads are pipelined on clients which support it, see
+    /// NetconfClient::execute_payloads, and sent one by one otherwise.
+    ///
+    /// @param[in] rpcs The rpcs, which must outlive the call.
+    /// @return The output of each rpc, in the order of rpcs.
+    ///
+    std::vector<std::shared_ptr<DataNode>> invoke_many(const std::vector<Rpc*> & rpcs) const;
     std::vector<std::string> get_capabilities() const;
 
+    ///
+    /// @brief Send a ydk:read rpc and stream the entries of a list in the reply
+    ///
+    /// @param[in] rpc A ydk:read rpc.
+    /// @param[in] path Path of the list, see DataNodeStream.
+    ///
+    /// The reply is parsed as it is received over TCP. The session must
+    /// outlive the stream and cannot send other rpcs until the stream is
+    /// destroyed.
+    ///
+    std::unique_ptr<DataNodeStream> stream_read(Rpc& rpc, const std::string& path) const;
+
 private:
-    std::shared_ptr<DataNode> handle_edit(
+    // payload of an rpc and the handler of its reply
+    typedef std::pair<std::string, std::function<std::shared_ptr<DataNode>(const std::string&)>> PreparedRpc;
+
+    PreparedRpc prepare(Rpc& rpc) const;
+    PreparedRpc prepare_edit(
         Rpc& rpc, Annotation ann) const;
-    std::shared_ptr<DataNode> handle_read(Rpc& rpc) const;
-    std::shared_ptr<DataNode> handle_netconf_operation(Rpc& ydk_rpc) const;
+    PreparedRpc prepare_read(Rpc& rpc) const;
+    PreparedRpc prepare_netconf_operation(Rpc& ydk_rpc) const;
     void initialize(Repository& repo, bool on_demand);
     void initialize_client(const std::string& address,
                            const std::string& username,
@@ -1040,11 +1129,14 @@ private:
                            int port,
                            const std::string& protocol);
     std::string execute_payload(const std::string & payload) const;
+    std::vector<std::string> execute_payloads(const std::vector<std::string> & payloads) const;
 private:
     std::unique_ptr<NetconfClient> client;
     std::unique_ptr<ModelProvider> model_provider;
     std::shared_ptr<RootSchemaNode> root_schema;
     std::vector<std::string> server_capabilities;
+    // found in server_capabilities when connecting
+    bool candidate_supported = false;
 };
 
 
@@ -32,6 +32,7 @@
 #include <iostream>
 #include <memory>
 #include <string>
+#include <unordered_map>
 #include <vector>
 #include <utility>
 
@@ -98,6 +99,16 @@ struct EntityPath {
     bool operator != (const EntityPath & other) const;
 };
 
+struct EntityTreeNode {
+    size_t parent;
+    EntityPath path;
+    YFilter yfilter;
+
+    EntityTreeNode(size_t parent, EntityPath path, YFilter yfilter);
+
+    ~EntityTreeNode();
+};
+
 typedef void (*augment_capabilities_function)();
 
 class Entity {
@@ -131,6 +142,18 @@ class Entity {
     virtual std::map<std::string, std::shared_ptr<Entity>> get_children() const = 0;
     virtual std::shared_ptr<Entity> clone_ptr() const;
 
+    //
+    // @brief Get the entity and the descendants to encode, flattened
+    //
+    // Entities which can collect their whole tree in one pass, e.g. the
+    // generated Python classes, return the nodes the data node walker would
+    // visit, parents before children. The first node holds the absolute path
+    // of this entity, the others the path relative to their parent node.
+    //
+    // @return The tree, or an empty vector if the entity has to be walked
+    // node by node, which is the default.
+    virtual std::vector<EntityTreeNode> get_entity_tree() const;
+
     virtual void set_parent(Entity* p);
     virtual Entity* get_parent() const;
 
@@ -152,6 +175,188 @@ class Entity {
     bool is_presence_container;
 };
 
+//
+// @brief Get the key of a list entry from its segment path
+//
+// Joins the values of the key predicates of segment_path, e.g.
+// "ldata[number='1']", with '\0' separators.
+//
+// @param[in] segment_path Segment path of a list entry
+// @param[out] key The key
+// @param[out] complete False if one of the key values is empty
+// @return False if segment_path has no key predicates
+bool get_list_entry_key(const std::string & segment_path, std::string & key, bool & complete);
+
+//
+// @brief Entries of a YANG list, indexed by their keys
+//
+// Keeps the entries in insertion order, like the std::vector it replaces
+// in generated classes, and looks them up by key in constant time. Entries
+// are indexed lazily on the first lookup after they are added, so keys set
+// after push_back are picked up. Keys changed after an entry was indexed
+// are detected when a lookup returns that entry. Entries are only added or
+// removed through this class, element access is read only.
+//
+template <typename T>
+class YList
+{
+  public:
+    typedef std::shared_ptr<T> value_type;
+    typedef typename std::vector<value_type>::size_type size_type;
+    typedef typename std::vector<value_type>::const_iterator const_iterator;
+    typedef typename std::vector<value_type>::const_reverse_iterator const_reverse_iterator;
+    typedef const_iterator iterator;
+
+    YList() : indexed{0} {}
+
+    void push_back(const value_type & entry) { entries.push_back(entry); }
+    void push_back(value_type && entry) { entries.push_back(std::move(entry)); }
+
+    template <typename... Args>
+    void emplace_back(Args&&... args) { entries.emplace_back(std::forward<Args>(args)...); }
+
+    const_iterator insert(const_iterator pos, const value_type & entry)
+    {
+        size_type offset = pos - entries.cbegin();
+        entries.insert(entries.begin() + offset, entry);
+        reset_index();
+        return entries.cbegin() + offset;
+    }
+
+    const_iterator erase(const_iterator pos) { return erase(pos, pos + 1); }
+    const_iterator erase(const_iterator first, const_iterator last)
+    {
+        size_type offset = first - entries.cbegin();
+        entries.erase(entries.begin() + offset, entries.begin() + (last - entries.cbegin()));
+        reset_index();
+        return entries.cbegin() + offset;
+    }
+
+    void pop_back() { entries.pop_back(); reset_index(); }
+    void clear() { entries.clear(); reset_index(); }
+    void reserve(size_type n) { entries.reserve(n); }
+
+    size_type size() const { return entries.size(); }
+    bool empty() const { return entries.empty(); }
+
+    const value_type & operator [] (size_type index) const { return entries[index]; }
+    const value_type & at(size_type index) const { return entries.at(index); }
+    const value_type & front() const { return entries.front(); }
+    const value_type & back() const { return entries.back(); }
+
+    const_iterator begin() const { return entries.cbegin(); }
+    const_iterator end() const { return entries.cend(); }
+    const_iterator cbegin() const { return entries.cbegin(); }
+    const_iterator cend() const { return entries.cend(); }
+    const_reverse_iterator rbegin() const { return entries.crbegin(); }
+    const_reverse_iterator rend() const { return entries.crend(); }
+
+    //
+    // @brief Get the entry with the given key values, in YANG order
+    //
+    // @return The entry, or nullptr
+    value_type get(const std::vector<std::string> & key_values) const
+    {
+        std::string key;
+        for(size_type i = 0; i < key_values.size(); i++)
+        {
+            if(i > 0)
+                key += '\0';
+            key += key_values[i];
+        }
+        return lookup(key);
+    }
+
+    //
+    // @brief Get the entry with the given segment path, e.g. "ldata[number='1']"
+    //
+    // @return The entry, or nullptr
+    value_type get_by_segment_path(const std::string & segment_path) const
+    {
+        std::string key;
+        bool complete;
+        if(get_list_entry_key(segment_path, key, complete))
+            return lookup(key);
+
+        // keyless list
+        for(auto const & entry : entries)
+        {
+            if(entry->get_segment_path() == segment_path)
+                return entry;
+        }
+        return nullptr;
+    }
+
+  private:
+    value_type lookup(const std::string & key) const
+    {
+        update_index();
+        auto it = index.find(key);
+        if(it == index.end())
+            return nullptr;
+
+        std::string entry_key;
+        bool complete;
+        get_list_entry_key(it->second->get_segment_path(), entry_key, complete);
+        if(entry_key == key)
+            return it->second;
+
+        // a key leaf was changed after the entry was indexed
+        reset_index();
+        update_index();
+        it = index.find(key);
+        return it == index.end() ? nullptr : it->second;
+    }
+
+    void update_index() const
+    {
+        for(; indexed < entries.size(); indexed++)
+            index_entry(entries[indexed]);
+
+        // entries whose keys were not set yet when they were indexed
+        for(size_type i = 0; i < pending.size();)
+        {
+            std::string key;
+            bool complete;
+            get_list_entry_key(pending[i]->get_segment_path(), key, complete);
+            if(complete)
+            {
+                index.emplace(key, pending[i]);
+                pending[i] = pending.back();
+                pending.pop_back();
+            }
+            else
+            {
+                i++;
+            }
+        }
+    }
+
+    void index_entry(const value_type & entry) const
+    {
+        std::string key;
+        bool complete;
+        if(!get_list_entry_key(entry->get_segment_path(), key, complete))
+            return;
+        if(complete)
+            index.emplace(key, entry);
+        else
+            pending.push_back(entry);
+    }
+
+    void reset_index() const
+    {
+        index.clear();
+        pending.clear();
+        indexed = 0;
+    }
+
+    std::vector<value_type> entries;
+    mutable std::unordered_map<std::string, value_type> index;
+    mutable std::vector<value_type> pending;
+    mutable size_type indexed;
+};
+
 class Bits {
   public:
     Bits();
@@ -37,6 +37,7 @@ static string to_string(const xmlChar * s);
 static const xmlChar * to_xmlchar(const string & s);
 
 static void walk_children(Entity & entity, const path::SchemaNode & parent_schema, xmlNodePtr root_node);
+static void populate_xml_from_entity_tree(vector<EntityTreeNode> & tree, const path::SchemaNode & root_schema, xmlNodePtr root_node);
 static void populate_xml_node(Entity & entity, const path::SchemaNode & parent_schema, xmlNodePtr xml_node);
 static void populate_xml_node_contents(const path::SchemaNode & parent_schema, EntityPath & path, xmlNodePtr xml_node);
 static string to_string(xmlDocPtr doc, xmlNodePtr xml_node);
@@ -56,6 +57,13 @@ std::string XmlSubtreeCodec::encode(Entity & entity, path::RootSchemaNode & root
     xmlNodePtr root_node = xmlNewNode(NULL, to_xmlchar(entity.yang_name));
     xmlNewProp(root_node, (const unsigned char *)"xmlns", to_xmlchar(root_data_node.get_schema_node().get_statement().name_space));
 
+    vector<EntityTreeNode> tree = entity.get_entity_tree();
+    if(!tree.empty())
+    {
+        populate_xml_from_entity_tree(tree, root_data_node.get_schema_node(), root_node);
+        return to_string(doc, root_node);
+    }
+
     populate_xml_node_contents(root_data_node.get_schema_node(), root_path, root_node);
     walk_children(entity, root_data_node.get_schema_node(), root_node);
 
@@ -133,6 +141,28 @@ static void populate_xml_node(Entity & entity, const path::SchemaNode & parent_s
     walk_children(entity, *schema, child);
 }
 
+// Same XML as walking the entity, in the same order, from the flattened
+// tree of an entity. The tree already leaves out children without data and
+// operations, so has_data and has_operation are not called for every child.
+static void populate_xml_from_entity_tree(vector<EntityTreeNode> & tree, const path::SchemaNode & root_schema, xmlNodePtr root_node)
+{
+    YLOG_DEBUG("XML: Root entity: {}, tree of {} entities", tree[0].path.path, tree.size());
+    vector<const path::SchemaNode*> schemas(tree.size());
+    vector<xmlNodePtr> xml_nodes(tree.size());
+    schemas[0] = &root_schema;
+    xml_nodes[0] = root_node;
+    populate_xml_node_contents(root_schema, tree[0].path, root_node);
+    for(size_t index = 1; index < tree.size(); index++)
+    {
+        EntityTreeNode & tree_node = tree[index];
+        const path::SchemaNode & parent_schema = *schemas[tree_node.parent];
+        schemas[index] = find_child_by_name(parent_schema, tree_node.path.path);
+        xml_nodes[index] = create_and_populate_xml_node(parent_schema, *schemas[index], tree_node.yfilter,
+                                                        xml_nodes[tree_node.parent], NULL);
+        populate_xml_node_contents(*schemas[index], tree_node.path, xml_nodes[index]);
+    }
+}
+
 static const xmlChar* get_content_from_leafdata(LeafData & leaf_data)
 {
     const xmlChar* content = NULL;
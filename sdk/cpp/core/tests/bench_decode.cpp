@@ -0,0 +1,107 @@
+/// YANG Development Kit
+// Copyright 2016 Cisco Systems. All rights reserved
+//
+////////////////////////////////////////////////////////////////
+// Licensed to the Apache Software Foundation (ASF) under one
+// or more contributor license agreements.  See the NOTICE file
+// distributed with this work for additional information
+// regarding copyright ownership.  The ASF licenses this file
+// to you under the Apache License, Version 2.0 (the
+// "License"); you may not use this file except in compliance
+// with the License.  You may obtain a copy of the License at
+//
+//   http://www.apache.org/licenses/LICENSE-2.0
+//
+//  Unless required by applicable law or agreed to in writing,
+// software distributed under the License is distributed on an
+// "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+// KIND, either express or implied.  See the License for the
+// specific language governing permissions and limitations
+// under the License.
+//
+//////////////////////////////////////////////////////////////////
+
+// Benchmark of Codec::decode over growing payloads, hidden from the
+// default run:
+//   ./ydk_core_test "[benchmark]"
+
+#include <libxml/parser.h>
+#include <libxml/tree.h>
+#include <chrono>
+#include <iostream>
+#include "../src/path/path_private.hpp"
+#include "catch.hpp"
+#include "config.hpp"
+#include "mock_data.hpp"
+
+// The DOM based namespace extraction decode used to run before libyang
+// parsed the payload again, kept as the baseline of the benchmark.
+static void legacy_get_namespaces_from_xml_doc(xmlNodePtr root, std::unordered_set<std::string>& namespaces)
+{
+    for (xmlNodePtr curr = root; curr; curr = curr->next)
+    {
+        if (curr->type == XML_ELEMENT_NODE && curr->ns && curr->ns->href)
+        {
+            namespaces.insert(std::string{reinterpret_cast<const char*>(curr->ns->href)});
+        }
+        legacy_get_namespaces_from_xml_doc(curr->children, namespaces);
+    }
+}
+
+static std::unordered_set<std::string> legacy_get_namespaces_from_xml_payload(const std::string& payload)
+{
+    xmlDocPtr doc = xmlNewDoc(BAD_CAST "1.0");
+    xmlNodePtr nodes = nullptr;
+    xmlParseBalancedChunkMemory(doc, nullptr, nullptr, 0, reinterpret_cast<const xmlChar*>(payload.c_str()), &nodes);
+    std::unordered_set<std::string> namespaces;
+    legacy_get_namespaces_from_xml_doc(nodes, namespaces);
+    xmlFreeNodeList(nodes);
+    xmlFreeDoc(doc);
+    return namespaces;
+}
+
+// A runner with one-list entries, about size bytes long
+static std::string get_runner_payload(size_t size)
+{
+    std::string payload{"<runner xmlns=\"http://cisco.com/ns/yang/ydktest-sanity\"><one-list>"};
+    for (int i = 0; payload.size() < size; i++)
+    {
+        payload += "<ldata><number>" + std::to_string(i) + "</number><name>entry number "
+                   + std::to_string(i) + "</name></ldata>";
+    }
+    return payload + "</one-list></runner>";
+}
+
+template <typename Func>
+static double time_ms(int rounds, Func func)
+{
+    auto start = std::chrono::steady_clock::now();
+    for (int r = 0; r < rounds; r++)
+        func();
+    auto elapsed = std::chrono::duration<double, std::milli>(std::chrono::steady_clock::now() - start);
+    return elapsed.count() / rounds;
+}
+
+TEST_CASE("bench_decode", "[.][benchmark]")
+{
+    std::string searchdir{TEST_HOME};
+    mock::MockServiceProvider sp{searchdir, test_openconfig};
+    auto & schema = sp.get_root_schema();
+    ydk::path::Codec codec{};
+
+    std::cout << "Codec::decode of XML payloads, ms per call:" << std::endl
+              << "  size       legacy scan   scan      decode" << std::endl;
+    for (size_t size : {10ul << 10, 100ul << 10, 1ul << 20, 10ul << 20, 100ul << 20})
+    {
+        auto payload = get_runner_payload(size);
+        int rounds = size < (1ul << 20) ? 100 : (size < (100ul << 20) ? 5 : 1);
+        REQUIRE(ydk::path::get_namespaces_from_xml_payload(payload) == legacy_get_namespaces_from_xml_payload(payload));
+
+        double legacy = time_ms(rounds, [&payload]() { legacy_get_namespaces_from_xml_payload(payload); });
+        double scan = time_ms(rounds, [&payload]() { ydk::path::get_namespaces_from_xml_payload(payload); });
+        double decode = time_ms(rounds, [&]() { REQUIRE(codec.decode(schema, payload, ydk::EncodingFormat::XML) != nullptr); });
+
+        std::cout << "  " << (size >> 10) << " KB\t" << legacy << "\t" << scan << "\t" << decode << std::endl;
+        CHECK(scan < legacy);
+    }
+}
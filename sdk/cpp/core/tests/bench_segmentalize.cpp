@@ -0,0 +1,132 @@
+/// YANG Development Kit
+// Copyright 2016 Cisco Systems. All rights reserved
+//
+////////////////////////////////////////////////////////////////
+// Licensed to the Apache Software Foundation (ASF) under one
+// or more contributor license agreements.  See the NOTICE file
+// distributed with this work for additional information
+// regarding copyright ownership.  The ASF licenses this file
+// to you under the Apache License, Version 2.0 (the
+// "License"); you may not use this file except in compliance
+// with the License.  You may obtain a copy of the License at
+//
+//   http://www.apache.org/licenses/LICENSE-2.0
+//
+//  Unless required by applicable law or agreed to in writing,
+// software distributed under the License is distributed on an
+// "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+// KIND, either express or implied.  See the License for the
+// specific language governing permissions and limitations
+// under the License.
+//
+//////////////////////////////////////////////////////////////////
+
+// Micro-benchmark of path::segmentalize, hidden from the default run:
+//   ./ydk_core_test "[benchmark]"
+
+#include <pcre.h>
+#include <chrono>
+#include <iostream>
+#include "../src/path/path_private.hpp"
+#include "catch.hpp"
+
+#define SLASH_CHAR "##SLASH##"
+
+// The regex based implementation segmentalize used to have, kept as the
+// baseline of the benchmark.
+static bool legacy_replace(std::string& subject, const std::string& search, const std::string& replace)
+{
+    size_t pos = 0;
+    int replace_count = 0;
+    while ((pos = subject.find(search, pos)) != std::string::npos)
+    {
+         subject.replace(pos, search.length(), replace);
+         pos += replace.length();
+         replace_count+=1;
+    }
+    return replace_count>0;
+}
+
+static std::vector<std::string> legacy_segmentalize(const std::string& path)
+{
+    std::string data{path};
+    const char *err_msg;
+    int err;
+    int offsets[3000];
+    const char *match = NULL;
+    unsigned int offset = 0;
+    int rc;
+
+    pcre *re = pcre_compile("'[^\[]+'", 0, &err_msg, &err, NULL);
+    while (offset < data.size() && (rc = pcre_exec(re, 0, data.c_str(), data.size(), offset, 0, offsets, sizeof(offsets))) >= 0)
+    {
+       for(int i = 0; i < rc; ++i)
+       {
+           pcre_get_substring(data.c_str(), offsets, rc, i, &match);
+           std::string original{match};
+           std::string s{match};
+           if(legacy_replace(s, "/", SLASH_CHAR))
+               legacy_replace(data, original, s);
+           pcre_free_substring(match);
+       }
+       offset = offsets[1];
+    }
+    free(re);
+
+    std::vector<std::string> output;
+    size_t pos = std::string::npos;
+    do
+    {
+        pos = data.find("/");
+        auto q = data.substr(0, pos);
+        legacy_replace(q, SLASH_CHAR, "/");
+        output.push_back(q);
+        if (std::string::npos != pos)
+            data = data.substr(pos + 1);
+    } while (std::string::npos != pos);
+    return output;
+}
+
+static std::vector<std::string> get_bgp_neighbor_paths(int count)
+{
+    std::vector<std::string> paths;
+    for(int i = 0; i < count; i++)
+    {
+        paths.push_back("openconfig-bgp:bgp/neighbors/neighbor[neighbor-address='2001:db8::" + std::to_string(i) + "/128']"
+                        "/afi-safis/afi-safi[afi-safi-name='openconfig-bgp-types:IPV4_UNICAST']"
+                        "/apply-policy/config/import-policy");
+    }
+    return paths;
+}
+
+template <typename Func>
+static double time_per_call(const std::vector<std::string>& paths, int rounds, Func segmentalize)
+{
+    size_t segments = 0;
+    auto start = std::chrono::steady_clock::now();
+    for(int r = 0; r < rounds; r++)
+        for(auto & path : paths)
+            segments += segmentalize(path).size();
+    auto elapsed = std::chrono::duration<double, std::nano>(std::chrono::steady_clock::now() - start);
+    REQUIRE(segments == paths.size() * rounds * 8);
+    return elapsed.count() / (paths.size() * rounds);
+}
+
+TEST_CASE("bench_segmentalize", "[.][benchmark]")
+{
+    auto paths = get_bgp_neighbor_paths(1000);
+    for(auto & path : paths)
+        REQUIRE(ydk::path::segmentalize(path) == legacy_segmentalize(path));
+
+    double legacy = time_per_call(paths, 20, legacy_segmentalize);
+    double cached = time_per_call(paths, 20, ydk::path::segmentalize);
+    // more distinct paths than cache entries, every call is a miss
+    auto cold_paths = get_bgp_neighbor_paths(10000);
+    double uncached = time_per_call(cold_paths, 2, ydk::path::segmentalize);
+
+    std::cout << "segmentalize, ns per call on BGP neighbor paths:" << std::endl
+              << "  legacy regex: " << legacy << std::endl
+              << "  cache miss:   " << uncached << std::endl
+              << "  cache hit:    " << cached << std::endl;
+    CHECK(cached < legacy);
+}
@@ -46,3 +46,26 @@ TEST_CASE( "test_segmentalize_relative_path"  )
     REQUIRE(segments == expected);
 }
 
+TEST_CASE( "test_segmentalize_quoted_predicates"  )
+{
+    std::string test_string = "/openconfig-bgp:bgp/neighbors/neighbor[neighbor-address=\"2001:db8::1/128\"]/config/description[.='a/b']";
+    std::vector<std::string> segments = ydk::path::segmentalize(test_string);
+    std::vector<std::string> expected {"", "openconfig-bgp:bgp", "neighbors", "neighbor[neighbor-address=\"2001:db8::1/128\"]", "config", "description[.='a/b']"};
+
+    REQUIRE(segments == expected);
+    REQUIRE(ydk::path::segmentalize(test_string) == expected);
+}
+
+TEST_CASE( "test_payload_namespace_scanners" )
+{
+    std::string xml = "<?xml version=\"1.0\"?><!-- <x xmlns=\"urn:comment\"/> -->"
+                      "<a xmlns=\"urn:a\" xmlns:b='urn:b&amp;c' attr=\"x>y\"><![CDATA[<q xmlns=\"urn:cdata\"/>]]>"
+                      "<d xmlns=\"urn:d\"/>text &lt; more<e\n  xmlns = \"urn:e\"\n>v</e></a>";
+    std::unordered_set<std::string> expected_namespaces {"urn:a", "urn:b&c", "urn:d", "urn:e"};
+    REQUIRE(ydk::path::get_namespaces_from_xml_payload(xml) == expected_namespaces);
+
+    std::string json = "{\"mod-a:top\": {\"list\": [{\"k\": \"mod-b:ident\", \"p\": \"/mod-c:x/mod-d:y\", \"n\": 5}]}}";
+    std::unordered_set<std::string> expected_names {"mod-a", "mod-b", "mod-c", "mod-d"};
+    REQUIRE(ydk::path::get_module_names_from_json_payload(json) == expected_names);
+}
+
@@ -29,6 +29,7 @@
 #include "catch.hpp"
 #include "mock_data.hpp"
 #include <iostream>
+#include <thread>
 
 using namespace ydk;
 using namespace std;
@@ -50,3 +51,86 @@ TEST_CASE( "test_codec_rpc" )
     auto x2 = s.encode(*d2, EncodingFormat::XML, false);
     REQUIRE(x2=="<get-schema xmlns=\"urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring\"><data>module xyz { } </data></get-schema>");
 }
+
+TEST_CASE( "test_data_node_stream" )
+{
+    ydk::path::Codec s{};
+    std::string searchdir{TEST_HOME};
+    mock::MockServiceProvider sp{searchdir, test_openconfig};
+
+    auto & schema = sp.get_root_schema();
+
+    std::string reply = R"(<?xml version="1.0" encoding="UTF-8"?>
+<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="1">
+  <data>
+    <runner xmlns="http://cisco.com/ns/yang/ydktest-sanity">
+      <one><number>1</number></one>
+      <two-list>
+        <ldata>
+          <number>1</number>
+          <name>a &amp; b</name>
+          <subl1><number>11</number></subl1>
+          <subl1><number>12</number></subl1>
+        </ldata>
+        <ldata>
+          <number>2</number>
+          <subl1><number>21</number></subl1>
+        </ldata>
+      </two-list>
+    </runner>
+  </data>
+</rpc-reply>)";
+
+    ydk::path::DataNodeStream stream{schema, reply, "ydktest-sanity:runner/two-list/ldata/subl1"};
+    vector<string> entries;
+    while(auto dn = stream.next())
+    {
+        entries.push_back(s.encode(*dn, EncodingFormat::XML, false));
+    }
+
+    REQUIRE(entries.size() == 3);
+    REQUIRE(entries[0] == "<runner xmlns=\"http://cisco.com/ns/yang/ydktest-sanity\"><two-list><ldata><number>1</number><name>a &amp; b</name><subl1><number>11</number></subl1></ldata></two-list></runner>");
+    REQUIRE(entries[1] == "<runner xmlns=\"http://cisco.com/ns/yang/ydktest-sanity\"><two-list><ldata><number>1</number><name>a &amp; b</name><subl1><number>12</number></subl1></ldata></two-list></runner>");
+    REQUIRE(entries[2] == "<runner xmlns=\"http://cisco.com/ns/yang/ydktest-sanity\"><two-list><ldata><number>2</number><subl1><number>21</number></subl1></ldata></two-list></runner>");
+
+    ydk::path::DataNodeStream empty{schema, "<rpc-reply xmlns=\"urn:ietf:params:xml:ns:netconf:base:1.0\"><data/></rpc-reply>", "runner/two-list/ldata"};
+    REQUIRE(empty.next() == nullptr);
+
+    ydk::path::DataNodeStream error{schema, "<rpc-reply xmlns=\"urn:ietf:params:xml:ns:netconf:base:1.0\"><rpc-error/></rpc-reply>", "runner/two-list/ldata"};
+    REQUIRE_THROWS_AS(error.next(), ydk::YCPPServiceProviderError);
+}
+
+TEST_CASE( "test_codec_shared_schema_threads" )
+{
+    std::string searchdir{TEST_HOME};
+    mock::MockServiceProvider sp{searchdir, test_openconfig};
+
+    auto & schema = sp.get_root_schema();
+    std::string payload = "<runner xmlns=\"http://cisco.com/ns/yang/ydktest-sanity\"><one><number>1</number></one></runner>";
+
+    // Catch assertions are not thread-safe, results are checked after join
+    vector<string> results(4);
+    vector<std::thread> threads;
+    for(size_t i = 0; i < results.size(); i++)
+    {
+        threads.emplace_back([&schema, &payload, &results, i]() {
+            ydk::path::Codec s{};
+            for(int n = 0; n < 50; n++)
+            {
+                auto & runner = schema.create_datanode("ydktest-sanity:runner", "");
+                runner.create_datanode("two/number", std::to_string(n));
+                auto dn = s.decode(schema, payload, EncodingFormat::XML);
+                results[i] = s.encode(*dn, EncodingFormat::XML, false);
+            }
+        });
+    }
+    for(auto & thread : threads)
+    {
+        thread.join();
+    }
+
+    for(auto & result : results)
+    {
+        REQUIRE(result == payload);
+    }
+}
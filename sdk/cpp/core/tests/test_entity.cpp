@@ -153,15 +153,12 @@ class TestEntity:public Entity
         {
             if(child_path == "multi-child")
             {
-                for(auto const& ch : multi_child)
+                auto ch = multi_child.get_by_segment_path(u);
+                if(ch != nullptr)
                 {
-                    string segment = ch->get_segment_path();
-                    if(u == segment)
-                    {
-                        return ch;
-                    }
+                    return ch;
                 }
-                auto ch = make_shared<TestEntity::Child::MultiChild>();
+                ch = make_shared<TestEntity::Child::MultiChild>();
                 ch->parent = this;
                 multi_child.push_back(ch);
                 return multi_child.back();
@@ -250,7 +247,7 @@ class TestEntity:public Entity
             YLeaf child_key;
         };
 
-        vector<shared_ptr<TestEntity::Child::MultiChild> > multi_child;
+        YList<TestEntity::Child::MultiChild> multi_child;
     };
 
   YLeaf name;
@@ -421,3 +418,30 @@ TEST_CASE("test_multi_read")
     auto m = test.child->get_child_by_name("multi-child", "multi-child[multi-key='abc']");
     REQUIRE(m != nullptr);
 }
+
+TEST_CASE("test_ylist_key_lookup")
+{
+    TestEntity test{};
+    for(auto key : {"a", "b", "c"})
+    {
+        auto m = test.child->get_child_by_name("multi-child", string{"multi-child[child-key='"} + key + "']");
+        m->set_value("child-key", key, "", "");
+    }
+    REQUIRE(test.child->multi_child.size() == 3);
+    REQUIRE(test.child->multi_child[1]->get_segment_path() == "multi-child[child-key='b']");
+
+    auto b = test.child->get_child_by_name("multi-child", "multi-child[child-key='b']");
+    REQUIRE(b == test.child->multi_child[1]);
+    REQUIRE(test.child->multi_child.size() == 3);
+    REQUIRE(test.child->multi_child.get({"c"}) == test.child->multi_child[2]);
+    REQUIRE(test.child->multi_child.get({"d"}) == nullptr);
+
+    // key changed after the entry was indexed
+    test.child->multi_child[2]->child_key = "d";
+    REQUIRE(test.child->multi_child.get({"c"}) == nullptr);
+    REQUIRE(test.child->multi_child.get({"d"}) == test.child->multi_child[2]);
+
+    test.child->multi_child.erase(test.child->multi_child.begin());
+    REQUIRE(test.child->multi_child.get({"a"}) == nullptr);
+    REQUIRE(test.child->multi_child.get({"b"}) == test.child->multi_child[0]);
+}
@@ -0,0 +1,140 @@
+/// YANG Development Kit
+// Copyright 2016 Cisco Systems. All rights reserved
+//
+////////////////////////////////////////////////////////////////
+// Licensed to the Apache Software Foundation (ASF) under one
+// or more contributor license agreements.  See the NOTICE file
+// distributed with this work for additional information
+// regarding copyright ownership.  The ASF licenses this file
+// to you under the Apache License, Version 2.0 (the
+// "License"); you may not use this file except in compliance
+// with the License.  You may obtain a copy of the License at
+//
+//   http://www.apache.org/licenses/LICENSE-2.0
+//
+//  Unless required by applicable law or agreed to in writing,
+// software distributed under the License is distributed on an
+// "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+// KIND, either express or implied.  See the License for the
+// specific language governing permissions and limitations
+// under the License.
+//
+//////////////////////////////////////////////////////////////////
+
+#include <algorithm>
+#include <string>
+#include "../src/netconf_tcp_client.hpp"
+#include "../src/errors.hpp"
+#include "catch.hpp"
+
+using namespace ydk;
+using namespace std;
+
+static string frame_chunks(const string & payload, size_t chunk_size)
+{
+    string framed;
+    for (size_t i = 0; i < payload.size(); i += chunk_size)
+    {
+        auto chunk = payload.substr(i, chunk_size);
+        framed += "\n#" + to_string(chunk.size()) + "\n" + chunk;
+    }
+    return framed + "\n##\n";
+}
+
+TEST_CASE("framing_chunked_split_anywhere")
+{
+    string payload{"<rpc-reply message-id=\"1\"><data>#12\n\n##\n]]>]]></data></rpc-reply>"};
+    string framed = frame_chunks(payload, 7);
+    for (size_t split = 1; split < framed.size(); split++)
+    {
+        NetconfFramingReader reader{};
+        reader.append(framed.data(), split);
+        REQUIRE(!reader.has_message());
+        reader.append(framed.data() + split, framed.size() - split);
+        REQUIRE(reader.has_message());
+        REQUIRE(reader.take_message() == payload);
+        REQUIRE(!reader.has_message());
+    }
+}
+
+TEST_CASE("framing_chunked_byte_by_byte")
+{
+    string payload(100000, 'x');
+    string framed = frame_chunks(payload, 4096);
+    NetconfFramingReader reader{};
+    for (char c : framed)
+    {
+        REQUIRE(!reader.has_message());
+        *reader.prepare(1) = c;
+        reader.commit(1);
+    }
+    REQUIRE(reader.take_message() == payload);
+}
+
+TEST_CASE("framing_chunked_messages_back_to_back")
+{
+    NetconfFramingReader reader{};
+    string framed = frame_chunks("<one/>", 3) + frame_chunks("<two/>", 100) + "\n#4";
+    reader.append(framed.data(), framed.size());
+    REQUIRE(reader.take_message() == "<one/>");
+    REQUIRE(reader.take_message() == "<two/>");
+    REQUIRE(!reader.has_message());
+    reader.append("\n<a/>\n##\n", 9);
+    REQUIRE(reader.take_message() == "<a/>");
+}
+
+TEST_CASE("framing_take_message_keeps_buffer")
+{
+    string payload(10000, 'x');
+    string framed = frame_chunks(payload, 4096);
+    NetconfFramingReader reader{};
+    char* room = reader.prepare(framed.size());
+    copy(framed.begin(), framed.end(), room);
+    reader.commit(framed.size());
+    REQUIRE(reader.take_message() == payload);
+    REQUIRE(reader.prepare(framed.size()) == room);
+}
+
+TEST_CASE("framing_read_payload")
+{
+    string payload{"<rpc-reply message-id=\"1\"><data>0123456789</data></rpc-reply>"};
+    string framed = frame_chunks(payload, 5) + frame_chunks("<next/>", 3);
+    NetconfFramingReader reader{};
+    string read;
+    char buffer[4];
+    for (size_t i = 0; i < framed.size(); i += 3)
+    {
+        reader.append(framed.data() + i, min<size_t>(3, framed.size() - i));
+        if (read.empty())
+        {
+            REQUIRE(payload.compare(0, reader.peek_payload().size(), reader.peek_payload()) == 0);
+        }
+        while (size_t size = reader.read_payload(buffer, sizeof(buffer)))
+        {
+            read.append(buffer, size);
+        }
+    }
+    REQUIRE(read == payload);
+    REQUIRE(reader.has_message());
+    REQUIRE(reader.take_message().empty());
+    REQUIRE(reader.take_message() == "<next/>");
+}
+
+TEST_CASE("framing_end_of_message")
+{
+    NetconfFramingReader reader{false};
+    reader.append("<hello/>]]>", 11);
+    REQUIRE(!reader.has_message());
+    reader.append("]]><rest", 8);
+    REQUIRE(reader.take_message() == "<hello/>");
+    REQUIRE(!reader.has_message());
+}
+
+TEST_CASE("framing_invalid_chunks")
+{
+    for (string framed : {"<rpc-reply/>", "\n#x\n", "\n#0\n", "\n#\n", "\n##x", "\n#12345678901\n"})
+    {
+        NetconfFramingReader reader{};
+        REQUIRE_THROWS_AS(reader.append(framed.data(), framed.size()), YCPPClientError);
+    }
+}
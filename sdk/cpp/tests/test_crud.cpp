@@ -22,6 +22,7 @@
 #include "catch.hpp"
 
 #include <ydk_ydktest/openconfig_bgp.hpp>
+#include <ydk_ydktest/ydktest_sanity.hpp>
 
 #include "config.hpp"
 
@@ -177,6 +178,79 @@ TEST_CASE("bgp_read_create")
     REQUIRE(reply);
 }
 
+TEST_CASE("bulk_create_read_delete")
+{
+    ydk::path::Repository repo{TEST_HOME};
+    NetconfServiceProvider provider{repo, "127.0.0.1", "admin", "admin", 12022};
+    CrudService crud{};
+    auto bgp = make_unique<openconfig_bgp::Bgp>();
+    auto runner = make_unique<ydktest_sanity::Runner>();
+    vector<Entity*> entities{bgp.get(), runner.get()};
+    bool reply = crud.delete_(provider, entities);
+    REQUIRE(reply);
+
+    config_bgp(bgp.get());
+    runner->ytypes->built_in_t->number8 = 10;
+    reply = crud.create(provider, entities);
+    REQUIRE(reply);
+
+    auto bgp_filter = make_unique<openconfig_bgp::Bgp>();
+    auto runner_filter = make_unique<ydktest_sanity::Runner>();
+    vector<Entity*> filters{runner_filter.get(), bgp_filter.get()};
+    auto read = crud.read_config(provider, filters);
+    REQUIRE(read.size() == 2);
+    ydktest_sanity::Runner * runner_read = dynamic_cast<ydktest_sanity::Runner*>(read[0].get());
+    openconfig_bgp::Bgp * bgp_read = dynamic_cast<openconfig_bgp::Bgp*>(read[1].get());
+    REQUIRE(runner_read != nullptr);
+    REQUIRE(bgp_read != nullptr);
+    REQUIRE(*runner_read == *runner);
+    REQUIRE(*bgp_read == *bgp);
+
+    reply = crud.delete_(provider, entities);
+    REQUIRE(reply);
+    read = crud.read_config(provider, filters);
+    REQUIRE(read[0] == nullptr);
+    REQUIRE(read[1] == nullptr);
+}
+
+TEST_CASE("bulk_read_same_top_entity")
+{
+    ydk::path::Repository repo{TEST_HOME};
+    NetconfServiceProvider provider{repo, "127.0.0.1", "admin", "admin", 12022};
+    CrudService crud{};
+    auto runner = make_unique<ydktest_sanity::Runner>();
+    bool reply = crud.delete_(provider, *runner);
+    REQUIRE(reply);
+
+    runner->one->number = 1;
+    runner->one->name = "runner:one:name";
+    runner->two->number = 2;
+    runner->two->name = "runner:two:name";
+    reply = crud.create(provider, *runner);
+    REQUIRE(reply);
+
+    auto one_filter = make_unique<ydktest_sanity::Runner>();
+    one_filter->one->number.yfilter = YFilter::read;
+    auto two_filter = make_unique<ydktest_sanity::Runner>();
+    two_filter->two->name.yfilter = YFilter::read;
+    vector<Entity*> filters{one_filter.get(), two_filter.get()};
+    auto read = crud.read_config(provider, filters);
+    REQUIRE(read.size() == 2);
+    ydktest_sanity::Runner * one_read = dynamic_cast<ydktest_sanity::Runner*>(read[0].get());
+    ydktest_sanity::Runner * two_read = dynamic_cast<ydktest_sanity::Runner*>(read[1].get());
+    REQUIRE(one_read != nullptr);
+    REQUIRE(two_read != nullptr);
+    CHECK(one_read->one->number.get() == "1");
+    CHECK(!one_read->one->name.is_set);
+    CHECK(!one_read->two->has_data());
+    CHECK(two_read->two->name.get() == "runner:two:name");
+    CHECK(!two_read->two->number.is_set);
+    CHECK(!two_read->one->has_data());
+
+    reply = crud.delete_(provider, *runner);
+    REQUIRE(reply);
+}
+
 TEST_CASE("read_leaves")
 {
     ydk::path::Repository repo{TEST_HOME};
@@ -49,3 +49,13 @@ TEST_CASE("get_capabilities")
     NetconfServiceProvider provider{ "127.0.0.1", "admin", "admin", 12022};
     CHECK_NOTHROW(provider.get_capabilities());
 }
+
+TEST_CASE("SharedRootSchemaP")
+{
+    NetconfServiceProvider provider{ "127.0.0.1", "admin", "admin", 12022};
+    NetconfServiceProvider shared_provider{provider.get_root_schema_ptr(), "127.0.0.1", "admin", "admin", 12022};
+
+    CHECK(shared_provider.get_root_schema_ptr() == provider.get_root_schema_ptr());
+    CHECK(&shared_provider.get_session().get_root_schema() == &provider.get_session().get_root_schema());
+    CHECK_FALSE(shared_provider.get_capabilities().empty());
+}
@@ -19,7 +19,10 @@
 #include <string.h>
 #include "../core/src/netconf_tcp_client.hpp"
 #include "../core/src/errors.hpp"
+#include <future>
 #include <iostream>
+#include <memory>
+#include <sys/resource.h>
 #include <sys/time.h>
 #include "catch.hpp"
 
@@ -404,3 +407,197 @@ TEST_CASE("tcp_multiple_clients")
     REQUIRE(result == 0);
 
 }
+
+// Sessions to test/tcp_stub_server.py, more than FD_SETSIZE of them
+TEST_CASE("tcp_multiplexer")
+{
+    const size_t sessions = 2000;
+    // libcurl may hold more than one descriptor per session
+    struct rlimit limit;
+    getrlimit(RLIMIT_NOFILE, &limit);
+    limit.rlim_cur = limit.rlim_max;
+    setrlimit(RLIMIT_NOFILE, &limit);
+
+    vector<unique_ptr<NetconfTCPClient>> owned;
+    vector<NetconfTCPClient*> clients;
+    vector<string> payloads;
+    for(size_t i = 0; i < sessions; i++)
+    {
+        owned.emplace_back(new NetconfTCPClient{"admin", "admin", "127.0.0.1", 12308});
+        REQUIRE(owned.back()->connect() == 0);
+        clients.push_back(owned.back().get());
+        payloads.push_back("<rpc xmlns=\"urn:ietf:params:xml:ns:netconf:base:1.0\"><get/></rpc>");
+    }
+
+    NetconfTCPMultiplexer multiplexer{60000};
+    auto replies = multiplexer.execute_payloads(clients, payloads);
+    REQUIRE(replies.size() == sessions);
+    for(auto & reply : replies)
+    {
+        REQUIRE(NULL != strstr(reply.c_str(), "<ok/>"));
+    }
+
+    // sessions stay usable on their own
+    string reply = clients.back()->execute_payload(payloads.back());
+    REQUIRE(NULL != strstr(reply.c_str(), "<ok/>"));
+}
+
+TEST_CASE("tcp_multiplexer_payloads_mismatch")
+{
+    NetconfTCPClient client{"admin", "admin", "127.0.0.1", 12308};
+    REQUIRE(client.connect() == 0);
+    NetconfTCPMultiplexer multiplexer{};
+    REQUIRE_THROWS_AS(multiplexer.execute_payloads({&client}, {}), YCPPInvalidArgumentError);
+}
+
+TEST_CASE("tcp_submit_out_of_order")
+{
+    NetconfTCPClient client{"admin", "admin", "127.0.0.1", 12308};
+    REQUIRE(client.connect() == 0);
+    string payload = "<rpc xmlns=\"urn:ietf:params:xml:ns:netconf:base:1.0\"><get/></rpc>";
+
+    vector<future<string>> replies;
+    for(size_t i = 0; i < 3; i++)
+    {
+        replies.push_back(client.submit(payload));
+    }
+    // replies read ahead are kept for their own futures
+    string third = replies[2].get();
+    string first = replies[0].get();
+    string second = replies[1].get();
+    REQUIRE(NULL != strstr(first.c_str(), "message-id=\"1\""));
+    REQUIRE(NULL != strstr(second.c_str(), "message-id=\"2\""));
+    REQUIRE(NULL != strstr(third.c_str(), "message-id=\"3\""));
+
+    string reply = client.execute_payload(payload);
+    REQUIRE(NULL != strstr(reply.c_str(), "message-id=\"4\""));
+}
+
+TEST_CASE("tcp_submit_dropped_future")
+{
+    NetconfTCPClient client{"admin", "admin", "127.0.0.1", 12308};
+    REQUIRE(client.connect() == 0);
+    string payload = "<rpc xmlns=\"urn:ietf:params:xml:ns:netconf:base:1.0\"><get/></rpc>";
+
+    // the reply to a dropped future is skipped, not kept
+    {
+        auto dropped = client.submit(payload);
+    }
+    string reply = client.execute_payload(payload);
+    REQUIRE(NULL != strstr(reply.c_str(), "message-id=\"2\""));
+}
+
+TEST_CASE("tcp_reply_without_message_id")
+{
+    NetconfTCPClient client{"admin", "admin", "127.0.0.1", 12308};
+    REQUIRE(client.connect() == 0);
+    string payload = "<rpc xmlns=\"urn:ietf:params:xml:ns:netconf:base:1.0\"><get/></rpc>";
+
+    auto first = client.submit(payload);
+    auto second = client.submit("<rpc xmlns=\"urn:ietf:params:xml:ns:netconf:base:1.0\"><get><no-message-id/></get></rpc>");
+    // the reply of the first rpc is read, then the session is closed
+    REQUIRE(NULL != strstr(first.get().c_str(), "message-id=\"1\""));
+    REQUIRE_THROWS_AS(second.get(), YCPPClientError);
+    REQUIRE_THROWS_AS(client.execute_payload(payload), YCPPClientError);
+}
+
+TEST_CASE("tcp_multiplexer_reply_read_ahead")
+{
+    NetconfTCPClient client{"admin", "admin", "127.0.0.1", 12308};
+    REQUIRE(client.connect() == 0);
+    string payload = "<rpc xmlns=\"urn:ietf:params:xml:ns:netconf:base:1.0\"><get/></rpc>";
+
+    // replies are matched by message-id, the one of the submitted rpc is
+    // kept for its future
+    auto first = client.submit(payload);
+    NetconfTCPMultiplexer multiplexer{60000};
+    auto replies = multiplexer.execute_payloads({&client}, {payload});
+    REQUIRE(NULL != strstr(replies[0].c_str(), "message-id=\"2\""));
+    REQUIRE(NULL != strstr(first.get().c_str(), "message-id=\"1\""));
+
+    // a reply already buffered by the client is taken without polling
+    auto second = client.submit(payload);
+    auto third = client.submit(payload);
+    REQUIRE(NULL != strstr(third.get().c_str(), "message-id=\"4\""));
+    replies = multiplexer.execute_payloads({&client}, {payload});
+    REQUIRE(NULL != strstr(replies[0].c_str(), "message-id=\"5\""));
+    REQUIRE(NULL != strstr(second.get().c_str(), "message-id=\"3\""));
+}
+
+TEST_CASE("tcp_execute_payloads_pipelined")
+{
+    NetconfTCPClient client{"admin", "admin", "127.0.0.1", 12308};
+    REQUIRE(client.connect() == 0);
+
+    // more payloads than MAX_OUTSTANDING_RPCS
+    vector<string> payloads(100, "<rpc xmlns=\"urn:ietf:params:xml:ns:netconf:base:1.0\"><get/></rpc>");
+    auto replies = client.execute_payloads(payloads);
+    REQUIRE(replies.size() == payloads.size());
+    for(size_t i = 0; i < replies.size(); i++)
+    {
+        string message_id = "message-id=\"" + to_string(i + 1) + "\"";
+        REQUIRE(NULL != strstr(replies[i].c_str(), message_id.c_str()));
+        REQUIRE(NULL != strstr(replies[i].c_str(), "<ok/>"));
+    }
+}
+
+TEST_CASE("tcp_stream_payload")
+{
+    NetconfTCPClient client{"admin", "admin", "127.0.0.1", 12308};
+    REQUIRE(client.connect() == 0);
+    string payload = "<rpc xmlns=\"urn:ietf:params:xml:ns:netconf:base:1.0\"><get/></rpc>";
+
+    // the reply to the rpc sent before is read ahead for its future
+    auto first = client.submit(payload);
+    {
+        auto reader = client.stream_payload(payload);
+        REQUIRE_THROWS_AS(client.submit(payload), YCPPClientError);
+        string reply;
+        char buffer[16];
+        while (size_t size = reader->read(buffer, sizeof(buffer)))
+        {
+            reply.append(buffer, size);
+        }
+        REQUIRE(NULL != strstr(reply.c_str(), "message-id=\"2\""));
+        REQUIRE(NULL != strstr(reply.c_str(), "<ok/>"));
+    }
+    REQUIRE(NULL != strstr(first.get().c_str(), "message-id=\"1\""));
+
+    // a reply left unread is skipped when the reader is destroyed
+    {
+        auto reader = client.stream_payload(payload);
+        char buffer[8];
+        REQUIRE(reader->read(buffer, sizeof(buffer)) > 0);
+    }
+    string reply = client.execute_payload(payload);
+    REQUIRE(NULL != strstr(reply.c_str(), "message-id=\"4\""));
+}
+
+// Throughput of receiving large replies from test/tcp_stub_server.py over
+// loopback, the time per MB should stay flat as replies grow:
+//   ./ydk_bundle_test "[benchmark]"
+TEST_CASE("bench_tcp_reply", "[.][benchmark]")
+{
+    NetconfTCPClient client{"admin", "admin", "127.0.0.1", 12308};
+    REQUIRE(client.connect() == 0);
+
+    cout << "TCP client replies over loopback:" << endl
+         << "  size      ms        MB/s" << endl;
+    for (size_t size : {1ul << 20, 10ul << 20, 50ul << 20, 200ul << 20})
+    {
+        string payload = "<rpc xmlns=\"urn:ietf:params:xml:ns:netconf:base:1.0\"><get><filter>"
+                         "<reply-size>" + to_string(size) + "</reply-size></filter></get></rpc>";
+        // the first reply warms up the stub server cache
+        client.execute_payload(payload);
+
+        struct timeval t1, t2;
+        gettimeofday(&t1, NULL);
+        string reply = client.execute_payload(payload);
+        gettimeofday(&t2, NULL);
+        double elapsed = (t2.tv_sec - t1.tv_sec) * 1000.0 + (t2.tv_usec - t1.tv_usec) / 1000.0;
+
+        REQUIRE(reply.size() > size / 2);
+        REQUIRE(NULL != strstr(reply.c_str() + reply.size() - 32, "</rpc-reply>"));
+        cout << "  " << (size >> 20) << " MB\t" << elapsed << "\t" << (reply.size() / 1048576.0) / (elapsed / 1000.0) << endl;
+    }
+}
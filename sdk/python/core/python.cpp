@@ -53,6 +53,7 @@ static object log_info;
 static object log_warning;
 static object log_error;
 static object log_critical;
+static object log_is_enabled_for;
 static bool added_nullhandler = false;
 static bool enabled_logging = false;
 
@@ -76,11 +77,32 @@ void add_null_handler(object logger)
     }
 }
 
-void debug(const char* msg) { log_debug(msg); }
-void info(const char* msg) { log_info(msg); }
-void warning(const char* msg) { log_warning(msg); }
-void error(const char* msg) { log_error(msg); }
-void critical(const char* msg) { log_critical(msg); }
+// logging callbacks may be invoked from C++ code running with the GIL released
+void debug(const char* msg) { gil_scoped_acquire acquire; log_debug(msg); }
+void info(const char* msg) { gil_scoped_acquire acquire; log_info(msg); }
+void warning(const char* msg) { gil_scoped_acquire acquire; log_warning(msg); }
+void error(const char* msg) { gil_scoped_acquire acquire; log_error(msg); }
+void critical(const char* msg) { gil_scoped_acquire acquire; log_critical(msg); }
+
+// Passes the level of the Python "ydk" logger on to the native logging, so
+// disabled messages are neither formatted nor passed back to Python. The
+// level is cached, changes take effect at the next call into the library.
+void refresh_logging_level()
+{
+    if (enabled_logging == false) { return; }
+    // Python levels of ydk::debug, ydk::info, ydk::warn, ydk::error and ydk::critical
+    static const std::pair<int, const char*> levels[] = {
+        {10, ydk::debug}, {20, ydk::info}, {30, ydk::warn}, {40, ydk::error}, {50, ydk::critical}};
+    for (auto const & level : levels)
+    {
+        if (log_is_enabled_for(level.first).cast<bool>())
+        {
+            ydk::set_logging_callback_level(level.second);
+            return;
+        }
+    }
+    ydk::set_logging_callback_level(ydk::off);
+}
 
 void setup_logging()
 {
@@ -95,14 +117,59 @@ void setup_logging()
         log_warning = logger.attr("warning");
         log_error = logger.attr("error");
         log_critical = logger.attr("critical");
+        log_is_enabled_for = logger.attr("isEnabledFor");
 
         ydk::set_logging_callback("debug", debug);
         ydk::set_logging_callback("info", info);
-        ydk::set_logging_callback("warning", warning);
+        ydk::set_logging_callback("warn", warning);
         ydk::set_logging_callback("error", error);
         ydk::set_logging_callback("critical", critical);
         enabled_logging = true;
     }
+    refresh_logging_level();
+}
+
+
+// Wraps a blocking member function so that it executes with the GIL released.
+// Python overrides in PyEntity re-acquire the GIL through PYBIND11_OVERLOAD.
+template <typename Return, typename Class, typename... Args>
+auto release_gil(Return (Class::*func)(Args...))
+{
+    return [func](Class & self, Args... args) -> Return {
+        refresh_logging_level();
+        gil_scoped_release release;
+        return (self.*func)(std::forward<Args>(args)...);
+    };
+}
+
+template <typename Return, typename Class, typename... Args>
+auto release_gil(Return (Class::*func)(Args...) const)
+{
+    return [func](const Class & self, Args... args) -> Return {
+        refresh_logging_level();
+        gil_scoped_release release;
+        return (self.*func)(std::forward<Args>(args)...);
+    };
+}
+
+// Wraps a function which keeps the GIL, such as the entity walkers calling
+// back into Python, so that it logs at the current level of the Python logger.
+template <typename Return, typename... Args>
+auto with_logging_level(Return (*func)(Args...))
+{
+    return [func](Args... args) -> Return {
+        refresh_logging_level();
+        return func(std::forward<Args>(args)...);
+    };
+}
+
+template <typename Return, typename Class, typename... Args>
+auto with_logging_level(Return (Class::*func)(Args...))
+{
+    return [func](Class & self, Args... args) -> Return {
+        refresh_logging_level();
+        return (self.*func)(std::forward<Args>(args)...);
+    };
 }
 
 
@@ -119,6 +186,125 @@ template<> struct type_caster<std::vector<ydk::path::SchemaNode *>> : ListCaster
 }}
 
 
+// Returns the attribute name of a generated entity, or a null object if it
+// was never accessed. Leafs and children are created on first access, the
+// walk must not create them.
+static object get_entity_attr(handle attrs, handle name)
+{
+    PyObject * value = PyDict_GetItem(attrs.ptr(), name.ptr());
+    return value == nullptr ? object() : reinterpret_borrow<object>(value);
+}
+
+// Walks a generated Python entity natively, driven by the descriptors the
+// generator emits on each class: _leaf_names, _leaf_list_names,
+// _child_container_names and _child_list_names. It mirrors has_data,
+// has_operation, get_entity_path and get_children, so the data node walker
+// gets the same nodes in the same order without calling into Python several
+// times per node. Returns false if an entity has no descriptors.
+static bool walk_py_entity(handle obj, const string & path, size_t parent, vector<ydk::EntityTreeNode> & tree,
+                           bool & has_data, bool & has_operation)
+{
+    if(!hasattr(obj, "_leaf_names"))
+        return false;
+
+    ydk::Entity & entity = obj.cast<ydk::Entity&>();
+    object attrs = obj.attr("__dict__");
+    vector<pair<string, ydk::LeafData>> value_paths;
+    has_data = false;
+    has_operation = entity.yfilter != ydk::YFilter::not_set;
+
+    for(auto name : obj.attr("_leaf_names"))
+    {
+        object value = get_entity_attr(attrs, name);
+        if(!value)
+            continue;
+        ydk::YLeaf & leaf = value.cast<ydk::YLeaf&>();
+        has_data |= leaf.is_set;
+        has_operation |= leaf.yfilter != ydk::YFilter::not_set;
+        if(leaf.is_set || leaf.yfilter != ydk::YFilter::not_set)
+            value_paths.push_back(leaf.get_name_leafdata());
+    }
+    for(auto name : obj.attr("_leaf_list_names"))
+    {
+        object value = get_entity_attr(attrs, name);
+        if(!value)
+            continue;
+        ydk::YLeafList & leaf_list = value.cast<ydk::YLeafList&>();
+        has_operation |= leaf_list.yfilter != ydk::YFilter::not_set;
+        for(auto & leaf : leaf_list.getYLeafs())
+        {
+            has_data |= leaf.yfilter != ydk::YFilter::not_set;
+            has_operation |= leaf.is_set;
+        }
+        auto name_values = leaf_list.get_name_leafdata();
+        value_paths.insert(value_paths.end(), name_values.begin(), name_values.end());
+    }
+
+    size_t index = tree.size();
+    tree.emplace_back(parent, ydk::EntityPath{path, value_paths}, entity.yfilter);
+
+    // get_children() returns a map keyed by attribute name for containers
+    // and by segment path for list entries, later entries replace earlier
+    // ones of the same key.
+    vector<pair<string, object>> candidates;
+    for(auto name : obj.attr("_child_container_names"))
+    {
+        object child = get_entity_attr(attrs, name);
+        if(child && isinstance<ydk::Entity>(child))
+            candidates.emplace_back(name.cast<string>(), child);
+    }
+    for(auto name : obj.attr("_child_list_names"))
+    {
+        object children = get_entity_attr(attrs, name);
+        if(!children)
+            continue;
+        for(auto child : children)
+        {
+            if(isinstance<ydk::Entity>(child))
+                candidates.emplace_back(child.attr("get_segment_path")().cast<string>(), reinterpret_borrow<object>(child));
+        }
+    }
+    map<string, size_t> children;
+    for(size_t i = 0; i < candidates.size(); i++)
+        children[candidates[i].first] = i;
+
+    vector<bool> walked(candidates.size(), false);
+    auto walk_child = [&](size_t i) {
+        object & child = candidates[i].second;
+        ydk::Entity & child_entity = child.cast<ydk::Entity&>();
+        string child_path;
+        if(child_entity.parent == &entity)
+            child_path = child.attr("get_segment_path")().cast<string>();
+        else
+            child_path = child_entity.get_entity_path(child_entity.parent).path;
+
+        bool child_has_data = false, child_has_operation = false;
+        size_t child_index = tree.size();
+        if(!walk_py_entity(child, child_path, index, tree, child_has_data, child_has_operation))
+            return false;
+        if(!(child_has_operation || child_has_data || child_entity.is_presence_container) || !walked[i])
+            tree.erase(tree.begin() + child_index, tree.end());
+        has_data |= child_has_data || child_entity.is_presence_container;
+        has_operation |= child_has_operation;
+        return true;
+    };
+
+    for(auto const & child : children)
+    {
+        walked[child.second] = true;
+        if(!walk_child(child.second))
+            return false;
+    }
+    // replaced entries are not encoded, but still count for has_data and
+    // has_operation of the parent
+    for(size_t i = 0; i < candidates.size(); i++)
+    {
+        if(!walked[i] && !walk_child(i))
+            return false;
+    }
+    return true;
+}
+
 class PyEntity: public ydk::Entity {
 public:
 
@@ -213,6 +399,29 @@ public:
             get_children,
         );
     }
+
+    vector<ydk::EntityTreeNode> get_entity_tree() const override {
+        gil_scoped_acquire acquire;
+        function get_entity_path = get_overload(static_cast<const ydk::Entity*>(this), "get_entity_path");
+        if(!get_entity_path)
+            return {};
+
+        object self = get_entity_path.attr("__self__");
+        vector<ydk::EntityTreeNode> tree;
+        bool has_data = false, has_operation = false;
+        try
+        {
+            string path = get_entity_path(none()).cast<ydk::EntityPath>().path;
+            if(!walk_py_entity(self, path, 0, tree, has_data, has_operation))
+                return {};
+        }
+        catch(const cast_error &)
+        {
+            // unexpected attribute types, walk node by node instead
+            return {};
+        }
+        return tree;
+    }
 };
 
 class PyYLeafList : public ydk::YLeafList {
@@ -278,10 +487,20 @@ PYBIND11_PLUGIN(ydk_)
 
     class_<ydk::path::Session>(path, "Session")
         .def("get_root_schema", &ydk::path::Session::get_root_schema, return_value_policy::reference)
-        .def("invoke", &ydk::path::Session::invoke, return_value_policy::reference);
+        .def("invoke", release_gil(&ydk::path::Session::invoke), return_value_policy::reference);
 
     class_<ydk::path::NetconfSession, ydk::path::Session>(path, "NetconfSession")
-        .def(init<ydk::path::Repository&, const std::string&, const std::string, const std::string, int, const std::string&, bool>(),
+        .def("__init__",
+             [](ydk::path::NetconfSession &session, ydk::path::Repository& repo,
+                                                    const std::string& address,
+                                                    const std::string& username,
+                                                    const std::string& password,
+                                                    int port,
+                                                    const std::string& protocol,
+                                                    bool on_demand) {
+                gil_scoped_release release;
+                new(&session) ydk::path::NetconfSession(repo, address, username, password, port, protocol, on_demand);
+             },
              arg("repo"),
              arg("address"),
              arg("username"),
@@ -289,7 +508,17 @@ PYBIND11_PLUGIN(ydk_)
              arg("port") = 830,
              arg("protocol") = string("ssh"),
              arg("on_demand") = true)
-        .def(init<const std::string&, const std::string&, const std::string&, int, const std::string&, bool, bool>(),
+        .def("__init__",
+             [](ydk::path::NetconfSession &session, const std::string& address,
+                                                    const std::string& username,
+                                                    const std::string& password,
+                                                    int port,
+                                                    const std::string& protocol,
+                                                    bool on_demand,
+                                                    bool common_cache) {
+                gil_scoped_release release;
+                new(&session) ydk::path::NetconfSession(address, username, password, port, protocol, on_demand, common_cache);
+             },
              arg("address"),
              arg("username"),
              arg("password"),
@@ -297,8 +526,25 @@ PYBIND11_PLUGIN(ydk_)
              arg("protocol") = string("ssh"),
              arg("on_demand") = true,
              arg("common_cache") = false)
+        .def("__init__",
+             [](ydk::path::NetconfSession &session, const std::shared_ptr<ydk::path::RootSchemaNode>& root_schema,
+                                                    const std::string& address,
+                                                    const std::string& username,
+                                                    const std::string& password,
+                                                    int port,
+                                                    const std::string& protocol) {
+                gil_scoped_release release;
+                new(&session) ydk::path::NetconfSession(root_schema, address, username, password, port, protocol);
+             },
+             arg("root_schema"),
+             arg("address"),
+             arg("username"),
+             arg("password"),
+             arg("port") = 830,
+             arg("protocol") = string("ssh"))
         .def("get_root_schema", &ydk::path::NetconfSession::get_root_schema, return_value_policy::reference)
-        .def("invoke", &ydk::path::NetconfSession::invoke, return_value_policy::reference);
+        .def("invoke", release_gil(&ydk::path::NetconfSession::invoke), return_value_policy::reference)
+        .def("invoke_many", release_gil(&ydk::path::NetconfSession::invoke_many));
 
     class_<ydk::path::RestconfSession, ydk::path::Session>(path, "RestconfSession")
         .def("__init__",
@@ -310,6 +556,7 @@ PYBIND11_PLUGIN(ydk_)
                                                      ydk::EncodingFormat encoding,
                                                      const std::string& config_url_root,
                                                      const std::string& state_url_root) {
+                gil_scoped_release release;
                 new(&session) ydk::path::RestconfSession(repo, address, username, password, port, encoding, config_url_root, state_url_root);
              },
              arg("repo"),
@@ -321,7 +568,7 @@ PYBIND11_PLUGIN(ydk_)
              arg("config_url_root"),
              arg("state_url_root"))
         .def("get_root_schema", &ydk::path::RestconfSession::get_root_schema, return_value_policy::reference)
-        .def("invoke", &ydk::path::RestconfSession::invoke, return_value_policy::reference);
+        .def("invoke", release_gil(&ydk::path::RestconfSession::invoke), return_value_policy::reference);
 
     class_<ydk::path::Statement>(path, "Statement")
         .def(init<const string &, const string &>(), arg("keyword"), arg("arg"))
@@ -371,7 +618,7 @@ PYBIND11_PLUGIN(ydk_)
         .def("get_schema_node", &ydk::path::Rpc::get_schema_node, return_value_policy::reference)
         .def("get_input_node", &ydk::path::Rpc::get_input_node, return_value_policy::reference)
         .def("has_output_node", &ydk::path::Rpc::has_output_node)
-        .def("__call__", &ydk::path::Rpc::operator(), arg("service_provider"));
+        .def("__call__", release_gil(&ydk::path::Rpc::operator()), arg("service_provider"));
 
     class_<ydk::path::Repository>(path, "Repository")
         .def(init<>())
@@ -379,21 +626,21 @@ PYBIND11_PLUGIN(ydk_)
         .def(init<const string&>())
         .def(init<const string&, ydk::path::ModelCachingOption>())
         .def("create_root_schema",
-            (std::shared_ptr<ydk::path::RootSchemaNode> (ydk::path::Repository::*)(const std::vector<ydk::path::Capability>&)) &ydk::path::Repository::create_root_schema,
+            release_gil((std::shared_ptr<ydk::path::RootSchemaNode> (ydk::path::Repository::*)(const std::vector<ydk::path::Capability>&)) &ydk::path::Repository::create_root_schema),
             return_value_policy::move)
         .def("create_root_schema",
-            (std::shared_ptr<ydk::path::RootSchemaNode> (ydk::path::Repository::*)(const std::vector<std::unordered_map<std::string, ydk::path::Capability>>& lookup_tables,
-                                                                                   const std::vector<ydk::path::Capability>& caps_to_load))
-            &ydk::path::Repository::create_root_schema,
+            release_gil((std::shared_ptr<ydk::path::RootSchemaNode> (ydk::path::Repository::*)(const std::vector<std::unordered_map<std::string, ydk::path::Capability>>& lookup_tables,
+                                                                                               const std::vector<ydk::path::Capability>& caps_to_load))
+            &ydk::path::Repository::create_root_schema),
             return_value_policy::move);
 
     class_<ydk::path::Codec> codec(path, "Codec");
 
     codec
         .def(init<>())
-        .def("encode", &ydk::path::Codec::encode, arg("data_node"), arg("encoding"), arg("pretty"))
-        .def("decode", &ydk::path::Codec::decode, arg("root_schema_node"), arg("payload"), arg("encoding"))
-        .def("decode_rpc_output", &ydk::path::Codec::decode_rpc_output, arg("root_schema_node"), arg("payload"), arg("rpc_path"), arg("encoding"));
+        .def("encode", release_gil(&ydk::path::Codec::encode), arg("data_node"), arg("encoding"), arg("pretty"))
+        .def("decode", release_gil(&ydk::path::Codec::decode), arg("root_schema_node"), arg("payload"), arg("encoding"))
+        .def("decode_rpc_output", release_gil(&ydk::path::Codec::decode_rpc_output), arg("root_schema_node"), arg("payload"), arg("rpc_path"), arg("encoding"));
 
     enum_<ydk::DataStore>(services, "Datastore")
         .value("candidate", ydk::DataStore::candidate)
@@ -538,6 +785,9 @@ PYBIND11_PLUGIN(ydk_)
         .def("set", (void (ydk::YLeaf::*)(std::string)) &ydk::YLeaf::set, arg("value"))
         .def("set", (void (ydk::YLeaf::*)(ydk::Enum::YLeaf)) &ydk::YLeaf::set, arg("value"))
         .def("set", (void (ydk::YLeaf::*)(ydk::Decimal64)) &ydk::YLeaf::set, arg("value"))
+        // typed setters used by ydk.types.Entity, skipping the overload resolution of set
+        .def("_set_string", (void (ydk::YLeaf::*)(std::string)) &ydk::YLeaf::set, arg("value"))
+        .def("_set_int64", (void (ydk::YLeaf::*)(ydk::int64)) &ydk::YLeaf::set, arg("value"))
         .def_readonly("is_set", &ydk::YLeaf::is_set, return_value_policy::reference)
         .def_readwrite("yfilter", &ydk::YLeaf::yfilter)
         .def_readwrite("value_namespace", &ydk::YLeaf::value_namespace)
@@ -576,6 +826,7 @@ PYBIND11_PLUGIN(ydk_)
     class_<ydk::NetconfServiceProvider, ydk::ServiceProvider>(providers, "NetconfServiceProvider")
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider, ydk::path::Repository& repo, const string& address, const string& username, const string& password, int port, const string& protocol, bool on_demand) {
+                    gil_scoped_release release;
                     new(&nc_provider) ydk::NetconfServiceProvider(repo, address, username, password, port, protocol, on_demand);
             },
             arg("repo"),
@@ -585,8 +836,20 @@ PYBIND11_PLUGIN(ydk_)
             arg("port")=830,
             arg("protocol")=string("ssh"),
             arg("on_demand")=true)
+        .def("__init__",
+            [](ydk::NetconfServiceProvider &nc_provider, const std::shared_ptr<ydk::path::RootSchemaNode>& root_schema, const string& address, const string& username, const string& password, int port, const string& protocol) {
+                    gil_scoped_release release;
+                    new(&nc_provider) ydk::NetconfServiceProvider(root_schema, address, username, password, port, protocol);
+            },
+            arg("root_schema"),
+            arg("address"),
+            arg("username"),
+            arg("password"),
+            arg("port")=830,
+            arg("protocol")=string("ssh"))
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider, const string& address, const string& username, const string& password, int port, const string& protocol, bool on_demand, bool common_cache) {
+                    gil_scoped_release release;
                     new(&nc_provider) ydk::NetconfServiceProvider(address, username, password, port, protocol, on_demand, common_cache);
             },
             arg("address"),
@@ -598,6 +861,7 @@ PYBIND11_PLUGIN(ydk_)
             arg("common_cache")=false)
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider, const string& address, const string& username, const string& password, void* port, const string& protocol, bool on_demand, bool common_cache) {
+                    gil_scoped_release release;
                     new(&nc_provider) ydk::NetconfServiceProvider(address, username, password, 830, protocol, on_demand, common_cache);
             },
             arg("address"),
@@ -609,6 +873,7 @@ PYBIND11_PLUGIN(ydk_)
             arg("common_cache")=false)
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider, const string& address, const string& username, const string& password, int port, bool on_demand, bool common_cache) {
+                    gil_scoped_release release;
                     new(&nc_provider) ydk::NetconfServiceProvider(address, username, password, port, "ssh", on_demand, common_cache);
             },
             arg("address"),
@@ -619,6 +884,7 @@ PYBIND11_PLUGIN(ydk_)
             arg("common_cache")=false)
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider, const string& address, const string& username, const string& password, bool on_demand, bool common_cache) {
+                    gil_scoped_release release;
                     new(&nc_provider) ydk::NetconfServiceProvider(address, username, password, 830, "ssh", on_demand, common_cache);
             },
             arg("address"),
@@ -628,6 +894,7 @@ PYBIND11_PLUGIN(ydk_)
             arg("common_cache")=false)
         .def("get_encoding", &ydk::NetconfServiceProvider::get_encoding, return_value_policy::reference)
         .def("get_session", &ydk::NetconfServiceProvider::get_session, return_value_policy::reference)
+        .def("get_root_schema", &ydk::NetconfServiceProvider::get_root_schema_ptr)
         .def("get_capabilities", &ydk::NetconfServiceProvider::get_capabilities, return_value_policy::reference);
 
     class_<ydk::RestconfServiceProvider, ydk::ServiceProvider>(providers, "RestconfServiceProvider")
@@ -644,90 +911,115 @@ PYBIND11_PLUGIN(ydk_)
 
     class_<ydk::CrudService>(services, "CRUDService")
         .def(init<>())
-        .def("create", &ydk::CrudService::create, return_value_policy::reference)
-        .def("read", &ydk::CrudService::read)
-        .def("read_config", &ydk::CrudService::read_config)
-        .def("update", &ydk::CrudService::update, return_value_policy::reference)
-        .def("delete", &ydk::CrudService::delete_, return_value_policy::reference);
+        .def("create", release_gil((bool (ydk::CrudService::*)(ydk::ServiceProvider&, ydk::Entity&)) &ydk::CrudService::create), return_value_policy::reference)
+        .def("read", release_gil((shared_ptr<ydk::Entity> (ydk::CrudService::*)(ydk::ServiceProvider&, ydk::Entity&)) &ydk::CrudService::read))
+        .def("read_config", release_gil((shared_ptr<ydk::Entity> (ydk::CrudService::*)(ydk::ServiceProvider&, ydk::Entity&)) &ydk::CrudService::read_config))
+        .def("update", release_gil((bool (ydk::CrudService::*)(ydk::ServiceProvider&, ydk::Entity&)) &ydk::CrudService::update), return_value_policy::reference)
+        .def("delete", release_gil((bool (ydk::CrudService::*)(ydk::ServiceProvider&, ydk::Entity&)) &ydk::CrudService::delete_), return_value_policy::reference)
+        .def("create_many", release_gil((bool (ydk::CrudService::*)(ydk::ServiceProvider&, vector<ydk::Entity*>&)) &ydk::CrudService::create), return_value_policy::reference)
+        .def("read_many", release_gil((vector<shared_ptr<ydk::Entity>> (ydk::CrudService::*)(ydk::ServiceProvider&, vector<ydk::Entity*>&)) &ydk::CrudService::read))
+        .def("read_config_many", release_gil((vector<shared_ptr<ydk::Entity>> (ydk::CrudService::*)(ydk::ServiceProvider&, vector<ydk::Entity*>&)) &ydk::CrudService::read_config))
+        .def("update_many", release_gil((bool (ydk::CrudService::*)(ydk::ServiceProvider&, vector<ydk::Entity*>&)) &ydk::CrudService::update), return_value_policy::reference)
+        .def("delete_many", release_gil((bool (ydk::CrudService::*)(ydk::ServiceProvider&, vector<ydk::Entity*>&)) &ydk::CrudService::delete_), return_value_policy::reference)
+        // the stream decodes with the root schema of provider
+        .def("read_iter", release_gil(&ydk::CrudService::read_iter), keep_alive<0, 2>())
+        .def("read_config_iter", release_gil(&ydk::CrudService::read_config_iter), keep_alive<0, 2>());
+
+    class_<ydk::EntityStream>(services, "EntityStream")
+        .def("next", release_gil(&ydk::EntityStream::next));
 
     class_<ydk::ExecutorService>(services, "ExecutorService")
         .def(init<>())
-        .def("execute_rpc", &ydk::ExecutorService::execute_rpc, arg("provider"), arg("entity"),
+        .def("execute_rpc", release_gil(&ydk::ExecutorService::execute_rpc), arg("provider"), arg("entity"),
             arg("top_entity") = nullptr);
 
     class_<ydk::NetconfService>(services, "NetconfService")
         .def(init<>())
-        .def("cancel_commit", &ydk::NetconfService::cancel_commit,
+        .def("cancel_commit", release_gil(&ydk::NetconfService::cancel_commit),
             arg("provider"), arg("persist-id") = -1,
             return_value_policy::reference)
-        .def("close_session", &ydk::NetconfService::close_session,
+        .def("close_session", release_gil(&ydk::NetconfService::close_session),
             arg("provider"))
-        .def("commit", &ydk::NetconfService::commit,
+        .def("commit", release_gil(&ydk::NetconfService::commit),
             arg("provider"), arg("confirmed") = false,
             arg("confirm_timeout") = -1, arg("persist") = -1,
             arg("persist-id") = -1, return_value_policy::reference)
-        .def("copy_config", (bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&,
+        .def("copy_config", release_gil((bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&,
             ydk::DataStore,
             ydk::DataStore,
-            std::string)) &ydk::NetconfService::copy_config,
+            std::string)) &ydk::NetconfService::copy_config),
             arg("provider"),
             arg("target"),
             arg("source"),
             arg("url") = std::string{""},
             return_value_policy::reference)
-        .def("copy_config", (bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&,
+        .def("copy_config", release_gil((bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&,
             ydk::DataStore,
-            ydk::Entity&)) &ydk::NetconfService::copy_config,
+            ydk::Entity&)) &ydk::NetconfService::copy_config),
             arg("provider"),
             arg("target"),
             arg("source_config"),
             return_value_policy::reference)
-        .def("delete_config", &ydk::NetconfService::delete_config,
+        .def("delete_config", release_gil(&ydk::NetconfService::delete_config),
             arg("provider"), arg("target"), arg("url") = std::string{""},
             return_value_policy::reference)
-        .def("discard_changes", &ydk::NetconfService::discard_changes,
+        .def("discard_changes", release_gil(&ydk::NetconfService::discard_changes),
             arg("provider"), return_value_policy::reference)
-        .def("edit_config", &ydk::NetconfService::edit_config,
+        .def("edit_config", release_gil((bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&,
+            ydk::DataStore,
+            ydk::Entity&,
+            std::string,
+            std::string,
+            std::string)) &ydk::NetconfService::edit_config),
+            arg("provider"), arg("target"), arg("config"),
+            arg("default_operation") = std::string{""}, arg("test_option") = std::string{""},
+            arg("error_option") = std::string{""}, return_value_policy::reference)
+        .def("edit_config", release_gil((bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&,
+            ydk::DataStore,
+            vector<ydk::Entity*>&,
+            std::string,
+            std::string,
+            std::string)) &ydk::NetconfService::edit_config),
             arg("provider"), arg("target"), arg("config"),
             arg("default_operation") = std::string{""}, arg("test_option") = std::string{""},
             arg("error_option") = std::string{""}, return_value_policy::reference)
-        .def("get_config", &ydk::NetconfService::get_config,
+        .def("get_config", release_gil(&ydk::NetconfService::get_config),
             arg("provider"), arg("source"), arg("filter"))
-        .def("get", &ydk::NetconfService::get,
+        .def("get", release_gil(&ydk::NetconfService::get),
             arg("provider"), arg("filter"), return_value_policy::reference)
-        .def("kill_session", &ydk::NetconfService::kill_session,
+        .def("kill_session", release_gil(&ydk::NetconfService::kill_session),
             arg("provider"), arg("session_id"), return_value_policy::reference)
-        .def("lock", &ydk::NetconfService::lock,
+        .def("lock", release_gil(&ydk::NetconfService::lock),
             arg("provider"), arg("target"), return_value_policy::reference)
-        .def("unlock", &ydk::NetconfService::unlock,
+        .def("unlock", release_gil(&ydk::NetconfService::unlock),
             arg("provider"), arg("target"), return_value_policy::reference)
         .def("validate",
-            (bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&,
+            release_gil((bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&,
             ydk::DataStore,
-            std::string)) &ydk::NetconfService::validate,
+            std::string)) &ydk::NetconfService::validate),
             "doc",
             arg("provider"),
             arg("source"),
             arg("url") = std::string{""},
             return_value_policy::reference)
         .def("validate",
-            (bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&,
-            ydk::Entity&)) &ydk::NetconfService::validate,
+            release_gil((bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&,
+            ydk::Entity&)) &ydk::NetconfService::validate),
             arg("provider"),
             arg("source_config"),
             return_value_policy::reference);
 
     class_<ydk::XmlSubtreeCodec>(entity_utils, "XmlSubtreeCodec")
         .def(init<>())
-        .def("encode", &ydk::XmlSubtreeCodec::encode, return_value_policy::reference)
-        .def("decode", &ydk::XmlSubtreeCodec::decode);
+        .def("encode", with_logging_level(&ydk::XmlSubtreeCodec::encode), return_value_policy::reference)
+        .def("decode", with_logging_level(&ydk::XmlSubtreeCodec::decode));
 
     entity_utils.def("get_relative_entity_path", &ydk::get_relative_entity_path);
-    entity_utils.def("get_entity_from_data_node", &ydk::get_entity_from_data_node);
+    entity_utils.def("get_entity_from_data_node", with_logging_level(&ydk::get_entity_from_data_node));
     #if defined(PYBIND11_OVERLOAD_CAST)
-    entity_utils.def("get_data_node_from_entity", overload_cast<ydk::Entity&, ydk::path::RootSchemaNode&>(&ydk::get_data_node_from_entity), return_value_policy::reference);
+    entity_utils.def("get_data_node_from_entity", with_logging_level(overload_cast<ydk::Entity&, ydk::path::RootSchemaNode&>(&ydk::get_data_node_from_entity)), return_value_policy::reference);
     #else
-    entity_utils.def("get_data_node_from_entity", static_cast<ydk::path::DataNode& (*)(ydk::Entity&, ydk::path::RootSchemaNode&)>(&ydk::get_data_node_from_entity), return_value_policy::reference);
+    entity_utils.def("get_data_node_from_entity", with_logging_level(static_cast<ydk::path::DataNode& (*)(ydk::Entity&, ydk::path::RootSchemaNode&)>(&ydk::get_data_node_from_entity)), return_value_policy::reference);
     #endif
 
     ydk.def("is_set", &ydk::is_set);
@@ -19,6 +19,7 @@
 from __future__ import print_function
 import os
 import subprocess
+import sys
 import sysconfig
 
 from setuptools.command.build_ext import build_ext
@@ -47,8 +48,12 @@ LONG_DESCRIPTION = '''
                    '''
 
 
-YDK_PACKAGES = find_packages(exclude=['contrib', 'docs*', 'tests*',
-                                      'ncclient', 'samples'])
+YDK_EXCLUDED_PACKAGES = ['contrib', 'docs*', 'tests*', 'ncclient', 'samples']
+if sys.version_info < (3, 5):
+    # ydk.aio is written with async/await
+    YDK_EXCLUDED_PACKAGES.append('ydk.aio')
+
+YDK_PACKAGES = find_packages(exclude=YDK_EXCLUDED_PACKAGES)
 
 
 class CMakeExtension(Extension):
@@ -0,0 +1,54 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""bench_decode_list.py
+Decode time of a YANG list by number of entries, the time per entry
+should stay flat as the list grows.
+
+    python bench_decode_list.py [entries ...]
+"""
+from __future__ import print_function
+import sys
+import timeit
+
+from ydk.models.ydktest import ydktest_sanity as ysanity
+from ydk.providers import CodecServiceProvider
+from ydk.services import CodecService
+
+
+def get_payload(codec, provider, entries):
+    runner = ysanity.Runner()
+    for i in range(entries):
+        ldata = ysanity.Runner.OneList.Ldata()
+        ldata.number = i
+        ldata.name = str(i)
+        runner.one_list.ldata.append(ldata)
+    return codec.encode(provider, runner)
+
+
+def main(sizes):
+    codec = CodecService()
+    provider = CodecServiceProvider(type='xml')
+    print('{:>10} {:>12} {:>14}'.format('entries', 'decode (s)', 'per entry (us)'))
+    for entries in sizes:
+        payload = get_payload(codec, provider, entries)
+        seconds = min(timeit.repeat(lambda: codec.decode(provider, payload), number=1, repeat=3))
+        print('{:>10} {:>12.3f} {:>14.1f}'.format(entries, seconds, seconds / entries * 1e6))
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1250, 2500, 5000, 10000, 20000]
+    main(sizes)
@@ -0,0 +1,62 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""bench_diff.py
+Time of DiffService.diff between two YANG lists which differ in one leaf,
+by number of entries, and size of the encoded delta against the encoded
+list. The time per entry should stay flat as the list grows.
+
+    python bench_diff.py [entries ...]
+"""
+from __future__ import print_function
+import sys
+import timeit
+
+from ydk.models.ydktest import ydktest_sanity as ysanity
+from ydk.providers import CodecServiceProvider
+from ydk.services import CodecService, DiffService
+
+
+def get_runner(entries):
+    runner = ysanity.Runner()
+    for i in range(entries):
+        ldata = ysanity.Runner.OneList.Ldata()
+        ldata.number = i
+        ldata.name = str(i)
+        runner.one_list.ldata.append(ldata)
+    return runner
+
+
+def main(sizes):
+    codec = CodecService()
+    provider = CodecServiceProvider(type='xml')
+    diff = DiffService()
+    print('{:>10} {:>10} {:>14} {:>12} {:>12}'.format(
+        'entries', 'diff (s)', 'per entry (us)', 'full (B)', 'delta (B)'))
+    for entries in sizes:
+        current = get_runner(entries)
+        desired = get_runner(entries)
+        desired.one_list.ldata.get(entries // 2).name = 'changed'
+        seconds = min(timeit.repeat(lambda: diff.diff(desired, current), number=1, repeat=3))
+        full = len(codec.encode(provider, desired))
+        delta = len(codec.encode(provider, diff.diff(desired, current)))
+        print('{:>10} {:>10.3f} {:>14.1f} {:>12} {:>12}'.format(
+            entries, seconds, seconds / entries * 1e6, full, delta))
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [12500, 25000, 50000, 100000]
+    main(sizes)
@@ -0,0 +1,52 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""bench_entity_init.py
+Construction time and memory of a top level entity, e.g.
+
+    python bench_entity_init.py ydk.models.cisco_ios_xr.Cisco_IOS_XR_ifmgr_cfg InterfaceConfigurations
+"""
+from __future__ import print_function
+import sys
+import timeit
+import importlib
+
+
+def get_memory(entity_class, count):
+    import tracemalloc
+    tracemalloc.start()
+    entities = [entity_class() for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entities
+    return size
+
+
+def main(module_name, class_name, count=100):
+    entity_class = importlib.import_module(module_name)
+    for name in class_name.split('.'):
+        entity_class = getattr(entity_class, name)
+
+    seconds = min(timeit.repeat(entity_class, number=count, repeat=3))
+    print('{}.{}'.format(module_name, class_name))
+    print('{:>20} {:>10.1f}'.format('construct (us)', seconds / count * 1e6))
+    if sys.version_info >= (3, 4):
+        print('{:>20} {:>10.1f}'.format('memory (KiB)', get_memory(entity_class, count) / count / 1024.0))
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:] or ['ydk.models.ydktest.ydktest_sanity', 'Runner']
+    main(*args)
@@ -0,0 +1,74 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""bench_entity_path.py
+Path computation and encode time of three nested YANG lists.
+
+    python bench_entity_path.py [entries per level]
+"""
+from __future__ import print_function
+import sys
+import timeit
+
+from ydk.models.ydktest import ydktest_sanity as ysanity
+from ydk.providers import CodecServiceProvider
+from ydk.services import CodecService
+
+
+def build(width):
+    runner = ysanity.Runner()
+    entities = []
+    for i in range(width):
+        ldata = ysanity.Runner.ThreeList.Ldata()
+        ldata.number = i
+        runner.three_list.ldata.append(ldata)
+        for j in range(width):
+            subl1 = ysanity.Runner.ThreeList.Ldata.Subl1()
+            subl1.number = j
+            ldata.subl1.append(subl1)
+            for k in range(width):
+                sub_subl1 = ysanity.Runner.ThreeList.Ldata.Subl1.SubSubl1()
+                sub_subl1.number = k
+                sub_subl1.name = str(k)
+                subl1.sub_subl1.append(sub_subl1)
+                entities.append(sub_subl1)
+    return runner, entities
+
+
+def main(width):
+    codec = CodecService()
+    provider = CodecServiceProvider(type='xml')
+    runner, entities = build(width)
+
+    def parent_paths():
+        for entity in entities:
+            entity.get_entity_path(entity.parent)
+
+    def top_paths():
+        for entity in entities:
+            entity.get_entity_path(runner)
+
+    print('{} entities at depth 4'.format(len(entities)))
+    for name, run in (('get_entity_path(parent)', parent_paths),
+                      ('get_entity_path(top)', top_paths),
+                      ('encode', lambda: codec.encode(provider, runner)),
+                      ('encode subtree', lambda: codec.encode(provider, runner, subtree=True))):
+        seconds = min(timeit.repeat(run, number=1, repeat=3))
+        print('{:>24} {:>10.3f} s'.format(name, seconds))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
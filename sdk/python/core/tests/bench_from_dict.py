@@ -0,0 +1,56 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""bench_from_dict.py
+Time of building a list of entries one attribute at a time, with
+Entity.from_dict, and of exporting it with to_dict. The ydktest bundle
+has no interface model, the entries stand in for interface configs.
+
+    python bench_from_dict.py [entries]
+"""
+from __future__ import print_function
+import sys
+import timeit
+
+from ydk.models.ydktest import ydktest_sanity as ysanity
+
+
+def main(entries):
+    data = {'one_list': {'ldata': [{'number': i, 'name': 'GigabitEthernet0/0/0/%d' % i}
+                                   for i in range(entries)]}}
+
+    def manual():
+        runner = ysanity.Runner()
+        for i in range(entries):
+            ldata = ysanity.Runner.OneList.Ldata()
+            ldata.number = i
+            ldata.name = 'GigabitEthernet0/0/0/%d' % i
+            runner.one_list.ldata.append(ldata)
+        return runner
+
+    def from_dict():
+        return ysanity.Runner.from_dict(data)
+
+    runner = from_dict()
+    assert runner == manual()
+    print('{:>10} {:>10} {:>14}'.format('', 'total (s)', 'per entry (us)'))
+    for name, run in (('manual', manual), ('from_dict', from_dict), ('to_dict', runner.to_dict)):
+        seconds = min(timeit.repeat(run, number=1, repeat=3))
+        print('{:>10} {:>10.3f} {:>14.1f}'.format(name, seconds, seconds / entries * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,67 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""bench_list_memory.py
+Memory held by the entries of a YANG list, built in Python and decoded.
+
+    python bench_list_memory.py [entries]
+"""
+from __future__ import print_function
+import gc
+import sys
+import tracemalloc
+
+from ydk.models.ydktest import ydktest_sanity as ysanity
+from ydk.providers import CodecServiceProvider
+from ydk.services import CodecService
+
+
+def build(entries):
+    runner = ysanity.Runner()
+    for i in range(entries):
+        ldata = ysanity.Runner.OneList.Ldata()
+        ldata.number = i
+        ldata.name = str(i)
+        runner.one_list.ldata.append(ldata)
+    return runner
+
+
+def measure(create):
+    gc.collect()
+    tracemalloc.start()
+    entity = create()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return entity, size
+
+
+def main(entries):
+    codec = CodecService()
+    provider = CodecServiceProvider(type='xml')
+    runner, built = measure(lambda: build(entries))
+    payload = codec.encode(provider, runner)
+    del runner
+    _, decoded = measure(lambda: codec.decode(provider, payload))
+
+    # only allocations of the Python interpreter are traced, the native
+    # part of each entity comes on top
+    print('{:>10} {:>16} {:>18}'.format('entries', 'built (B/entry)', 'decoded (B/entry)'))
+    print('{:>10} {:>16.0f} {:>18.0f}'.format(entries, float(built) / entries, float(decoded) / entries))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,53 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""bench_logging.py
+Encode time of a YANG list by level of the ydk logger, with a handler
+attached. Debug messages cost nothing unless the DEBUG level is enabled.
+
+    python bench_logging.py [entries]
+"""
+from __future__ import print_function
+import sys
+import logging
+import timeit
+
+from ydk.models.ydktest import ydktest_sanity as ysanity
+from ydk.providers import CodecServiceProvider
+from ydk.services import CodecService
+
+
+def main(entries):
+    codec = CodecService()
+    provider = CodecServiceProvider(type='xml')
+    runner = ysanity.Runner()
+    for i in range(entries):
+        ldata = ysanity.Runner.OneList.Ldata()
+        ldata.number = i
+        ldata.name = str(i)
+        runner.one_list.ldata.append(ldata)
+
+    logger = logging.getLogger('ydk')
+    logger.addHandler(logging.NullHandler())
+    print('{:>10} {:>12}'.format('level', 'encode (s)'))
+    for level in ('WARNING', 'INFO', 'DEBUG'):
+        logger.setLevel(getattr(logging, level))
+        seconds = min(timeit.repeat(lambda: codec.encode(provider, runner), number=1, repeat=3))
+        print('{:>10} {:>12.3f}'.format(level, seconds))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,50 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""bench_setattr.py
+Time of leaf assignments on a generated entity, one attribute at a time
+and with set_leaves.
+
+    python bench_setattr.py [assignments]
+"""
+from __future__ import print_function
+import sys
+import timeit
+
+from ydk.models.ydktest import ydktest_sanity as ysanity
+
+
+def main(assignments):
+    ldata = ysanity.Runner.OneList.Ldata()
+    entries = assignments // 2
+
+    def assign():
+        for i in range(entries):
+            ldata.number = i
+            ldata.name = 'name'
+
+    def set_leaves():
+        for i in range(entries):
+            ldata.set_leaves(number=i, name='name')
+
+    print('{:>12} {:>10} {:>10}'.format('', 'total (s)', 'each (ns)'))
+    for name, run in (('setattr', assign), ('set_leaves', set_leaves)):
+        seconds = min(timeit.repeat(run, number=1, repeat=3))
+        print('{:>12} {:>10.3f} {:>10.0f}'.format(name, seconds, seconds / (entries * 2) * 1e9))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
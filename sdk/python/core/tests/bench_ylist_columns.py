@@ -0,0 +1,53 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""bench_ylist_columns.py
+Time of reading leaf values of a list into arrays, by looping over the
+entries and with YList.to_columns.
+
+    python bench_ylist_columns.py [entries]
+"""
+from __future__ import print_function
+import sys
+import array
+import timeit
+
+from ydk.models.ydktest import ydktest_sanity as ysanity
+
+
+def main(entries):
+    runner = ysanity.Runner.from_dict(
+        {'one_list': {'ldata': [{'number': i, 'name': str(i)} for i in range(entries)]}})
+    ldata = runner.one_list.ldata
+
+    def loop():
+        numbers, names = array.array('l'), []
+        for entry in ldata:
+            numbers.append(int(entry.number.get()))
+            names.append(entry.name.get())
+        return numbers, names
+
+    def to_columns():
+        return ldata.to_columns(['number', 'name'])
+
+    print('{:>12} {:>10} {:>14}'.format('', 'total (s)', 'per entry (us)'))
+    for name, run in (('loop', loop), ('to_columns', to_columns)):
+        seconds = min(timeit.repeat(run, number=1, repeat=3))
+        print('{:>12} {:>10.3f} {:>14.2f}'.format(name, seconds, seconds / entries * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,445 @@
+""" legacy_bundle
+
+Part of the ydktest-sanity runner, as generated by the Python printer of
+ydkgen before per class metadata was kept in the class. Bundles generated
+then fill _children_name_map and _children_yang_names of every instance.
+"""
+from ydk.entity_utils import get_relative_entity_path as _get_relative_entity_path
+from ydk.types import Entity, EntityPath, Identity, Enum, YType, YLeaf, YLeafList, YList, LeafDataList, Bits, Empty, Decimal64
+from ydk.filters import YFilter
+from ydk.errors import YPYError, YPYModelError
+from ydk.errors.error_handler import handle_type_error as _handle_type_error
+
+
+class Runner(Entity):
+    """
+
+
+    .. attribute:: one
+
+    	config for one\_level data
+    	**type**\:   :py:class:`One <legacy_bundle.Runner.One>`
+
+    .. attribute:: one_list
+
+    	config for one\_level list data
+    	**type**\:   :py:class:`OneList <legacy_bundle.Runner.OneList>`
+
+
+
+    """
+
+    _prefix = 'ydkut'
+    _revision = '2015-11-17'
+
+    def __init__(self):
+        super(Runner, self).__init__()
+        self._top_entity = None
+
+        self.yang_name = "runner"
+        self.yang_parent_name = "ydktest-sanity"
+
+        self.one = Runner.One()
+        self.one.parent = self
+        self._children_name_map["one"] = "one"
+        self._children_yang_names.add("one")
+
+        self.one_list = Runner.OneList()
+        self.one_list.parent = self
+        self._children_name_map["one_list"] = "one-list"
+        self._children_yang_names.add("one-list")
+
+
+    class One(Entity):
+        """
+        config for one\_level data
+
+        .. attribute:: name
+
+        	this is string value
+        	**type**\:  str
+
+        .. attribute:: number
+
+        	integer value type
+        	**type**\:  int
+
+        	**range:** \-2147483648..2147483647
+
+
+
+        """
+
+        _prefix = 'ydkut'
+        _revision = '2015-11-17'
+
+        def __init__(self):
+            super(Runner.One, self).__init__()
+
+            self.yang_name = "one"
+            self.yang_parent_name = "runner"
+
+            self.name = YLeaf(YType.str, "name")
+
+            self.number = YLeaf(YType.int32, "number")
+
+        def __setattr__(self, name, value):
+            self._check_monkey_patching_error(name, value)
+            with _handle_type_error():
+                if name in self.__dict__ and isinstance(self.__dict__[name], YList):
+                    raise YPYModelError("Attempt to assign value of '{}' to YList ldata. "
+                                        "Please use list append or extend method."
+                                        .format(value))
+                if isinstance(value, Enum.YLeaf):
+                    value = value.name
+                if name in ("name",
+                            "number") and name in self.__dict__:
+                    if isinstance(value, YLeaf):
+                        self.__dict__[name].set(value.get())
+                    elif isinstance(value, YLeafList):
+                        super(Runner.One, self).__setattr__(name, value)
+                    else:
+                        self.__dict__[name].set(value)
+                else:
+                    if hasattr(value, "parent") and name != "parent":
+                        if hasattr(value, "is_presence_container") and value.is_presence_container:
+                            value.parent = self
+                        elif value.parent is None and value.yang_name in self._children_yang_names:
+                            value.parent = self
+                    super(Runner.One, self).__setattr__(name, value)
+
+        def has_data(self):
+            return (
+                self.name.is_set or
+                self.number.is_set)
+
+        def has_operation(self):
+            return (
+                self.yfilter != YFilter.not_set or
+                self.name.yfilter != YFilter.not_set or
+                self.number.yfilter != YFilter.not_set)
+
+        def get_segment_path(self):
+            path_buffer = ""
+            path_buffer = "one" + path_buffer
+
+            return path_buffer
+
+        def get_entity_path(self, ancestor):
+            path_buffer = ""
+            if (ancestor is None):
+                path_buffer = "ydktest-sanity:runner/%s" % self.get_segment_path()
+            else:
+                path_buffer = _get_relative_entity_path(self, ancestor, path_buffer)
+
+            leaf_name_data = LeafDataList()
+            if (self.name.is_set or self.name.yfilter != YFilter.not_set):
+                leaf_name_data.append(self.name.get_name_leafdata())
+            if (self.number.is_set or self.number.yfilter != YFilter.not_set):
+                leaf_name_data.append(self.number.get_name_leafdata())
+
+            entity_path = EntityPath(path_buffer, leaf_name_data)
+            return entity_path
+
+        def get_child_by_name(self, child_yang_name, segment_path):
+            child = self._get_child_by_seg_name([child_yang_name, segment_path])
+            if child is not None:
+                return child
+
+            return None
+
+        def has_leaf_or_child_of_name(self, name):
+            if(name == "name" or name == "number"):
+                return True
+            return False
+
+        def set_value(self, value_path, value, name_space, name_space_prefix):
+            if(value_path == "name"):
+                self.name = value
+                self.name.value_namespace = name_space
+                self.name.value_namespace_prefix = name_space_prefix
+            if(value_path == "number"):
+                self.number = value
+                self.number.value_namespace = name_space
+                self.number.value_namespace_prefix = name_space_prefix
+
+
+    class OneList(Entity):
+        """
+        config for one\_level list data
+
+        .. attribute:: ldata
+
+        	one list data
+        	**type**\: list of    :py:class:`Ldata <legacy_bundle.Runner.OneList.Ldata>`
+
+
+
+        """
+
+        _prefix = 'ydkut'
+        _revision = '2015-11-17'
+
+        def __init__(self):
+            super(Runner.OneList, self).__init__()
+
+            self.yang_name = "one-list"
+            self.yang_parent_name = "runner"
+
+            self.ldata = YList(self)
+
+        def __setattr__(self, name, value):
+            self._check_monkey_patching_error(name, value)
+            with _handle_type_error():
+                if name in self.__dict__ and isinstance(self.__dict__[name], YList):
+                    raise YPYModelError("Attempt to assign value of '{}' to YList ldata. "
+                                        "Please use list append or extend method."
+                                        .format(value))
+                if isinstance(value, Enum.YLeaf):
+                    value = value.name
+                if name in () and name in self.__dict__:
+                    if isinstance(value, YLeaf):
+                        self.__dict__[name].set(value.get())
+                    elif isinstance(value, YLeafList):
+                        super(Runner.OneList, self).__setattr__(name, value)
+                    else:
+                        self.__dict__[name].set(value)
+                else:
+                    if hasattr(value, "parent") and name != "parent":
+                        if hasattr(value, "is_presence_container") and value.is_presence_container:
+                            value.parent = self
+                        elif value.parent is None and value.yang_name in self._children_yang_names:
+                            value.parent = self
+                    super(Runner.OneList, self).__setattr__(name, value)
+
+
+        class Ldata(Entity):
+            """
+            one list data
+
+            .. attribute:: number  <key>
+
+            	integer value type
+            	**type**\:  int
+
+            	**range:** \-2147483648..2147483647
+
+            .. attribute:: name
+
+            	this is string value
+            	**type**\:  str
+
+
+
+            """
+
+            _prefix = 'ydkut'
+            _revision = '2015-11-17'
+
+            def __init__(self):
+                super(Runner.OneList.Ldata, self).__init__()
+
+                self.yang_name = "ldata"
+                self.yang_parent_name = "one-list"
+
+                self.number = YLeaf(YType.int32, "number")
+
+                self.name = YLeaf(YType.str, "name")
+
+            def __setattr__(self, name, value):
+                self._check_monkey_patching_error(name, value)
+                with _handle_type_error():
+                    if name in self.__dict__ and isinstance(self.__dict__[name], YList):
+                        raise YPYModelError("Attempt to assign value of '{}' to YList ldata. "
+                                            "Please use list append or extend method."
+                                            .format(value))
+                    if isinstance(value, Enum.YLeaf):
+                        value = value.name
+                    if name in ("number",
+                                "name") and name in self.__dict__:
+                        if isinstance(value, YLeaf):
+                            self.__dict__[name].set(value.get())
+                        elif isinstance(value, YLeafList):
+                            super(Runner.OneList.Ldata, self).__setattr__(name, value)
+                        else:
+                            self.__dict__[name].set(value)
+                    else:
+                        if hasattr(value, "parent") and name != "parent":
+                            if hasattr(value, "is_presence_container") and value.is_presence_container:
+                                value.parent = self
+                            elif value.parent is None and value.yang_name in self._children_yang_names:
+                                value.parent = self
+                        super(Runner.OneList.Ldata, self).__setattr__(name, value)
+
+            def has_data(self):
+                return (
+                    self.number.is_set or
+                    self.name.is_set)
+
+            def has_operation(self):
+                return (
+                    self.yfilter != YFilter.not_set or
+                    self.number.yfilter != YFilter.not_set or
+                    self.name.yfilter != YFilter.not_set)
+
+            def get_segment_path(self):
+                path_buffer = ""
+                path_buffer = "ldata" + "[number='" + self.number.get() + "']" + path_buffer
+
+                return path_buffer
+
+            def get_entity_path(self, ancestor):
+                path_buffer = ""
+                if (ancestor is None):
+                    path_buffer = "ydktest-sanity:runner/one-list/%s" % self.get_segment_path()
+                else:
+                    path_buffer = _get_relative_entity_path(self, ancestor, path_buffer)
+
+                leaf_name_data = LeafDataList()
+                if (self.number.is_set or self.number.yfilter != YFilter.not_set):
+                    leaf_name_data.append(self.number.get_name_leafdata())
+                if (self.name.is_set or self.name.yfilter != YFilter.not_set):
+                    leaf_name_data.append(self.name.get_name_leafdata())
+
+                entity_path = EntityPath(path_buffer, leaf_name_data)
+                return entity_path
+
+            def get_child_by_name(self, child_yang_name, segment_path):
+                child = self._get_child_by_seg_name([child_yang_name, segment_path])
+                if child is not None:
+                    return child
+
+                return None
+
+            def has_leaf_or_child_of_name(self, name):
+                if(name == "number" or name == "name"):
+                    return True
+                return False
+
+            def set_value(self, value_path, value, name_space, name_space_prefix):
+                if(value_path == "number"):
+                    self.number = value
+                    self.number.value_namespace = name_space
+                    self.number.value_namespace_prefix = name_space_prefix
+                if(value_path == "name"):
+                    self.name = value
+                    self.name.value_namespace = name_space
+                    self.name.value_namespace_prefix = name_space_prefix
+
+        def has_data(self):
+            for c in self.ldata:
+                if (c.has_data()):
+                    return True
+            return False
+
+        def has_operation(self):
+            for c in self.ldata:
+                if (c.has_operation()):
+                    return True
+            return self.yfilter != YFilter.not_set
+
+        def get_segment_path(self):
+            path_buffer = ""
+            path_buffer = "one-list" + path_buffer
+
+            return path_buffer
+
+        def get_entity_path(self, ancestor):
+            path_buffer = ""
+            if (ancestor is None):
+                path_buffer = "ydktest-sanity:runner/%s" % self.get_segment_path()
+            else:
+                path_buffer = _get_relative_entity_path(self, ancestor, path_buffer)
+
+            leaf_name_data = LeafDataList()
+
+            entity_path = EntityPath(path_buffer, leaf_name_data)
+            return entity_path
+
+        def get_child_by_name(self, child_yang_name, segment_path):
+            child = self._get_child_by_seg_name([child_yang_name, segment_path])
+            if child is not None:
+                return child
+
+            if (child_yang_name == "ldata"):
+                for c in self.ldata:
+                    segment = c.get_segment_path()
+                    if (segment_path == segment):
+                        return c
+                c = Runner.OneList.Ldata()
+                c.parent = self
+                local_reference_key = "ydk::seg::%s" % segment_path
+                self._local_refs[local_reference_key] = c
+                self.ldata.append(c)
+                return c
+
+            return None
+
+        def has_leaf_or_child_of_name(self, name):
+            if(name == "ldata"):
+                return True
+            return False
+
+        def set_value(self, value_path, value, name_space, name_space_prefix):
+            pass
+
+    def has_data(self):
+        return (
+            (self.one is not None and self.one.has_data()) or
+            (self.one_list is not None and self.one_list.has_data()))
+
+    def has_operation(self):
+        return (
+            self.yfilter != YFilter.not_set or
+            (self.one is not None and self.one.has_operation()) or
+            (self.one_list is not None and self.one_list.has_operation()))
+
+    def get_segment_path(self):
+        path_buffer = ""
+        path_buffer = "ydktest-sanity:runner" + path_buffer
+
+        return path_buffer
+
+    def get_entity_path(self, ancestor):
+        path_buffer = ""
+        if (not ancestor is None):
+            raise YPYModelError("ancestor has to be None for top-level node")
+
+        path_buffer = self.get_segment_path()
+        leaf_name_data = LeafDataList()
+
+        entity_path = EntityPath(path_buffer, leaf_name_data)
+        return entity_path
+
+    def get_child_by_name(self, child_yang_name, segment_path):
+        child = self._get_child_by_seg_name([child_yang_name, segment_path])
+        if child is not None:
+            return child
+
+        if (child_yang_name == "one"):
+            if (self.one is None):
+                self.one = Runner.One()
+                self.one.parent = self
+                self._children_name_map["one"] = "one"
+            return self.one
+
+        if (child_yang_name == "one-list"):
+            if (self.one_list is None):
+                self.one_list = Runner.OneList()
+                self.one_list.parent = self
+                self._children_name_map["one_list"] = "one-list"
+            return self.one_list
+
+        return None
+
+    def has_leaf_or_child_of_name(self, name):
+        if(name == "one" or name == "one-list"):
+            return True
+        return False
+
+    def set_value(self, value_path, value, name_space, name_space_prefix):
+        pass
+
+    def clone_ptr(self):
+        self._top_entity = Runner()
+        return self._top_entity
@@ -21,8 +21,11 @@ from __future__ import absolute_import
 
 import sys
 import unittest
+import threading
 
+from ydk.models.ydktest import ydktest_sanity as ysanity
 from ydk.providers import NetconfServiceProvider
+from ydk.services import CRUDService
 from test_utils import ParametrizedTestCase
 from test_utils import get_device_info
 
@@ -45,6 +48,22 @@ class SanityTest(unittest.TestCase):
         capabilities = self.ncc.get_capabilities()
         self.assertEqual(capabilities is not None, True)
 
+    def test_concurrent_providers(self):
+        crud = CRUDService()
+        results = []
+
+        def read_runner():
+            ncc = NetconfServiceProvider(self.hostname, self.username, self.password, self.port, self.protocol, self.on_demand, self.common_cache)
+            results.append(crud.read(ncc, ysanity.Runner()))
+
+        threads = [threading.Thread(target=read_runner) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 4)
+
 
 if __name__ == '__main__':
     device, non_demand, common_cache = get_device_info()
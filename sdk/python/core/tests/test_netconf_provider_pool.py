@@ -0,0 +1,116 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_netconf_provider_pool.py
+NetconfProviderPool test
+"""
+from __future__ import absolute_import
+
+import sys
+import unittest
+import threading
+
+from ydk.errors import YPYClientError, YPYServiceProviderError
+from ydk.models.ydktest import ydktest_sanity as ysanity
+from ydk.providers import NetconfProviderPool
+from ydk.services import CRUDService
+
+from test_utils import ParametrizedTestCase
+from test_utils import get_device_info
+
+
+class SanityPool(ParametrizedTestCase):
+
+    def setUp(self):
+        self.pool = NetconfProviderPool(max_sessions_per_device=2, on_demand=self.on_demand,
+                                        common_cache=self.common_cache)
+        self.crud = CRUDService()
+
+    def tearDown(self):
+        self.pool.close()
+
+    def _checkout(self, timeout=None):
+        return self.pool.checkout(self.hostname, self.username, self.password,
+                                  self.port, self.protocol, timeout)
+
+    def test_reuse(self):
+        provider = self._checkout()
+        self.pool.checkin(provider)
+        self.assertIs(provider, self._checkout())
+
+    def test_shared_root_schema(self):
+        first = self._checkout()
+        second = self._checkout()
+        self.assertIsNot(first, second)
+        self.assertIs(first.get_root_schema(), second.get_root_schema())
+        self.crud.read(second, ysanity.Runner())
+
+    def test_limit(self):
+        self._checkout()
+        self._checkout()
+        self.assertRaises(YPYServiceProviderError, self._checkout, 0.1)
+
+    def test_discard(self):
+        provider = self._checkout()
+        self.pool.checkin(provider, discard=True)
+        self.assertIsNot(provider, self._checkout())
+
+    def test_discard_keeps_schema(self):
+        first = self._checkout()
+        second = self._checkout()
+        self.pool.checkin(first, discard=True)
+        provider = self._checkout()
+        self.assertIs(provider.get_root_schema(), second.get_root_schema())
+        self.crud.read(provider, ysanity.Runner())
+
+    def test_connection_client_error(self):
+        try:
+            with self.pool.connection(self.hostname, self.username, self.password,
+                                      self.port, self.protocol) as provider:
+                raise YPYClientError("connection lost")
+        except YPYClientError:
+            pass
+        self.assertIsNot(provider, self._checkout())
+
+    def test_keepalive(self):
+        self.pool.warm(self.hostname, self.username, self.password, self.port, self.protocol, count=2)
+        self.pool.keepalive()
+        self._checkout()
+        self._checkout()
+
+    def test_threads(self):
+        results = []
+
+        def read_runner():
+            with self.pool.connection(self.hostname, self.username, self.password,
+                                      self.port, self.protocol) as provider:
+                results.append(self.crud.read(provider, ysanity.Runner()))
+
+        threads = [threading.Thread(target=read_runner) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 6)
+
+
+if __name__ == '__main__':
+    device, non_demand, common_cache = get_device_info()
+
+    suite = unittest.TestSuite()
+    suite.addTest(ParametrizedTestCase.parametrize(SanityPool, device=device, non_demand=non_demand, common_cache=common_cache))
+    ret = not unittest.TextTestRunner(verbosity=2).run(suite).wasSuccessful()
+    sys.exit(ret)
@@ -0,0 +1,110 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_sanity_aio.py
+sanity test for asyncio services
+"""
+from __future__ import absolute_import
+
+import sys
+import asyncio
+import unittest
+
+from ydk.aio import AsyncCRUDService, AsyncNetconfService
+from ydk.errors import YPYServiceError
+from ydk.models.ydktest import ydktest_sanity as ysanity
+from ydk.providers import NetconfServiceProvider
+from ydk.services import Datastore
+
+from test_utils import ParametrizedTestCase
+from test_utils import get_device_info
+
+
+class SanityAio(ParametrizedTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ncc = NetconfServiceProvider(cls.hostname, cls.username, cls.password, cls.port, cls.protocol, not cls.on_demand, cls.common_cache)
+        cls.crud = AsyncCRUDService()
+        cls.netconf_service = AsyncNetconfService()
+        cls.loop = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.crud.close()
+        cls.netconf_service.close()
+        cls.loop.close()
+
+    def setUp(self):
+        self._run(self.crud.delete(self.ncc, ysanity.Runner()))
+
+    def _run(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_create_read(self):
+        runner = ysanity.Runner()
+        runner.one.number = 1
+        runner.one.name = 'runner:one:name'
+
+        op = self._run(self.crud.create(self.ncc, runner))
+        self.assertEqual(True, op)
+
+        result = self._run(self.crud.read(self.ncc, ysanity.Runner()))
+        self.assertEqual(runner, result)
+
+    def test_gather(self):
+        runner = ysanity.Runner()
+        runner.one.number = 1
+        self._run(self.crud.create(self.ncc, runner))
+
+        async def read_many():
+            return await asyncio.gather(*[self.crud.read(self.ncc, ysanity.Runner()) for _ in range(5)])
+
+        results = self._run(read_many())
+        self.assertEqual(5, len(results))
+        for result in results:
+            self.assertEqual(runner, result)
+
+    def test_edit_commit(self):
+        runner = ysanity.Runner()
+        runner.one.number = 1
+
+        op = self._run(self.netconf_service.edit_config(self.ncc, Datastore.candidate, runner))
+        self.assertEqual(True, op)
+        op = self._run(self.netconf_service.commit(self.ncc))
+        self.assertEqual(True, op)
+
+        result = self._run(self.netconf_service.get(self.ncc, ysanity.Runner()))
+        self.assertEqual(runner, result)
+
+    def test_timeout(self):
+        self.assertRaises(asyncio.TimeoutError,
+                          self._run,
+                          self.crud.read(self.ncc, ysanity.Runner(), timeout=0))
+
+    def test_none_provider(self):
+        self.assertRaises(YPYServiceError,
+                          self._run,
+                          self.crud.read(None, ysanity.Runner()))
+
+
+if __name__ == '__main__':
+    device, non_demand, common_cache = get_device_info()
+
+    suite = unittest.TestSuite()
+    suite.addTest(ParametrizedTestCase.parametrize(SanityAio, device=device, non_demand=non_demand, common_cache=common_cache))
+    ret = not unittest.TextTestRunner(verbosity=2).run(suite).wasSuccessful()
+    sys.exit(ret)
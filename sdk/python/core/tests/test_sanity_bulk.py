@@ -0,0 +1,97 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+"""
+    test_sanity_bulk.py
+"""
+from __future__ import absolute_import
+
+import sys
+import unittest
+
+from ydk.services import CRUDService
+from ydk.providers import NetconfServiceProvider
+from ydk.errors import YPYServiceError
+from ydk.models.ydktest import ydktest_sanity as ysanity
+
+from test_utils import ParametrizedTestCase
+from test_utils import get_device_info
+
+
+class SanityBulk(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ncc = NetconfServiceProvider(cls.hostname, cls.username, cls.password, cls.port, cls.protocol, cls.on_demand, cls.common_cache)
+        cls.crud = CRUDService()
+
+    def setUp(self):
+        self.crud.delete_many(self.ncc, [ysanity.Runner(), ysanity.SubTest()])
+
+    def tearDown(self):
+        self.crud.delete_many(self.ncc, [ysanity.Runner(), ysanity.SubTest()])
+
+    def _get_entities(self):
+        runner = ysanity.Runner()
+        runner.one.number = 1
+        runner.one.name = 'one'
+        subtest = ysanity.SubTest()
+        subtest.one_aug.number = 3
+        subtest.one_aug.name = 'test'
+        return runner, subtest
+
+    def test_create_read_many(self):
+        runner, subtest = self._get_entities()
+        self.assertTrue(self.crud.create_many(self.ncc, [runner, subtest]))
+
+        subtest_read, runner_read = self.crud.read_many(self.ncc, [ysanity.SubTest(), ysanity.Runner()])
+        self.assertEqual(runner, runner_read)
+        self.assertEqual(subtest, subtest_read)
+
+    def test_update_many(self):
+        runner, subtest = self._get_entities()
+        self.crud.create_many(self.ncc, [runner, subtest])
+
+        runner.one.name = 'two'
+        subtest.one_aug.name = 'other'
+        self.assertTrue(self.crud.update_many(self.ncc, [runner, subtest]))
+
+        runner_read, subtest_read = self.crud.read_config_many(self.ncc, [ysanity.Runner(), ysanity.SubTest()])
+        self.assertEqual(runner, runner_read)
+        self.assertEqual(subtest, subtest_read)
+
+    def test_delete_many(self):
+        runner, subtest = self._get_entities()
+        self.crud.create_many(self.ncc, [runner, subtest])
+        self.assertTrue(self.crud.delete_many(self.ncc, [ysanity.Runner(), ysanity.SubTest()]))
+
+        self.assertEqual(self.crud.read_many(self.ncc, [ysanity.Runner(), ysanity.SubTest()]), [None, None])
+
+    def test_empty(self):
+        self.assertTrue(self.crud.create_many(self.ncc, []))
+        self.assertEqual(self.crud.read_many(self.ncc, []), [])
+
+    def test_none(self):
+        with self.assertRaises(YPYServiceError):
+            self.crud.create_many(self.ncc, None)
+
+
+if __name__ == '__main__':
+    device, non_demand, common_cache = get_device_info()
+
+    suite = unittest.TestSuite()
+    suite.addTest(ParametrizedTestCase.parametrize(SanityBulk, device=device, non_demand=non_demand, common_cache=common_cache))
+    ret = not unittest.TextTestRunner(verbosity=2).run(suite).wasSuccessful()
+    sys.exit(ret)
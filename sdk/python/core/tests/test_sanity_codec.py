@@ -18,14 +18,20 @@
 sanity test for CodecService
 """
 from __future__ import absolute_import
+import logging
 import unittest
 
 from ydk.models.ydktest import ydktest_sanity as ysanity
 from ydk.models.ydktest import oc_pattern
 from ydk.providers import CodecServiceProvider
+from ydk.providers import RootSchemaCache
 from ydk.services import CodecService
 from ydk.errors import YPYServiceError
+from ydk.errors import YPYServiceProviderError
+from ydk.errors import YPYModelError
 from ydk.types import EncodingFormat
+from ydk.types import Entity
+from ydk.filters import YFilter
 
 from test_utils import assert_with_error
 
@@ -168,6 +174,24 @@ class SanityYang(unittest.TestCase):
         payload = self.codec.encode(self.provider, r_1)
         self.assertEqual(self._xml_runner_payload, payload)
 
+    def test_xml_encode_native_walker(self):
+        # generated classes are encoded natively from their descriptors,
+        # the payload must match the one of the node by node walk
+        self.provider.encoding = EncodingFormat.XML
+        r_1 = self._get_runner_entity()
+        r_1.ytypes.built_in_t.llstring.extend(['a', 'b'])
+        r_1.ytypes.built_in_t.number8 = 10
+        r_1.two_list.ldata[0].subl1[1].yfilter = YFilter.delete
+        native_payload = self.codec.encode(self.provider, r_1)
+
+        leaf_names = ysanity.Runner.__dict__['_leaf_names']
+        del ysanity.Runner._leaf_names
+        try:
+            payload = self.codec.encode(self.provider, r_1)
+        finally:
+            ysanity.Runner._leaf_names = leaf_names
+        self.assertEqual(payload, native_payload)
+
     def test_xml_encode_2(self):
         self.provider.encoding = EncodingFormat.XML
         from ydk.models.ydktest.ydktest_sanity import YdkEnumTest
@@ -302,6 +326,20 @@ class SanityYang(unittest.TestCase):
         r_2 = self.codec.decode(self.provider, payload, subtree=True)
         self.assertEqual(r_1, r_2)
 
+    def test_xml_subtree_skips_empty_children(self):
+        self.provider.encoding = EncodingFormat.XML
+        runner = ysanity.Runner()
+        runner.ytypes.built_in_t
+        for i in range(3):
+            ldata = ysanity.Runner.OneList.Ldata()
+            ldata.number = i
+            ldata.name = str(i)
+            runner.one_list.ldata.append(ldata)
+        payload = self.codec.encode(self.provider, runner, subtree=True)
+        self.assertNotIn('ytypes', payload)
+        self.assertEqual(payload.count('<ldata>'), 3)
+        self.assertEqual(runner, self.codec.decode(self.provider, payload, subtree=True))
+
     @assert_with_error("Subtree option can only be used with XML encoding", YPYServiceError)
     def test_decode_invalid_subtree_1(self):
         self.provider.encoding = EncodingFormat.JSON
@@ -312,6 +350,248 @@ class SanityYang(unittest.TestCase):
         self.provider.encoding = EncodingFormat.JSON
         self.codec.encode(self.provider, ysanity.Runner(), subtree=True)
 
+    def test_schema_cache_shared(self):
+        cache = RootSchemaCache()
+        provider_1 = CodecServiceProvider(type='xml', schema_cache=cache)
+        provider_2 = CodecServiceProvider(type='xml', schema_cache=cache)
+        r_1 = self._get_runner_entity()
+
+        payload_1 = self.codec.encode(provider_1, r_1)
+        self.assertEqual(len(cache), 1)
+        self.assertGreater(cache.memory_usage, 0)
+        payload_2 = self.codec.encode(provider_2, r_1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(payload_1, payload_2)
+        self.assertEqual(payload_1, self.codec.encode(self.provider, r_1))
+
+        self.assertEqual(cache.evict('ydktest'), 1)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.memory_usage, 0)
+        # providers keep the evicted schema
+        self.assertEqual(payload_1, self.codec.encode(provider_1, r_1))
+
+    def test_schema_cache_limit(self):
+        cache = RootSchemaCache(max_entries=1)
+        created = []
+        for key in ('a', 'b', 'a'):
+            cache.get_or_create((key,), lambda: created.append(key) or key)
+        self.assertEqual(created, ['a', 'b', 'a'])
+        self.assertEqual(len(cache), 1)
+        self.assertTrue(('a',) in cache)
+
+    def test_schema_cache_size_on_miss(self):
+        cache = RootSchemaCache()
+        sizes = []
+        for _ in range(2):
+            cache.get_or_create(('a',), lambda: 'a', lambda: sizes.append(1) or 10)
+        self.assertEqual(sizes, [1])
+        self.assertEqual(cache.memory_usage, 10)
+
+    def test_bundle_index(self):
+        from ydk.entity_utils.bundle_index import bundle_index
+        from ydk.models.ydktest import ydktest_sanity as ysanity
+        self.assertEqual(bundle_index.get_entity_class('http://cisco.com/ns/yang/ydktest-sanity', 'runner'),
+                         ysanity.Runner)
+        self.assertIsNone(bundle_index.get_entity_class('http://cisco.com/ns/yang/ydktest-sanity', 'no-such-entity'))
+        self.assertTrue(('http://cisco.com/ns/yang/ydktest-sanity', 'no-such-entity') in bundle_index._missing)
+        self.assertIsNone(bundle_index.get_entity_class('http://cisco.com/ns/yang/ydktest-sanity', 'no-such-entity'))
+        self.assertEqual(bundle_index.get_yang_ns('ydktest').BUNDLE_NAME, 'ydktest')
+        self.assertIsNone(bundle_index.get_yang_ns('no-such-bundle'))
+
+        bundle_index.invalidate()
+        entity = self.codec.decode(self.provider, self.codec.encode(self.provider, self._get_runner_entity()))
+        self.assertEqual(entity, self._get_runner_entity())
+
+    def test_ylist_key_lookup(self):
+        runner = ysanity.Runner()
+        for i in range(5):
+            ldata = ysanity.Runner.OneList.Ldata()
+            ldata.number = i
+            ldata.name = str(i)
+            runner.one_list.ldata.append(ldata)
+        ldata_list = runner.one_list.ldata
+        self.assertEqual(ldata_list['3'].name.get(), '3')
+        self.assertEqual(ldata_list.get(3).name.get(), '3')
+        self.assertIs(ldata_list[0], ldata_list.get(0))
+        self.assertIsNone(ldata_list.get(5))
+        self.assertRaises(KeyError, ldata_list.__getitem__, '5')
+
+        # key changes and removals are followed by the index
+        ldata_list.get(4).number = 10
+        self.assertIsNone(ldata_list.get(4))
+        self.assertEqual(ldata_list.get(10).name.get(), '4')
+        ldata_list.remove(ldata_list.get(10))
+        self.assertIsNone(ldata_list.get(10))
+        self.assertEqual(len(ldata_list), 4)
+
+    def test_segment_path_key_change(self):
+        runner = ysanity.Runner()
+        ldata = ysanity.Runner.ThreeList.Ldata()
+        ldata.number = 1
+        runner.three_list.ldata.append(ldata)
+        subl1 = ysanity.Runner.ThreeList.Ldata.Subl1()
+        subl1.number = 11
+        ldata.subl1.append(subl1)
+        self.assertEqual(ldata.get_segment_path(), "ldata[number='1']")
+        ldata.number = 2
+        self.assertEqual(ldata.get_segment_path(), "ldata[number='2']")
+        self.assertEqual(subl1.get_entity_path(ldata).path, "subl1[number='11']")
+        self.assertEqual(subl1.get_entity_path(runner).path,
+                         "three-list/ldata[number='2']/subl1[number='11']")
+        self.assertIs(runner.three_list.ldata.get(2), ldata)
+        ldata.number.set(3)
+        self.assertEqual(ldata.get_segment_path(), "ldata[number='3']")
+        self.assertEqual(subl1.get_entity_path(runner).path,
+                         "three-list/ldata[number='3']/subl1[number='11']")
+        self.assertIs(runner.three_list.ldata.get(3), ldata)
+        self.assertIsNone(runner.three_list.ldata.get(2))
+
+    def test_decode_large_list(self):
+        n = 2000
+        runner = ysanity.Runner()
+        for i in range(n):
+            ldata = ysanity.Runner.OneList.Ldata()
+            ldata.number = i
+            ldata.name = str(i)
+            runner.one_list.ldata.append(ldata)
+        entity = self.codec.decode(self.provider, self.codec.encode(self.provider, runner))
+        self.assertEqual(len(entity.one_list.ldata), n)
+        self.assertEqual(entity.one_list.ldata.get(n - 1).name.get(), str(n - 1))
+        self.assertEqual(entity, runner)
+
+    def test_decode_unknown_entity(self):
+        payload = '<no-such-entity xmlns="urn:no-such-namespace"/>'
+        self.assertRaises(YPYServiceProviderError, self.codec.decode, self.provider, payload)
+
+    def test_lazy_children(self):
+        runner = ysanity.Runner()
+        self.assertNotIn('ytypes', runner.__dict__)
+        self.assertNotIn('one_list', runner.__dict__)
+        self.assertFalse(runner.has_data())
+
+        runner.ytypes.built_in_t.number8 = 1
+        self.assertIs(runner.ytypes.parent, runner)
+        self.assertIs(runner.ytypes.built_in_t.parent, runner.ytypes)
+        self.assertNotIn('one_list', runner.__dict__)
+        self.assertTrue(runner.has_data())
+
+        entity = self.codec.decode(self.provider, self.codec.encode(self.provider, runner))
+        self.assertEqual(entity.ytypes.built_in_t.number8.get(), 1)
+        self.assertEqual(entity, runner)
+        self.assertRaises(AttributeError, getattr, runner, 'no_such_attribute')
+
+    def test_entity_class_metadata(self):
+        runner = ysanity.Runner()
+        ldata = ysanity.Runner.OneList.Ldata()
+        runner.one_list.ldata.append(ldata)
+        for entity in (runner, runner.one_list, ldata):
+            self.assertNotIn('_children_name_map', entity.__dict__)
+            self.assertNotIn('_children_yang_names', entity.__dict__)
+            self.assertNotIn('_local_refs', entity.__dict__)
+        self.assertEqual(runner._children_name_map['ytypes'], 'ytypes')
+        self.assertIn('one-list', runner._children_yang_names)
+
+    def test_entity_legacy_bundle(self):
+        # classes generated by the old printer fill the tables in __init__
+        import legacy_bundle
+        runner = legacy_bundle.Runner()
+        other = legacy_bundle.Runner()
+        self.assertEqual(runner._children_name_map,
+                         {'one': 'one', 'one_list': 'one-list'})
+        self.assertEqual(runner._children_yang_names, {'one', 'one-list'})
+        self.assertIsNot(runner._children_name_map, other._children_name_map)
+        self.assertEqual(runner.one._children_name_map, {})
+        self.assertEqual(Entity._children_name_map, {})
+        self.assertEqual(Entity._children_yang_names, frozenset())
+        self.assertNotIn('_children_name_map', ysanity.Runner().__dict__)
+
+        self.assertIs(runner.get_child_by_name('one', 'one'), runner.one)
+        ldata = runner.one_list.get_child_by_name('ldata', "ldata[number='1']")
+        ldata.number = 1
+        ldata.name = 'one'
+        self.assertIs(ldata.parent, runner.one_list)
+        self.assertEqual(list(runner.one_list.ldata), [ldata])
+        self.assertIs(runner.get_children()['one'], runner.one)
+        self.assertTrue(runner.has_data())
+
+    def test_native_logging_level(self):
+        class Records(logging.Handler):
+            def __init__(self):
+                logging.Handler.__init__(self)
+                self.levels = []
+
+            def emit(self, record):
+                self.levels.append(record.levelno)
+
+        logger = logging.getLogger('ydk')
+        handler = Records()
+        level = logger.level
+        logger.addHandler(handler)
+        try:
+            logger.setLevel(logging.DEBUG)
+            self.codec.encode(self.provider, self._get_runner_entity())
+            self.assertIn(logging.DEBUG, handler.levels)
+
+            handler.levels = []
+            logger.setLevel(logging.INFO)
+            self.codec.encode(self.provider, self._get_runner_entity())
+            self.assertNotIn(logging.DEBUG, handler.levels)
+        finally:
+            logger.removeHandler(handler)
+            logger.setLevel(level)
+
+    def test_set_leaves(self):
+        ldata = ysanity.Runner.OneList.Ldata()
+        ldata.set_leaves(number=1, name='one')
+        self.assertEqual(ldata.number.get(), '1')
+        self.assertEqual(ldata.name.get(), 'one')
+        self.assertEqual(ldata.get_segment_path(), "ldata[number='1']")
+
+        runner = ysanity.Runner()
+        runner.ytypes.built_in_t.set_leaves(number8=-1, number64=2 ** 63 - 1, u_number64=2 ** 64 - 1,
+                                            bool_value=True, enum_value=ysanity.YdkEnumTest.none)
+        built_in_t = runner.ytypes.built_in_t
+        self.assertEqual(built_in_t.number8.get(), '-1')
+        self.assertEqual(built_in_t.number64.get(), str(2 ** 63 - 1))
+        self.assertEqual(built_in_t.u_number64.get(), str(2 ** 64 - 1))
+        self.assertEqual(built_in_t.enum_value.get(), 'none')
+
+        self.assertRaises(YPYModelError, ldata.set_leaves, no_such_leaf=1)
+        self.assertRaises(YPYModelError, setattr, ldata, 'number', None)
+        self.assertRaises(YPYModelError, setattr, runner.one_list, 'ldata', [])
+
+    def test_from_dict(self):
+        runner = ysanity.Runner()
+        runner.ytypes.built_in_t.name = 'name'
+        runner.ytypes.built_in_t.llstring.extend(['a', 'b'])
+        for i in range(3):
+            ldata = ysanity.Runner.OneList.Ldata()
+            ldata.number = i
+            ldata.name = str(i)
+            runner.one_list.ldata.append(ldata)
+
+        data = {'ytypes': {'built_in_t': {'name': 'name', 'llstring': ['a', 'b']}},
+                'one_list': {'ldata': [{'number': i, 'name': str(i)} for i in range(3)]}}
+        runner_from_dict = ysanity.Runner.from_dict(data)
+        self.assertEqual(runner_from_dict, runner)
+        self.assertEqual(self.codec.encode(self.provider, runner_from_dict),
+                         self.codec.encode(self.provider, runner))
+        self.assertIs(runner_from_dict.one_list.ldata.get(2).parent, runner_from_dict.one_list)
+
+        self.assertEqual(ysanity.Runner.from_dict(runner.to_dict()), runner)
+        self.assertEqual(runner.to_dict()['one_list']['ldata'][1], {'number': '1', 'name': '1'})
+        self.assertRaises(YPYModelError, ysanity.Runner.from_dict, {'no_such_child': {}})
+
+    def test_ylist_to_columns(self):
+        runner = ysanity.Runner.from_dict(
+            {'one_list': {'ldata': [{'number': 1, 'name': 'one'}, {'number': -2}]}})
+        columns = runner.one_list.ldata.to_columns(['number', 'name'])
+        self.assertEqual(list(columns['number']), [1, -2])
+        self.assertEqual(columns['name'], ['one', None])
+        self.assertNotIn('name', runner.one_list.ldata[1].__dict__)
+        self.assertEqual(ysanity.Runner().one_list.ldata.to_columns(['number']), {'number': []})
+        self.assertRaises(YPYModelError, runner.one_list.ldata.to_columns, ['no_such_leaf'])
+
 if __name__ == '__main__':
     import sys
     suite = unittest.TestLoader().loadTestsFromTestCase(SanityYang)
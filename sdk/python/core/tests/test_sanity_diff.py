@@ -0,0 +1,112 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+"""
+    test_sanity_diff.py
+"""
+from __future__ import absolute_import
+
+import sys
+import unittest
+
+from ydk.services import CRUDService, DiffService
+from ydk.providers import NetconfServiceProvider
+from ydk.filters import YFilter
+from ydk.errors import YPYServiceError
+from ydk.models.ydktest import ydktest_sanity as ysanity
+
+from test_utils import ParametrizedTestCase
+from test_utils import get_device_info
+
+
+class SanityDiff(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ncc = NetconfServiceProvider(cls.hostname, cls.username, cls.password, cls.port, cls.protocol, cls.on_demand, cls.common_cache)
+        cls.crud = CRUDService()
+        cls.diff = DiffService()
+
+    def setUp(self):
+        self.crud.delete(self.ncc, ysanity.Runner())
+
+    def tearDown(self):
+        self.crud.delete(self.ncc, ysanity.Runner())
+
+    def _get_runner(self):
+        return ysanity.Runner.from_dict({
+            'one': {'number': 1, 'name': 'one'},
+            'one_list': {'ldata': [{'number': 1, 'name': 'one'},
+                                   {'number': 2, 'name': 'two'}]},
+            'ytypes': {'built_in_t': {'llstring': ['0', '1']}}})
+
+    def test_diff_same(self):
+        self.assertIsNone(self.diff.diff(self._get_runner(), self._get_runner()))
+
+    def test_diff_leaf(self):
+        desired = self._get_runner()
+        desired.one_list.ldata.get(2).name = 'deux'
+        delta = self.diff.diff(desired, self._get_runner())
+        self.assertEqual(delta.to_dict(), {'one_list': {'ldata': [{'number': '2', 'name': 'deux'}]}})
+
+    def test_diff_removed(self):
+        desired = self._get_runner()
+        desired.one_list.ldata.remove(desired.one_list.ldata.get(1))
+        current = self._get_runner()
+        current.two.name = 'two'
+        delta = self.diff.diff(desired, current)
+        self.assertEqual(delta.one_list.ldata.get(1).yfilter, YFilter.remove)
+        self.assertEqual(delta.two.yfilter, YFilter.remove)
+        self.assertIsNone(delta.__dict__.get('one'))
+
+    def test_diff_leaflist_replace(self):
+        desired = self._get_runner()
+        desired.ytypes.built_in_t.llstring.clear()
+        desired.ytypes.built_in_t.llstring.extend(['1', '2'])
+        delta = self.diff.diff(desired, self._get_runner())
+        self.assertEqual(delta.ytypes.built_in_t.yfilter, YFilter.replace)
+        self.assertEqual(delta.ytypes.built_in_t.to_dict(), {'llstring': ['1', '2']})
+
+    def test_diff_class_mismatch(self):
+        with self.assertRaises(YPYServiceError):
+            self.diff.diff(ysanity.Runner(), ysanity.SubTest())
+
+    def test_sync(self):
+        self.crud.create(self.ncc, self._get_runner())
+
+        desired = self._get_runner()
+        desired.one.name = 'other'
+        desired.one_list.ldata.remove(desired.one_list.ldata.get(1))
+        desired.ytypes.built_in_t.llstring.append('2')
+        self.assertTrue(self.crud.sync(self.ncc, desired))
+
+        runner_read = self.crud.read_config(self.ncc, ysanity.Runner())
+        self.assertEqual(desired, runner_read)
+        # nothing left to change
+        self.assertIsNone(self.diff.diff(desired, runner_read))
+
+    def test_sync_empty_device(self):
+        desired = self._get_runner()
+        self.assertTrue(self.crud.sync(self.ncc, desired))
+        self.assertEqual(desired, self.crud.read_config(self.ncc, ysanity.Runner()))
+
+
+if __name__ == '__main__':
+    device, non_demand, common_cache = get_device_info()
+
+    suite = unittest.TestSuite()
+    suite.addTest(ParametrizedTestCase.parametrize(SanityDiff, device=device, non_demand=non_demand, common_cache=common_cache))
+    ret = not unittest.TextTestRunner(verbosity=2).run(suite).wasSuccessful()
+    sys.exit(ret)
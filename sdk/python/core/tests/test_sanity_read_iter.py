@@ -0,0 +1,103 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+"""test_sanity_read_iter.py
+    sanity test for streaming CRUD reads
+"""
+from __future__ import absolute_import
+
+import sys
+import unittest
+
+from ydk.services import CRUDService
+from ydk.providers import NetconfServiceProvider
+from ydk.errors import YPYError
+from ydk.models.ydktest import ydktest_sanity as ysanity
+
+from test_utils import ParametrizedTestCase
+from test_utils import get_device_info
+
+
+class SanityReadIter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ncc = NetconfServiceProvider(cls.hostname, cls.username, cls.password, cls.port, cls.protocol, cls.on_demand, cls.common_cache)
+        cls.crud = CRUDService()
+
+    def setUp(self):
+        self.crud.delete(self.ncc, ysanity.Runner())
+
+    def tearDown(self):
+        self.crud.delete(self.ncc, ysanity.Runner())
+
+    def _create_runner(self, count):
+        runner = ysanity.Runner()
+        runner.one.number = 1
+        runner.one.name = 'one'
+        for i in range(count):
+            ldata = ysanity.Runner.OneList.Ldata()
+            ldata.number = i
+            ldata.name = 'entry {} & <{}>'.format(i, i)
+            runner.one_list.ldata.append(ldata)
+        self.crud.create(self.ncc, runner)
+        return runner
+
+    def test_read_iter(self):
+        runner = self._create_runner(20)
+
+        entries = list(self.crud.read_iter(self.ncc, ysanity.Runner(), 'runner/one-list/ldata'))
+        self.assertEqual(sorted(int(e.number.get()) for e in entries), list(range(20)))
+        expected = dict((e.number.get(), e) for e in runner.one_list.ldata)
+        for entry in entries:
+            self.assertEqual(entry, expected[entry.number.get()])
+            # the entry comes with its ancestors
+            self.assertEqual(entry.parent.parent.yang_name, 'runner')
+
+    def test_read_config_iter_nested(self):
+        runner = ysanity.Runner()
+        for i in range(3):
+            elem = ysanity.Runner.TwoList.Ldata()
+            elem.number = i
+            elem.name = str(i)
+            for j in range(2):
+                subl = ysanity.Runner.TwoList.Ldata.Subl1()
+                subl.number = 10 * i + j
+                subl.name = str(j)
+                elem.subl1.append(subl)
+            runner.two_list.ldata.append(elem)
+        self.crud.create(self.ncc, runner)
+
+        entries = list(self.crud.read_config_iter(self.ncc, ysanity.Runner(),
+                                                  'ydktest-sanity:runner/two-list/ldata/subl1'))
+        self.assertEqual(sorted(int(e.number.get()) for e in entries), [0, 1, 10, 11, 20, 21])
+        for entry in entries:
+            self.assertEqual(int(entry.parent.number.get()), int(entry.number.get()) // 10)
+
+    def test_read_iter_empty(self):
+        self.assertEqual(list(self.crud.read_iter(self.ncc, ysanity.Runner(), 'runner/one-list/ldata')), [])
+
+    def test_read_iter_invalid_path(self):
+        with self.assertRaises(YPYError):
+            list(self.crud.read_iter(self.ncc, ysanity.Runner(), 'one-list/ldata'))
+
+
+if __name__ == '__main__':
+    device, non_demand, common_cache = get_device_info()
+
+    suite = unittest.TestSuite()
+    suite.addTest(ParametrizedTestCase.parametrize(SanityReadIter, device=device, non_demand=non_demand, common_cache=common_cache))
+    ret = not unittest.TextTestRunner(verbosity=2).run(suite).wasSuccessful()
+    sys.exit(ret)
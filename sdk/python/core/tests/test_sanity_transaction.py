@@ -0,0 +1,114 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+"""
+    test_sanity_transaction.py
+"""
+from __future__ import absolute_import
+
+import sys
+import unittest
+
+from ydk.services import CRUDService, Transaction, Datastore
+from ydk.providers import NetconfServiceProvider
+from ydk.filters import YFilter
+from ydk.errors import YPYServiceError
+from ydk.models.ydktest import ydktest_sanity as ysanity
+
+from test_utils import ParametrizedTestCase
+from test_utils import get_device_info
+
+
+class SanityTransaction(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ncc = NetconfServiceProvider(cls.hostname, cls.username, cls.password, cls.port, cls.protocol, cls.on_demand, cls.common_cache)
+        cls.crud = CRUDService()
+
+    def setUp(self):
+        self.crud.delete_many(self.ncc, [ysanity.Runner(), ysanity.SubTest()])
+
+    def tearDown(self):
+        self.crud.delete_many(self.ncc, [ysanity.Runner(), ysanity.SubTest()])
+
+    def _get_entities(self):
+        runner = ysanity.Runner()
+        runner.one.number = 1
+        runner.one.name = 'one'
+        subtest = ysanity.SubTest()
+        subtest.one_aug.number = 3
+        subtest.one_aug.name = 'test'
+        return runner, subtest
+
+    def test_commit(self):
+        runner, subtest = self._get_entities()
+        with Transaction(self.ncc) as tx:
+            tx.create(runner)
+            tx.create(subtest)
+            # nothing is sent before the block ends
+            self.assertIsNone(self.crud.read_config(self.ncc, ysanity.Runner()))
+
+        runner_read, subtest_read = self.crud.read_config_many(self.ncc, [ysanity.Runner(), ysanity.SubTest()])
+        self.assertEqual(runner, runner_read)
+        self.assertEqual(subtest, subtest_read)
+        self.assertEqual(runner.yfilter, YFilter.not_set)
+
+    def test_update_delete(self):
+        runner, subtest = self._get_entities()
+        self.crud.create_many(self.ncc, [runner, subtest])
+
+        runner.one.name = 'two'
+        with Transaction(self.ncc) as tx:
+            tx.update(runner)
+            tx.delete(ysanity.SubTest())
+
+        self.assertEqual(runner, self.crud.read_config(self.ncc, ysanity.Runner()))
+        self.assertIsNone(self.crud.read_config(self.ncc, ysanity.SubTest()))
+
+    def test_abort(self):
+        runner, _ = self._get_entities()
+        with self.assertRaises(ValueError):
+            with Transaction(self.ncc) as tx:
+                tx.create(runner)
+                tx.flush()
+                raise ValueError()
+
+        self.assertIsNone(self.crud.read_config(self.ncc, ysanity.Runner()))
+
+    def test_auto_flush(self):
+        runner = ysanity.Runner()
+        with Transaction(self.ncc, max_entities=10) as tx:
+            for i in range(25):
+                ldata = ysanity.Runner.OneList.Ldata()
+                ldata.number = i
+                ldata.name = str(i)
+                runner.one_list.ldata.append(ldata)
+                tx.create(ldata)
+
+        self.assertEqual(runner, self.crud.read_config(self.ncc, ysanity.Runner()))
+
+    def test_invalid_target(self):
+        with self.assertRaises(YPYServiceError):
+            Transaction(self.ncc, target=Datastore.startup)
+
+
+if __name__ == '__main__':
+    device, non_demand, common_cache = get_device_info()
+
+    suite = unittest.TestSuite()
+    suite.addTest(ParametrizedTestCase.parametrize(SanityTransaction, device=device, non_demand=non_demand, common_cache=common_cache))
+    ret = not unittest.TextTestRunner(verbosity=2).run(suite).wasSuccessful()
+    sys.exit(ret)
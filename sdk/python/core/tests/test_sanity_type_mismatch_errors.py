@@ -30,6 +30,7 @@ from ydk.services import CRUDService
 from ydk.errors import YPYModelError
 
 from test_utils import assert_with_error
+from test_utils import assert_raises_with_error
 from test_utils import ParametrizedTestCase
 from test_utils import get_device_info
 
@@ -135,6 +136,24 @@ class SanityYang(unittest.TestCase):
         runner.ytypes.built_in_t.llstring = runner.one_list.ldata
         self.crud.create(self.ncc, runner)
 
+    @assert_raises_with_error(test_invalid_class_assignment_int_pattern, YPYModelError)
+    def test_invalid_class_assignment_not_created_int(self):
+        # one was never accessed, so it is checked against its class
+        runner = ysanity.Runner()
+        runner.one = 1
+
+    @assert_raises_with_error(test_invalid_class_assignment_enum_pattern, YPYModelError)
+    def test_invalid_class_assignment_not_created_enum(self):
+        runner = ysanity.Runner()
+        runner.one = ysanity.YdkEnumTest.none
+
+    def test_class_assignment_not_created(self):
+        runner = ysanity.Runner()
+        one = ysanity.Runner.One()
+        runner.one = one
+        self.assertIs(runner.one, one)
+        self.assertIs(one.parent, runner)
+
 
 if __name__ == '__main__':
     device, non_demand, common_cache = get_device_info()
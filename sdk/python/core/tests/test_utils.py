@@ -41,6 +41,21 @@ def assert_with_error(pattern, ErrorClass):
     return assert_with_pattern
 
 
+def assert_raises_with_error(pattern, ErrorClass):
+    """Like assert_with_error, but also fails if no error is raised."""
+    def assert_with_pattern(func):
+        def helper(self, *args, **kwargs):
+            try:
+                func(self)
+            except ErrorClass as error:
+                res = re.match(pattern, error.message.strip())
+                self.assertEqual(res is not None, True)
+            else:
+                self.fail("{} not raised".format(ErrorClass.__name__))
+        return helper
+    return assert_with_pattern
+
+
 class ParametrizedTestCase(unittest.TestCase):
     """ TestCase classes that want to be parametrized should
         inherit from this class.
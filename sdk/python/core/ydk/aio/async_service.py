@@ -0,0 +1,102 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""async_service.py
+Base class for asyncio service wrappers.
+"""
+import asyncio
+import weakref
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from ydk.errors import YPYServiceError as _YPYServiceError
+
+
+class AsyncService(object):
+    """Runs blocking YDK service calls in worker threads.
+
+    A provider owns a single session, and a session handles one RPC at a
+    time, so calls on the same provider are bounded by ``concurrency``
+    (defaults to 1). Calls on different providers run in parallel, up to
+    the number of executor threads.
+
+    Args:
+        concurrency (int, optional): Maximum number of outstanding calls per
+            provider, defaults to 1.
+        executor (concurrent.futures.Executor, optional): Executor running
+            the blocking calls. A ThreadPoolExecutor with ``max_workers``
+            threads is created if not given.
+        max_workers (int, optional): Number of threads of the default
+            executor.
+        timeout (float, optional): Default timeout in seconds for each
+            call, defaults to no timeout.
+    """
+
+    def __init__(self, concurrency=1, executor=None, max_workers=None, timeout=None):
+        if concurrency < 1:
+            raise _YPYServiceError("concurrency must be a positive integer")
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._own_executor = executor is None
+        self._executor = executor if executor is not None else ThreadPoolExecutor(max_workers)
+        self._limits = {}
+
+    def close(self):
+        """Shut down the default executor, waiting for running calls."""
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+
+    def _get_limit(self, provider):
+        key = id(provider)
+        limit = self._limits.get(key)
+        if limit is None:
+            limit = asyncio.Semaphore(self.concurrency)
+            self._limits[key] = limit
+            weakref.finalize(provider, self._limits.pop, key, None)
+        return limit
+
+    async def _run(self, provider, func, *args, timeout=None):
+        """Run ``func(*args)`` in the executor and await its result.
+
+        The per-provider slot is held until the blocking call actually
+        returns, even if the awaiting task is cancelled or times out, so a
+        session is never driven by two threads at once. A call which is
+        still queued when cancelled never reaches the device.
+        """
+        if provider is None:
+            raise _YPYServiceError("provider cannot be None")
+
+        loop = asyncio.get_event_loop()
+        limit = self._get_limit(provider)
+        await limit.acquire()
+
+        def release(_):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(limit.release)
+
+        try:
+            cfuture = self._executor.submit(functools.partial(func, *args))
+        except BaseException:
+            limit.release()
+            raise
+        cfuture.add_done_callback(release)
+
+        if timeout is None:
+            timeout = self.timeout
+        future = asyncio.wrap_future(cfuture, loop=loop)
+        if timeout is None:
+            return await future
+        return await asyncio.wait_for(future, timeout)
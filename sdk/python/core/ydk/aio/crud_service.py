@@ -0,0 +1,63 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""crud_service.py
+Asyncio wrapper for CRUDService.
+"""
+from ydk.services import CRUDService as _CRUDService
+
+from .async_service import AsyncService
+
+
+class AsyncCRUDService(AsyncService):
+    """ Asyncio wrapper for CRUDService, every operation returns an awaitable.
+    """
+    def __init__(self, **kwargs):
+        super(AsyncCRUDService, self).__init__(**kwargs)
+        self._crud = _CRUDService()
+
+    async def create(self, provider, entity, *, timeout=None):
+        return await self._run(provider, self._crud.create, provider, entity, timeout=timeout)
+
+    async def read(self, provider, read_filter, *, timeout=None):
+        return await self._run(provider, self._crud.read, provider, read_filter, timeout=timeout)
+
+    async def read_config(self, provider, read_filter, *, timeout=None):
+        return await self._run(provider, self._crud.read_config, provider, read_filter, timeout=timeout)
+
+    async def update(self, provider, entity, *, timeout=None):
+        return await self._run(provider, self._crud.update, provider, entity, timeout=timeout)
+
+    async def delete(self, provider, entity, *, timeout=None):
+        return await self._run(provider, self._crud.delete, provider, entity, timeout=timeout)
+
+    async def create_many(self, provider, entities, *, timeout=None):
+        return await self._run(provider, self._crud.create_many, provider, entities, timeout=timeout)
+
+    async def read_many(self, provider, read_filters, *, timeout=None):
+        return await self._run(provider, self._crud.read_many, provider, read_filters, timeout=timeout)
+
+    async def read_config_many(self, provider, read_filters, *, timeout=None):
+        return await self._run(provider, self._crud.read_config_many, provider, read_filters, timeout=timeout)
+
+    async def update_many(self, provider, entities, *, timeout=None):
+        return await self._run(provider, self._crud.update_many, provider, entities, timeout=timeout)
+
+    async def delete_many(self, provider, entities, *, timeout=None):
+        return await self._run(provider, self._crud.delete_many, provider, entities, timeout=timeout)
+
+    async def sync(self, provider, desired, current=None, *, timeout=None):
+        return await self._run(provider, self._crud.sync, provider, desired, current, timeout=timeout)
@@ -0,0 +1,33 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""executor_service.py
+Asyncio wrapper for ExecutorService.
+"""
+from ydk.services import ExecutorService as _ExecutorService
+
+from .async_service import AsyncService
+
+
+class AsyncExecutorService(AsyncService):
+    """ Asyncio wrapper for ExecutorService, every operation returns an awaitable.
+    """
+    def __init__(self, **kwargs):
+        super(AsyncExecutorService, self).__init__(**kwargs)
+        self._es = _ExecutorService()
+
+    async def execute_rpc(self, provider, entity, top_entity=None, *, timeout=None):
+        return await self._run(provider, self._es.execute_rpc, provider, entity, top_entity, timeout=timeout)
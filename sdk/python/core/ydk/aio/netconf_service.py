@@ -0,0 +1,74 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""netconf_service.py
+Asyncio wrapper for NetconfService.
+"""
+from ydk.services import NetconfService as _NetconfService
+
+from .async_service import AsyncService
+
+
+class AsyncNetconfService(AsyncService):
+    """ Asyncio wrapper for NetconfService, every operation returns an awaitable.
+    """
+    def __init__(self, **kwargs):
+        super(AsyncNetconfService, self).__init__(**kwargs)
+        self._ns = _NetconfService()
+
+    async def cancel_commit(self, provider, persist_id=-1, *, timeout=None):
+        return await self._run(provider, self._ns.cancel_commit, provider, persist_id, timeout=timeout)
+
+    async def close_session(self, provider, *, timeout=None):
+        return await self._run(provider, self._ns.close_session, provider, timeout=timeout)
+
+    async def commit(self, provider, confirmed=False, confirm_timeout=-1, persist=-1, persist_id=-1, *, timeout=None):
+        return await self._run(provider, self._ns.commit, provider, confirmed,
+                               confirm_timeout, persist, persist_id, timeout=timeout)
+
+    async def copy_config(self, provider, target, source=None, url="", source_config=None, *, timeout=None):
+        return await self._run(provider, self._ns.copy_config, provider, target,
+                               source, url, source_config, timeout=timeout)
+
+    async def delete_config(self, provider, target, url="", *, timeout=None):
+        return await self._run(provider, self._ns.delete_config, provider, target, url, timeout=timeout)
+
+    async def discard_changes(self, provider, *, timeout=None):
+        return await self._run(provider, self._ns.discard_changes, provider, timeout=timeout)
+
+    async def edit_config(self, provider, target, config,
+                          default_operation="", test_option="", error_option="", *, timeout=None):
+        return await self._run(provider, self._ns.edit_config, provider, target, config,
+                               default_operation, test_option, error_option, timeout=timeout)
+
+    async def get_config(self, provider, source, read_filter, *, timeout=None):
+        return await self._run(provider, self._ns.get_config, provider, source, read_filter, timeout=timeout)
+
+    async def get(self, provider, read_filter, *, timeout=None):
+        return await self._run(provider, self._ns.get, provider, read_filter, timeout=timeout)
+
+    async def kill_session(self, provider, session_id, *, timeout=None):
+        return await self._run(provider, self._ns.kill_session, provider, session_id, timeout=timeout)
+
+    async def lock(self, provider, target, *, timeout=None):
+        return await self._run(provider, self._ns.lock, provider, target, timeout=timeout)
+
+    async def unlock(self, provider, target, *, timeout=None):
+        return await self._run(provider, self._ns.unlock, provider, target, timeout=timeout)
+
+    async def validate(self, provider, source=None, url="", source_config=None, *, timeout=None):
+        return await self._run(provider, self._ns.validate, provider, source, url,
+                               source_config, timeout=timeout)
@@ -0,0 +1,141 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""bundle_index.py
+Index of the installed ydk-models bundles.
+"""
+import os
+import logging
+import pkgutil
+import importlib
+import threading
+
+
+class BundleIndex(object):
+    """Lazily built index of the installed ydk-models bundles.
+
+    Maps bundle names to their _yang_ns modules, and the (namespace, name)
+    of every top level entity to its bundle and class. The index is built
+    on first use and rebuilt when a bundle is installed or removed, which
+    is detected from the modification times of the ydk.models directories.
+    Entities which are not found are remembered until the index is rebuilt,
+    or invalidated.
+
+    Attributes:
+        logger (logging.Logger): BundleIndex logger.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._yang_ns = {}
+        self._entities = {}
+        self._classes = {}
+        self._packages = {}
+        self._missing = set()
+
+    def get_yang_ns(self, bundle_name):
+        """Return the _yang_ns module of bundle_name, or None if it is not installed."""
+        self._refresh()
+        return self._yang_ns.get(bundle_name)
+
+    def get_entity_class(self, namespace, name):
+        """Return the class of the top level entity (namespace, name), or
+        None if no installed bundle defines it.
+        """
+        key = (namespace, name)
+        clazz = self._classes.get(key)
+        if clazz is not None:
+            return clazz
+
+        self._refresh()
+        entry = self._entities.get(key)
+        if entry is None:
+            if key in self._missing:
+                return None
+            # a bundle may have been installed within the modification
+            # time resolution of the file system
+            self._refresh(force=True)
+            entry = self._entities.get(key)
+            if entry is None:
+                self._missing.add(key)
+                return None
+
+        bundle_name, path = entry
+        mod, clazz = path.split('.', 1)
+        mod = importlib.import_module('ydk.models.{}.{}'.format(bundle_name, mod))
+        clazz = getattr(mod, clazz)
+        self._classes[key] = clazz
+        return clazz
+
+    def get_package_info(self, package_name):
+        """Return (bundle name, YANG models location) of a bundle package,
+        e.g. 'ydk.models.ydktest'.
+        """
+        info = self._packages.get(package_name)
+        if info is None:
+            package = importlib.import_module(package_name)
+            yang_ns = importlib.import_module('{}._yang_ns'.format(package_name))
+            info = (yang_ns.__dict__['BUNDLE_NAME'], os.path.join(package.__path__[0], '_yang'))
+            self._packages[package_name] = info
+        return info
+
+    def invalidate(self):
+        """Rebuild the index on next use."""
+        with self._lock:
+            self._snapshot = None
+
+    def _get_snapshot(self):
+        from ydk import models
+        snapshot = []
+        for path in list(models.__path__):
+            try:
+                snapshot.append((path, os.stat(path).st_mtime))
+            except OSError:
+                snapshot.append((path, None))
+        return tuple(snapshot)
+
+    def _refresh(self, force=False):
+        snapshot = self._get_snapshot()
+        if not force and snapshot == self._snapshot:
+            return
+        with self._lock:
+            if not force and snapshot == self._snapshot:
+                return
+            self.logger.debug("Indexing installed ydk-models bundles")
+            if hasattr(importlib, 'invalidate_caches'):
+                # let the import system see newly installed bundles
+                importlib.invalidate_caches()
+            from ydk import models
+            yang_ns, entities = {}, {}
+            for (_, name, ispkg) in pkgutil.iter_modules(models.__path__):
+                if not ispkg:
+                    continue
+                try:
+                    mod_yang_ns = importlib.import_module('ydk.models.{}._yang_ns'.format(name))
+                except ImportError:
+                    continue
+                yang_ns[name] = mod_yang_ns
+                for key, path in mod_yang_ns.__dict__.get('ENTITY_LOOKUP', {}).items():
+                    entities.setdefault(key, (name, path))
+            self._yang_ns, self._entities = yang_ns, entities
+            self._classes, self._packages = {}, {}
+            self._missing = set()
+            self._snapshot = snapshot
+
+
+bundle_index = BundleIndex()
@@ -26,8 +26,11 @@ class NetconfSession(_NetconfSession):
     """
 
     def __init__(self, address, username, password, port=830, protocol="ssh",
-                       on_demand=True, common_cache=False, repo=None):
-        if repo is None:
+                       on_demand=True, common_cache=False, repo=None, root_schema=None):
+        if root_schema is not None:
+            super(NetconfSession, self).__init__(root_schema, address, username,
+                                                 password, port, protocol)
+        elif repo is None:
             super(NetconfSession, self).__init__(address, username, password,
                                                  port, protocol, on_demand,
                                                  common_cache)
@@ -41,3 +44,9 @@ class NetconfSession(_NetconfSession):
 
     def invoke(self, rpc):
         return super(NetconfSession, self).invoke(rpc)
+
+    def invoke_many(self, rpcs):
+        """Send rpcs without waiting for each reply and return their
+        outputs in order, pipelined on TCP sessions.
+        """
+        return super(NetconfSession, self).invoke_many(rpcs)
@@ -15,6 +15,8 @@
 # ------------------------------------------------------------------
 
 from .codec_provider import CodecServiceProvider
+from .netconf_provider_pool import NetconfProviderPool
+from .schema_cache import RootSchemaCache
 from ydk.ext.providers import ServiceProvider
 from ydk.ext.providers import NetconfServiceProvider
 from ydk.ext.providers import RestconfServiceProvider
@@ -24,5 +26,7 @@ from ydk.ext.providers import OpenDaylightServiceProvider
 __all__ = [ "ServiceProvider",
             "CodecServiceProvider",
             "NetconfServiceProvider",
+            "NetconfProviderPool",
+            "RootSchemaCache",
             "RestconfServiceProvider",
             "OpenDaylightServiceProvider" ]
@@ -13,19 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ------------------------------------------------------------------
+import os
 import logging
-import pkgutil
-import importlib
 
-from ydk import models
 from ydk.types import EncodingFormat
 from ydk.errors import YPYServiceProviderError
 from ydk.path import Capability as _Capability
 from ydk.path import Repository as _Repository
+from ydk.entity_utils.bundle_index import bundle_index as _bundle_index
+from .schema_cache import root_schema_cache as _root_schema_cache
+from .schema_cache import estimate_schema_size as _estimate_schema_size
 
 
 _TRACE_LEVEL_NUM = 5
 _USER_PROVIDED_REPO = "ydk-user-provider-repo"
+# bundle name to (_yang_ns module, version, capabilities) of the bundle
+_bundle_keys = {}
 
 
 class CodecServiceProvider(object):
@@ -35,6 +38,10 @@ class CodecServiceProvider(object):
         type (ydk.types.EncodingFormat or str): Codec encoding format.
             Currently support XML or JSON.
         repo (ydk.path.Repository, optional): A user provided repository.
+        schema_cache (ydk.providers.RootSchemaCache, optional): Cache
+            sharing root schemas of local YANG models between providers,
+            defaults to the process wide cache. None disables caching.
+            Root schemas of a user provided repository are not cached.
     Attributes:
         logger (logging.Logger): CodecServiceProvider logger.
         encoding (ydk.types.EncodingFormat): Codec encoding format.
@@ -46,6 +53,7 @@ class CodecServiceProvider(object):
     def __init__(self, **kwargs):
         self.logger = logging.getLogger(__name__)
         self._root_schema_table = {}
+        self._schema_cache = kwargs.get('schema_cache', _root_schema_cache)
 
         repo = kwargs.get('repo', None)
         if repo is None:
@@ -76,9 +84,22 @@ class CodecServiceProvider(object):
         if bundle_name in self._root_schema_table:
             return
 
-        self.logger.log(_TRACE_LEVEL_NUM, "Creating repo in path {}".format(models_path))
-        repo = _Repository(models_path)
-        self._initialize_root_schema(bundle_name, repo)
+        if self._schema_cache is None:
+            self.logger.log(_TRACE_LEVEL_NUM, "Creating repo in path {}".format(models_path))
+            repo = _Repository(models_path)
+            self._initialize_root_schema(bundle_name, repo)
+            return
+
+        version, capabilities = self._get_bundle_key(bundle_name)
+        key = (bundle_name, version, os.path.abspath(models_path), capabilities)
+
+        def create():
+            self.logger.log(_TRACE_LEVEL_NUM, "Creating repo in path {}".format(models_path))
+            repo = _Repository(models_path)
+            return self._create_root_schema(bundle_name, repo)
+
+        self._root_schema_table[bundle_name] = self._schema_cache.get_or_create(
+            key, create, lambda: _estimate_schema_size(models_path, capabilities))
 
     def get_root_schema(self, bundle_name):
         """Return root_schema for bundle_name.
@@ -105,11 +126,67 @@ class CodecServiceProvider(object):
 
         """
         name = bundle_name if not user_provided_repo else _USER_PROVIDED_REPO
-        self.logger.log(_TRACE_LEVEL_NUM, "Initializing root schema for {}".format(name))
+        self._root_schema_table[name] = self._create_root_schema(bundle_name, repo)
+
+    def _create_root_schema(self, bundle_name, repo):
+        """Create root schema for bundle_name using repo.
+
+        Args:
+            bundle_name (str): bundle name.
+            repo (ydk.path.Repository): default repository or repository provided by the user.
+
+        Returns:
+            root_schema (ydk.path.RootSchemaNode): New root schema.
+        """
+        self.logger.log(_TRACE_LEVEL_NUM, "Initializing root schema for {}".format(bundle_name))
         # TODO: turn on and off libyang logging
         capabilities = self._get_bundle_capabilities(bundle_name)
         lookup_tables = self._get_bundle_capability_lookup_tables(bundle_name)
-        self._root_schema_table[name] = repo.create_root_schema(lookup_tables, capabilities)
+        return repo.create_root_schema(lookup_tables, capabilities)
+
+    def _get_bundle_key(self, bundle_name):
+        """Return (version, sorted capabilities) of bundle_name, looked up
+        once per _yang_ns module of the bundle.
+
+        Args:
+            bundle_name (str): bundle name.
+        """
+        mod_yang_ns = self._get_bundle_yang_ns(bundle_name)
+        entry = _bundle_keys.get(bundle_name)
+        if entry is None or entry[0] is not mod_yang_ns:
+            capability_map = self._get_bundle_capability_map(bundle_name)
+            entry = (mod_yang_ns, self._get_bundle_version(bundle_name),
+                     tuple(sorted(capability_map.items())))
+            _bundle_keys[bundle_name] = entry
+        return entry[1], entry[2]
+
+    def _get_bundle_version(self, bundle_name):
+        """Return version of the installed ydk-models package for bundle_name,
+        or None if it is not installed as a distribution.
+
+        Args:
+            bundle_name (str): bundle name.
+        """
+        try:
+            import pkg_resources
+            return pkg_resources.get_distribution('ydk-models-{}'.format(bundle_name)).version
+        except Exception:
+            return None
+
+    def _get_bundle_capability_map(self, bundle_name):
+        """Search installed local ydk-models python packages, and return the
+        bundle's capability map.
+
+        Args:
+            bundle_name (str): bundle name.
+
+        Returns:
+            capability_map (dict(str, str)): Module name to revision.
+        """
+        mod_yang_ns = self._get_bundle_yang_ns(bundle_name)
+        if mod_yang_ns is None:
+            return {}
+        return mod_yang_ns.__dict__['CAPABILITIES']
 
     def _get_bundle_yang_ns(self, bundle_name):
         """Search installed local ydk-models python packages, and return _yang_ns
@@ -120,16 +197,7 @@ class CodecServiceProvider(object):
         Returns:
             mod_yang_ns (module): bundle's _yang_ns module.
         """
-        mod_yang_ns = None
-        for (_, name, ispkg) in pkgutil.iter_modules(models.__path__):
-            if ispkg and name == bundle_name:
-                try:
-                    mod_yang_ns = importlib.import_module('ydk.models.{}._yang_ns'.format(name))
-                    break
-                except ImportError:
-                    continue
-
-        return mod_yang_ns
+        return _bundle_index.get_yang_ns(bundle_name)
 
     def _get_bundle_capability_lookup_tables(self, bundle_name):
         """Search installed local ydk-models python packages, and return corresponding
@@ -0,0 +1,345 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""netconf_provider_pool.py
+Pool of warm NetconfServiceProvider sessions.
+"""
+import time
+import logging
+import threading
+import contextlib
+from collections import deque
+
+from ydk.ext.providers import NetconfServiceProvider as _NetconfServiceProvider
+from ydk.ext.services import NetconfService as _NetconfService
+from ydk.errors import YPYError as _YPYError
+from ydk.errors import YPYClientError as _YPYClientError
+from ydk.errors import YPYServiceProviderError as _YPYServiceProviderError
+from ydk.errors.error_handler import handle_runtime_error as _handle_error
+
+
+def probe_session(provider):
+    """Default liveness probe, a get-config with an empty subtree filter.
+
+    An empty filter selects no data (RFC 6241, section 6.4.2), so the
+    reply is small regardless of the size of the device configuration.
+    """
+    session = provider.get_session()
+    rpc = session.get_root_schema().create_rpc("ietf-netconf:get-config")
+    rpc.get_input_node().create_datanode("source/running")
+    rpc.get_input_node().create_datanode("filter", "")
+    session.invoke(rpc)
+
+
+class _DeviceSessions(object):
+    """Sessions of one device, identified by (address, port, username, protocol)."""
+    def __init__(self, password):
+        self.password = password
+        self.idle = deque()
+        self.open_count = 0
+        self.root_schema = None
+        # On demand model downloads for the shared root schema go through
+        # the client of the session which created it. That session is not
+        # handed out, so its client is only used for the downloads, which
+        # the schema serializes, and it is closed with the last session.
+        self.schema_owner = None
+        self.schema_lock = threading.Lock()
+
+
+class NetconfProviderPool(object):
+    """Thread-safe pool of NetconfServiceProvider sessions.
+
+    Sessions are kept open between uses and handed out again for the same
+    device, so short jobs skip the connection setup, capability exchange
+    and root schema creation. All sessions of a device share one root
+    schema, created by one more session to the device which is not handed
+    out and downloads the models of the schema. It is not counted in the
+    session limits, and is closed when the last session of the device is.
+
+    Args:
+        max_sessions_per_device (int, optional): Maximum number of open
+            sessions per device, defaults to 4.
+        max_sessions (int, optional): Maximum number of open sessions in
+            the pool, defaults to no limit.
+        probe_interval (float, optional): An idle session older than this
+            many seconds is probed before being handed out, defaults to 60.
+            None disables probing.
+        probe (callable, optional): Liveness probe called with a provider,
+            raising on failure. Defaults to :func:`probe_session`.
+        on_demand (bool, optional): On demand model loading, defaults to True.
+        common_cache (bool, optional): Use the common model cache, defaults
+            to False.
+        share_schema (bool, optional): Share the root schema among the
+            sessions of a device, defaults to True.
+
+    Attributes:
+        logger (logging.Logger): NetconfProviderPool logger.
+    """
+
+    def __init__(self, max_sessions_per_device=4, max_sessions=None,
+                 probe_interval=60, probe=probe_session,
+                 on_demand=True, common_cache=False, share_schema=True):
+        if max_sessions_per_device < 1 or (max_sessions is not None and max_sessions < 1):
+            raise _YPYServiceProviderError("Session limits must be positive integers")
+        self.logger = logging.getLogger(__name__)
+        self.max_sessions_per_device = max_sessions_per_device
+        self.max_sessions = max_sessions
+        self.probe_interval = probe_interval
+        self.probe = probe
+        self.on_demand = on_demand
+        self.common_cache = common_cache
+        self.share_schema = share_schema
+
+        self._cond = threading.Condition()
+        self._devices = {}
+        self._checked_out = {}
+        self._open_count = 0
+        self._closed = False
+
+    def checkout(self, address, username, password, port=830, protocol="ssh", timeout=None):
+        """Return a provider connected to the device.
+
+        An idle session is reused if there is one, otherwise a new session
+        is opened, waiting for a free slot if a session limit is reached.
+
+        Args:
+            address (str): Device address.
+            username (str): Username.
+            password (str): Password.
+            port (int, optional): Port, defaults to 830.
+            protocol (str, optional): 'ssh' or 'tcp', defaults to 'ssh'.
+            timeout (float, optional): Seconds to wait for a free slot,
+                defaults to waiting forever.
+
+        Returns:
+            A ydk.providers.NetconfServiceProvider, to be returned with
+            :meth:`checkin`.
+
+        Raises:
+            YPYServiceProviderError if no slot became free in time, or the
+            pool is closed. YPYError if the connection fails.
+        """
+        key = (address, port, username, protocol)
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            provider, last_used = self._reserve(key, password, deadline)
+            if provider is None:
+                provider = self._connect(key)
+            elif not self._is_alive(provider, last_used):
+                self._discard(key, provider)
+                continue
+            with self._cond:
+                self._checked_out[id(provider)] = (key, provider)
+            return provider
+
+    def checkin(self, provider, discard=False):
+        """Return a provider to the pool.
+
+        Args:
+            provider (ydk.providers.NetconfServiceProvider): A provider
+                obtained from :meth:`checkout`.
+            discard (bool, optional): Close the session instead of keeping
+                it, e.g. after a transport error. Defaults to False.
+        """
+        with self._cond:
+            entry = self._checked_out.pop(id(provider), None)
+            if entry is None:
+                raise _YPYServiceProviderError("Provider was not checked out from this pool")
+            key = entry[0]
+            if not discard and not self._closed:
+                self._devices[key].idle.append((provider, time.time()))
+                self._cond.notify_all()
+                return
+        self._discard(key, provider)
+
+    @contextlib.contextmanager
+    def connection(self, address, username, password, port=830, protocol="ssh", timeout=None):
+        """Check out a provider for the duration of a with block.
+
+        The session is discarded if the block raises YPYClientError, so the
+        next checkout reconnects to the device.
+        """
+        provider = self.checkout(address, username, password, port, protocol, timeout)
+        try:
+            yield provider
+        except _YPYClientError:
+            self.checkin(provider, discard=True)
+            raise
+        except BaseException:
+            self.checkin(provider)
+            raise
+        else:
+            self.checkin(provider)
+
+    def warm(self, address, username, password, port=830, protocol="ssh", count=1):
+        """Open sessions until the device has at least count of them."""
+        providers = []
+        try:
+            while len(providers) < count:
+                with self._cond:
+                    device = self._devices.get((address, port, username, protocol))
+                    if device is not None and device.open_count >= count:
+                        break
+                providers.append(self.checkout(address, username, password, port, protocol))
+        finally:
+            for provider in providers:
+                self.checkin(provider)
+
+    def keepalive(self):
+        """Probe all idle sessions, closing the ones which fail.
+
+        Call periodically to keep idle sessions from timing out on the
+        device.
+        """
+        with self._cond:
+            idle = []
+            for key, device in self._devices.items():
+                while device.idle:
+                    idle.append((key, device.idle.popleft()[0]))
+                    self._checked_out[id(idle[-1][1])] = idle[-1]
+        for key, provider in idle:
+            self.checkin(provider, discard=not self._is_alive(provider, None))
+
+    def close(self):
+        """Close all idle sessions. Checked out sessions are closed on checkin."""
+        with self._cond:
+            self._closed = True
+            idle = []
+            for key, device in self._devices.items():
+                idle.extend((key, provider) for provider, _ in device.idle)
+                device.idle.clear()
+        for key, provider in idle:
+            self._discard(key, provider)
+
+    def _reserve(self, key, password, deadline):
+        """Pop an idle session or reserve a slot for a new one."""
+        while True:
+            with self._cond:
+                evicted = self._try_reserve(key, password, deadline)
+            if evicted is None:
+                return None, None
+            if evicted[0] == key:
+                return evicted[1]
+            self._discard(evicted[0], evicted[1][0])
+
+    def _try_reserve(self, key, password, deadline):
+        """Called with the lock held. Returns None once a slot is reserved,
+        else (key, (provider, last_used)) of an idle session taken off the
+        pool.
+        """
+        while True:
+            if self._closed:
+                raise _YPYServiceProviderError("Pool is closed")
+            device = self._devices.get(key)
+            if device is None:
+                device = self._devices[key] = _DeviceSessions(password)
+            if device.idle:
+                return key, device.idle.pop()
+            if device.open_count < self.max_sessions_per_device:
+                if self.max_sessions is None or self._open_count < self.max_sessions:
+                    device.open_count += 1
+                    self._open_count += 1
+                    return None
+                # the pool is full, close the least recently used idle
+                # session of another device to make room
+                oldest = None
+                for other_key, other in self._devices.items():
+                    if other.idle and (oldest is None or other.idle[0][1] < oldest[1].idle[0][1]):
+                        oldest = (other_key, other)
+                if oldest is not None:
+                    return oldest[0], oldest[1].idle.popleft()
+            remaining = None if deadline is None else deadline - time.time()
+            if remaining is not None and remaining <= 0:
+                raise _YPYServiceProviderError("Timed out waiting for a session to {}".format(key[0]))
+            self._cond.wait(remaining)
+
+    def _connect(self, key):
+        """Open a session in a reserved slot."""
+        address, port, username, protocol = key
+        device = self._devices[key]
+        try:
+            with _handle_error():
+                if self.share_schema:
+                    provider = _NetconfServiceProvider(root_schema=self._get_root_schema(key),
+                                                       address=address, username=username,
+                                                       password=device.password, port=port,
+                                                       protocol=protocol)
+                else:
+                    provider = _NetconfServiceProvider(address, username, device.password, port,
+                                                       protocol, self.on_demand, self.common_cache)
+        except BaseException:
+            self._release_slot(key)
+            raise
+        self.logger.debug("Opened session to {} on port {}".format(address, port))
+        return provider
+
+    def _get_root_schema(self, key):
+        """Return the shared root schema of a device with a reserved slot,
+        opening the session which owns it first if there is none.
+        """
+        address, port, username, protocol = key
+        device = self._devices[key]
+        with device.schema_lock:
+            if device.root_schema is None:
+                owner = _NetconfServiceProvider(address, username, device.password, port,
+                                                protocol, self.on_demand, self.common_cache)
+                self.logger.debug("Opened schema session to {} on port {}".format(address, port))
+                with self._cond:
+                    device.schema_owner = owner
+                    device.root_schema = owner.get_root_schema()
+            return device.root_schema
+
+    def _is_alive(self, provider, last_used):
+        if self.probe is None or self.probe_interval is None:
+            return True
+        if last_used is not None and time.time() - last_used < self.probe_interval:
+            return True
+        try:
+            with _handle_error():
+                self.probe(provider)
+        except _YPYError as err:
+            self.logger.debug("Session probe failed: {}".format(err))
+            return False
+        return True
+
+    def _discard(self, key, provider):
+        self.logger.debug("Closing session to {} on port {}".format(key[0], key[1]))
+        self._close_session(provider)
+        self._release_slot(key)
+
+    def _close_session(self, provider):
+        try:
+            with _handle_error():
+                _NetconfService().close_session(provider)
+        except _YPYError as err:
+            self.logger.debug("Session close failed: {}".format(err))
+
+    def _release_slot(self, key):
+        owner = None
+        with self._cond:
+            device = self._devices[key]
+            device.open_count -= 1
+            self._open_count -= 1
+            if device.open_count == 0 and not device.idle:
+                # no session uses the schema any more, the next one
+                # rebuilds it
+                owner = device.schema_owner
+                device.root_schema = None
+                device.schema_owner = None
+            self._cond.notify_all()
+        if owner is not None:
+            self.logger.debug("Closing schema session to {} on port {}".format(key[0], key[1]))
+            self._close_session(owner)
@@ -0,0 +1,187 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""schema_cache.py
+Process wide cache of root schemas built from local YANG models.
+"""
+import os
+import logging
+import threading
+from collections import OrderedDict
+
+
+class _Entry(object):
+    def __init__(self, root_schema, size):
+        self.root_schema = root_schema
+        self.size = size
+
+
+class RootSchemaCache(object):
+    """Thread-safe cache of root schemas.
+
+    Building a root schema parses every YANG module of a bundle, so the
+    schema is built once per key and shared by every provider asking for
+    it. Least recently used entries are evicted once a limit is exceeded.
+    Evicting an entry only drops the reference held by the cache, providers
+    still using the schema keep it alive.
+
+    A root schema cannot be written to disk, to share schemas with forked
+    worker processes populate the cache before forking, the workers then
+    inherit the parsed schemas.
+
+    Args:
+        max_entries (int, optional): Maximum number of schemas, defaults to
+            no limit.
+        max_bytes (int, optional): Maximum total estimated size of the
+            schemas, defaults to no limit.
+
+    Attributes:
+        logger (logging.Logger): RootSchemaCache logger.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None):
+        self.logger = logging.getLogger(__name__)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._building = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key, create, size=0):
+        """Return the schema cached for key, calling create() on a miss.
+
+        Concurrent misses for the same key wait for a single create() call.
+
+        Args:
+            key (tuple): Cache key, the first item is the bundle name.
+            create (callable): Returns a new ydk.path.RootSchemaNode.
+            size (int or callable, optional): Estimated size of the schema
+                in bytes, or a callable returning it, only called on a miss.
+
+        Returns:
+            ydk.path.RootSchemaNode
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    # re-insert to mark as most recently used
+                    del self._entries[key]
+                    self._entries[key] = entry
+                    return entry.root_schema
+                building = self._building.get(key)
+                if building is None:
+                    building = self._building[key] = threading.Event()
+                    break
+            building.wait()
+
+        try:
+            root_schema = create()
+            if callable(size):
+                size = size()
+        except BaseException:
+            with self._lock:
+                del self._building[key]
+            building.set()
+            raise
+
+        with self._lock:
+            del self._building[key]
+            self._entries[key] = _Entry(root_schema, size)
+            self._bytes += size
+            self._shrink()
+        building.set()
+        self.logger.debug("Cached root schema for {}, {} bytes".format(key[0], size))
+        return root_schema
+
+    def evict(self, bundle_name=None):
+        """Drop the schemas of bundle_name, or all schemas if not given.
+
+        Returns:
+            int: Number of evicted schemas.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if bundle_name is None or key[0] == bundle_name]
+            for key in keys:
+                self._bytes -= self._entries.pop(key).size
+        return len(keys)
+
+    def clear(self):
+        """Drop all schemas."""
+        self.evict()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    @property
+    def memory_usage(self):
+        """int: Total estimated size of the cached schemas in bytes."""
+        with self._lock:
+            return self._bytes
+
+    def _shrink(self):
+        """Called with the lock held, evict until within the limits."""
+        while len(self._entries) > 1 and self._over_limit():
+            key, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self.logger.debug("Evicted root schema for {}".format(key[0]))
+
+    def _over_limit(self):
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _after_fork(self):
+        # a lock held by another thread at fork time is never released in
+        # the child, schemas being built there are rebuilt on demand
+        self._lock = threading.Lock()
+        self._building = {}
+
+
+def estimate_schema_size(models_path, capabilities):
+    """Estimate the memory used by a root schema.
+
+    Uses the size of the YANG files the schema is built from, which grows
+    in proportion with the parsed schema.
+
+    Args:
+        models_path (str): Location of the YANG models.
+        capabilities (iterable of (str, str)): Module names and revisions.
+
+    Returns:
+        int: Size in bytes.
+    """
+    size = 0
+    for name, revision in capabilities:
+        for file_name in ('{}@{}.yang'.format(name, revision), '{}.yang'.format(name)):
+            try:
+                size += os.path.getsize(os.path.join(models_path, file_name))
+                break
+            except OSError:
+                continue
+    return size
+
+
+root_schema_cache = RootSchemaCache()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=root_schema_cache._after_fork)
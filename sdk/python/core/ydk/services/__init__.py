@@ -16,10 +16,12 @@
 
 from .codec_service import CodecService
 from .crud_service import CRUDService
+from .diff_service import DiffService
 from .netconf_service import NetconfService
 from .executor_service import ExecutorService
+from .transaction import Transaction
 from ydk.ext.services import Datastore
 
 
-__all__ = [ "CodecService", "CRUDService",
-            "ExecutorService", "NetconfService", "Datastore" ]
+__all__ = [ "CodecService", "CRUDService", "DiffService",
+            "ExecutorService", "NetconfService", "Transaction", "Datastore" ]
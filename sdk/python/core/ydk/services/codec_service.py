@@ -14,17 +14,15 @@
 # limitations under the License.
 # ------------------------------------------------------------------
 
-import os
 import sys
 import json
 import logging
-import pkgutil
-import importlib
 import xml.etree.ElementTree
 
 from ydk.entity_utils import get_data_node_from_entity as _get_data_node_from_entity
 from ydk.entity_utils import get_entity_from_data_node as _get_entity_from_data_node
 from ydk.entity_utils import XmlSubtreeCodec
+from ydk.entity_utils.bundle_index import bundle_index as _bundle_index
 from ydk.path import Codec as _Codec
 from ydk.errors import YPYServiceProviderError as _YPYServiceProviderError
 from ydk.errors import YPYServiceError as _YPYServiceError
@@ -101,7 +99,7 @@ class CodecService(object):
             data_node = _get_data_node_from_entity(entity, root_schema)
             codec_service = _Codec()
             result = codec_service.encode(data_node, provider.encoding, pretty)
-            self.logger.debug("Performing encode operation, resulting in {}".format(result))
+            self.logger.debug("Performing encode operation, resulting in %s", result)
             return result
 
     @_check_argument
@@ -157,7 +155,7 @@ class CodecService(object):
 
         root_schema = provider.get_root_schema(bundle_name)
 
-        self.logger.debug("Performing decode operation on {}".format(payload))
+        self.logger.debug("Performing decode operation on %s", payload)
 
         codec_service = _Codec()
         root_data_node = codec_service.decode(root_schema, payload, provider.encoding)
@@ -177,7 +175,8 @@ class CodecService(object):
         tuple of namespace and entity name as a key and search for local
         installed YDK model packages, and return top level entity instance if
         such key matches entry in the `ENTITY_LOOKUP` for local installed YDK
-        model packages.
+        model packages. The lookup tables of all packages are merged into an
+        index on first use, see ydk.entity_utils.bundle_index.
 
         Args:
             payload (str): Incoming payload.
@@ -192,19 +191,12 @@ class CodecService(object):
             YPYServiceProviderError if search fails.
         """
         ns_ename = _get_ns_ename(payload, encoding)
-        ydk_models = importlib.import_module('ydk.models')
-        for (_, name, ispkg) in pkgutil.iter_modules(ydk_models.__path__):
-            if ispkg:
-                yang_ns = importlib.import_module('ydk.models.{}._yang_ns'.format(name))
-                entity_lookup = yang_ns.__dict__['ENTITY_LOOKUP']
-                if ns_ename in entity_lookup:
-                    mod, entity = entity_lookup[ns_ename].split('.', 1)
-                    mod = importlib.import_module('ydk.models.{}.{}'.format(name, mod))
-                    entity = getattr(mod, entity)()
-                    return entity.clone_ptr()
-
-        self.logger.debug(_ENTITY_ERROR_MSG.format(ename))
-        raise _YPYServiceProviderError(_ENTITY_ERROR_MSG.format(ename))
+        entity_class = _bundle_index.get_entity_class(*ns_ename)
+        if entity_class is None:
+            ename = ':'.join(ns_ename)
+            self.logger.debug(_ENTITY_ERROR_MSG.format(ename))
+            raise _YPYServiceProviderError(_ENTITY_ERROR_MSG.format(ename))
+        return entity_class().clone_ptr()
 
 
 def _get_string(string):
@@ -249,9 +241,7 @@ def _get_yang_path(entity):
     Returns:
         Path for installed YANG models location (str).
     """
-    m = entity.__module__.rsplit('.', 1)[0]
-    m = importlib.import_module(m)
-    return os.path.join(m.__path__[0], '_yang')
+    return _bundle_index.get_package_info(entity.__module__.rsplit('.', 1)[0])[1]
 
 
 def _get_bundle_name(entity):
@@ -263,6 +253,4 @@ def _get_bundle_name(entity):
     Returns:
         bundle name.
     """
-    m = entity.__module__.rsplit('.', 1)[0]
-    m = importlib.import_module('.'.join([m, '_yang_ns']))
-    return m.__dict__['BUNDLE_NAME']
+    return _bundle_index.get_package_info(entity.__module__.rsplit('.', 1)[0])[0]
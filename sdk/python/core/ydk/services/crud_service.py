@@ -16,6 +16,8 @@
 from ydk.ext.services import CRUDService as _CrudService
 from ydk.errors.error_handler import handle_runtime_error as _handle_error
 from ydk.errors.error_handler import check_argument as _check_argument
+from ydk.errors import YPYServiceError as _YPYServiceError
+from .diff_service import DiffService as _DiffService
 
 
 class CRUDService(_CrudService):
@@ -48,3 +50,78 @@ class CRUDService(_CrudService):
     def delete(self, provider, entity):
         with _handle_error():
             return self._crud.delete(provider, entity)
+
+    @_check_argument
+    def create_many(self, provider, entities):
+        with _handle_error():
+            return self._crud.create_many(provider, entities)
+
+    @_check_argument
+    def read_many(self, provider, read_filters):
+        with _handle_error():
+            return self._crud.read_many(provider, read_filters)
+
+    @_check_argument
+    def read_config_many(self, provider, read_filters):
+        with _handle_error():
+            return self._crud.read_config_many(provider, read_filters)
+
+    @_check_argument
+    def update_many(self, provider, entities):
+        with _handle_error():
+            return self._crud.update_many(provider, entities)
+
+    @_check_argument
+    def delete_many(self, provider, entities):
+        with _handle_error():
+            return self._crud.delete_many(provider, entities)
+
+    @_check_argument
+    def sync(self, provider, desired, current=None):
+        """Update the device so that its configuration of the top level
+        entity desired matches desired, sending only the changes, see
+        DiffService.diff. current is read from the device with read_config
+        if not given.
+
+        Returns:
+            The result of update, or True if there is nothing to change.
+        """
+        if current is None:
+            if desired.parent is not None:
+                raise _YPYServiceError("current is needed to sync '{}', it is not a top level entity"
+                                       .format(type(desired).__name__))
+            current = self.read_config(provider, type(desired)())
+            if current is None:
+                current = type(desired)()
+        delta = _DiffService().diff(desired, current)
+        if delta is None:
+            return True
+        return self.update(provider, delta)
+
+    @_check_argument
+    def read_iter(self, provider, read_filter, path):
+        return self._iter_entries(self._crud.read_iter, provider, read_filter, path)
+
+    @_check_argument
+    def read_config_iter(self, provider, read_filter, path):
+        return self._iter_entries(self._crud.read_config_iter, provider, read_filter, path)
+
+    def _iter_entries(self, read_iter, provider, read_filter, path):
+        """Yield the entries of the list at path one at a time.
+
+        Each entry keeps a reference to its top level entity, which owns
+        the ancestors of the entry.
+        """
+        with _handle_error():
+            stream = read_iter(provider, read_filter, path)
+        while True:
+            with _handle_error():
+                entry = stream.next()
+            if entry is None:
+                return
+            top_entity = entry
+            while top_entity.parent is not None:
+                top_entity = top_entity.parent
+            if top_entity is not entry:
+                entry.__dict__['_read_top_entity'] = top_entity
+            yield entry
@@ -0,0 +1,232 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""diff_service.py
+DiffService, computes the edit which changes one entity tree into another.
+"""
+from ydk.filters import YFilter as _YFilter
+from ydk.errors import YPYServiceError as _YPYServiceError
+
+
+class DiffService(object):
+    """ Computes the edit which changes one entity tree into another.
+    """
+    def diff(self, desired, current):
+        """Return an entity holding only the changes from current to
+        desired, or None if the trees are the same.
+
+        Leafs, leaf-lists, list entries and containers which are in
+        desired and not in current, or have another value, are set in the
+        returned entity and merged by CRUDService.update. The ones which
+        are only in current are annotated with YFilter.remove. List
+        entries are matched by key and leaf-lists are compared as sets. A
+        leaf-list which both gains and loses values replaces its parent,
+        which is copied from desired and annotated with YFilter.replace.
+
+        Only the leafs and children which were created in the trees are
+        visited, the time taken grows with the size of the trees.
+
+        Args:
+            desired (ydk.types.Entity): Entity tree as it should be.
+            current (ydk.types.Entity): Entity tree as it is, of the same
+                class as desired.
+
+        Raises:
+            YPYServiceError: If the entities are of different classes, or
+                a list to compare has no keys.
+        """
+        if None in (desired, current):
+            raise _YPYServiceError("desired and current cannot be None")
+        if type(desired) is not type(current):
+            raise _YPYServiceError("Cannot diff '{}' against '{}'"
+                                   .format(type(desired).__name__, type(current).__name__))
+        return _diff_entity(desired, current)
+
+
+def _diff_entity(desired, current):
+    """Return a new entity of the class of desired with the changes from
+    current to desired, or None if there are none.
+    """
+    delta = None
+    desired_attrs = desired.__dict__
+    current_attrs = current.__dict__
+
+    for name in desired._leaf_names:
+        want = _get_set_leaf(desired_attrs, name)
+        have = _get_set_leaf(current_attrs, name)
+        if want is not None:
+            if have is not None and want.get() == have.get():
+                continue
+            delta = delta or _new_delta(desired)
+            delta._set_leaf(name, want)
+        elif have is not None:
+            delta = delta or _new_delta(desired)
+            getattr(delta, name).yfilter = _YFilter.remove
+
+    for name in desired._leaf_list_names:
+        want = _get_leaf_list_values(desired_attrs, name)
+        have = _get_leaf_list_values(current_attrs, name)
+        if want == have:
+            continue
+        want_values = set(want)
+        have_values = set(have)
+        added = [value for value in want if value not in have_values]
+        removed = [value for value in have if value not in want_values]
+        if added and removed:
+            delta = _copy_entity(desired)
+            delta.yfilter = _YFilter.replace
+            return delta
+        if added or removed:
+            delta = delta or _new_delta(desired)
+            leaf_list = getattr(delta, name)
+            leaf_list.extend(added or removed)
+            if removed:
+                leaf_list.yfilter = _YFilter.remove
+
+    for name in desired._child_container_names:
+        want = desired_attrs.get(name)
+        have = current_attrs.get(name)
+        if want is not None and not _exists(want):
+            want = None
+        if want is None and have is None:
+            continue
+        if have is None:
+            child_delta = _copy_entity(want)
+        elif want is None:
+            if not _exists(have):
+                continue
+            child_delta = _new_delta(have)
+            child_delta.yfilter = _YFilter.remove
+        else:
+            child_delta = _diff_entity(want, have)
+            if child_delta is None:
+                continue
+        delta = delta or _new_delta(desired)
+        setattr(delta, name, child_delta)
+
+    for name in desired._child_list_names:
+        want = desired_attrs.get(name) or ()
+        have = current_attrs.get(name) or ()
+        if not want and not have:
+            continue
+        entries = _diff_list(want, have, name, desired)
+        if entries:
+            delta = delta or _new_delta(desired)
+            getattr(delta, name).extend(entries)
+
+    return delta
+
+
+def _diff_list(want, have, name, parent):
+    """Return the delta entries of YList name of parent."""
+    entry = want[0] if want else have[0]
+    key_names = entry._key_names
+    if not key_names:
+        raise _YPYServiceError("Cannot match entries of list '{}' of '{}', it has no keys"
+                               .format(name, type(parent).__name__))
+
+    have_entries = dict((_get_key(entry, key_names), entry) for entry in have)
+    entries = []
+    for entry in want:
+        match = have_entries.pop(_get_key(entry, key_names), None)
+        if match is None:
+            entries.append(_copy_entity(entry))
+            continue
+        entry_delta = _diff_entity(entry, match)
+        if entry_delta is not None:
+            entries.append(entry_delta)
+    # entries only in current, in their order
+    for entry in have:
+        if _get_key(entry, key_names) in have_entries:
+            entry_delta = _new_delta(entry)
+            entry_delta.yfilter = _YFilter.remove
+            entries.append(entry_delta)
+    return entries
+
+
+def _new_delta(entity):
+    """Return a new entity of the class of entity, with its keys."""
+    delta = type(entity)()
+    attrs = entity.__dict__
+    for name in entity._key_names:
+        leaf = _get_set_leaf(attrs, name)
+        if leaf is not None:
+            delta._set_leaf(name, leaf)
+    return delta
+
+
+def _copy_entity(entity):
+    """Return a copy of the leafs, leaf-lists and children of entity."""
+    copy = type(entity)()
+    attrs = entity.__dict__
+    for name in entity._leaf_names:
+        leaf = _get_set_leaf(attrs, name)
+        if leaf is not None:
+            copy._set_leaf(name, leaf)
+    for name in entity._leaf_list_names:
+        values = _get_leaf_list_values(attrs, name)
+        if values:
+            getattr(copy, name).extend(values)
+    for name in entity._child_container_names:
+        child = attrs.get(name)
+        if child is not None:
+            setattr(copy, name, _copy_entity(child))
+    for name in entity._child_list_names:
+        ylist = attrs.get(name)
+        if ylist:
+            getattr(copy, name).extend([_copy_entity(entry) for entry in ylist])
+    return copy
+
+
+def _exists(entity):
+    """Return True if entity is a presence container or has data."""
+    if entity.is_presence_container:
+        return True
+    attrs = entity.__dict__
+    for name in entity._leaf_names:
+        if _get_set_leaf(attrs, name) is not None:
+            return True
+    for name in entity._leaf_list_names:
+        leaf_list = attrs.get(name)
+        if leaf_list is not None and len(leaf_list) > 0:
+            return True
+    for name in entity._child_container_names:
+        child = attrs.get(name)
+        if child is not None and _exists(child):
+            return True
+    for name in entity._child_list_names:
+        if attrs.get(name):
+            return True
+    return False
+
+
+def _get_set_leaf(attrs, name):
+    leaf = attrs.get(name)
+    if leaf is not None and leaf.is_set:
+        return leaf
+    return None
+
+
+def _get_leaf_list_values(attrs, name):
+    leaf_list = attrs.get(name)
+    if leaf_list is None or len(leaf_list) == 0:
+        return []
+    return [leaf.get() for leaf in leaf_list.getYLeafs()]
+
+
+def _get_key(entry, key_names):
+    attrs = entry.__dict__
+    return tuple(attrs[name].get() if name in attrs else None for name in key_names)
@@ -0,0 +1,193 @@
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""transaction.py
+Transaction, batches CRUD operations into edit-configs committed together.
+"""
+import logging
+
+from ydk.ext.services import Datastore
+from ydk.filters import YFilter as _YFilter
+from ydk.errors import YPYServiceError as _YPYServiceError
+from ydk.errors import YPYError as _YPYError
+from ydk.providers import CodecServiceProvider as _CodecServiceProvider
+from .netconf_service import NetconfService as _NetconfService
+from .codec_service import CodecService as _CodecService
+
+
+class Transaction(object):
+    """Batches create, update and delete operations on a NETCONF device
+    into a single edit-config, sent with one lock, validate, commit and
+    unlock::
+
+        with Transaction(provider) as tx:
+            tx.update(bgp)
+            tx.delete(ospf)
+
+    The operations are kept until the transaction is committed when the
+    with block ends, or flushed when max_entities entities or max_size
+    bytes of encoded XML are pending. A flush sends the pending
+    operations in one edit-config, taking the lock first if it is the
+    first one; on the candidate datastore nothing is applied before the
+    commit. If the block raises, the changes sent to the candidate
+    datastore are discarded and the lock released.
+
+    Like CRUDService, create and update merge the entity, and delete
+    deletes it. Operations set on an entity with its yfilter take
+    precedence.
+
+    Args:
+        provider (ydk.providers.NetconfServiceProvider): Provider instance.
+        target (ydk.services.Datastore, optional): candidate or running,
+            defaults to candidate.
+        confirmed (bool, optional): Send a confirmed commit, which the
+            device rolls back unless it is confirmed by another commit
+            within confirm_timeout seconds.
+        confirm_timeout (int, optional): Timeout of the confirmed commit,
+            the device default if -1.
+        validate (bool, optional): Validate the candidate datastore before
+            committing, defaults to True.
+        max_entities (int, optional): Flush when this many entities are
+            pending.
+        max_size (int, optional): Flush when the pending entities encode to
+            this many bytes of XML. Every entity is encoded once more to
+            measure it, so it is only done when set.
+    """
+    def __init__(self, provider, target=Datastore.candidate, confirmed=False,
+                 confirm_timeout=-1, validate=True, max_entities=None, max_size=None):
+        if None in (provider, target):
+            raise _YPYServiceError("provider and target cannot be None")
+        if target not in (Datastore.candidate, Datastore.running):
+            raise _YPYServiceError("target must be candidate or running")
+        self.logger = logging.getLogger(__name__)
+        self.provider = provider
+        self.target = target
+        self.confirmed = confirmed
+        self.confirm_timeout = confirm_timeout
+        self.validate = validate
+        self.max_entities = max_entities
+        self.max_size = max_size
+        self._ns = _NetconfService()
+        self._pending = []
+        self._pending_size = 0
+        self._locked = False
+        self._flushed = False
+        self._codec = None
+        self._codec_provider = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self._abort_after_error()
+        return False
+
+    def create(self, entity):
+        """Add an operation creating entity, see CRUDService.create."""
+        self._add(entity, _YFilter.merge)
+
+    def update(self, entity):
+        """Add an operation updating entity, see CRUDService.update."""
+        self._add(entity, _YFilter.merge)
+
+    def delete(self, entity):
+        """Add an operation deleting entity, see CRUDService.delete."""
+        self._add(entity, _YFilter.delete)
+
+    def flush(self):
+        """Send the pending operations in one edit-config, locking the
+        target first if it is not locked yet.
+        """
+        if not self._pending:
+            return
+        if not self._locked:
+            self._ns.lock(self.provider, self.target)
+            self._locked = True
+        pending, self._pending, self._pending_size = self._pending, [], 0
+        # a failed edit-config may leave some changes to discard
+        self._flushed = True
+        self.logger.debug("Sending %d entities in one edit-config", len(pending))
+        entities = []
+        previous = []
+        try:
+            for entity, yfilter in pending:
+                previous.append(entity.yfilter)
+                if entity.yfilter == _YFilter.not_set:
+                    entity.yfilter = yfilter
+                entities.append(entity)
+            self._ns.edit_config(self.provider, self.target, entities)
+        finally:
+            for entity, yfilter in zip(entities, previous):
+                entity.yfilter = yfilter
+
+    def commit(self):
+        """Flush the pending operations, then validate and commit the
+        candidate datastore and release the lock.
+        """
+        try:
+            self.flush()
+            if self._flushed and self.target == Datastore.candidate:
+                if self.validate:
+                    self._ns.validate(self.provider, source=Datastore.candidate)
+                self._ns.commit(self.provider, self.confirmed, self.confirm_timeout)
+        except _YPYError as error:
+            self._abort_after_error()
+            raise error
+        self._unlock()
+        self._flushed = False
+
+    def abort(self):
+        """Drop the pending operations, discard the changes sent to the
+        candidate datastore and release the lock.
+        """
+        self._pending, self._pending_size = [], 0
+        try:
+            if self._flushed and self.target == Datastore.candidate:
+                self._ns.discard_changes(self.provider)
+        finally:
+            self._flushed = False
+            self._unlock()
+
+    def _abort_after_error(self):
+        # an error of the abort would hide the one which caused it
+        try:
+            self.abort()
+        except Exception:
+            self.logger.error("Failed to abort the transaction", exc_info=True)
+
+    def _add(self, entity, yfilter):
+        if entity is None:
+            raise _YPYServiceError("entity cannot be None")
+        self._pending.append((entity, yfilter))
+        if self.max_size is not None:
+            self._pending_size += self._get_size(entity)
+        if (self.max_entities is not None and len(self._pending) >= self.max_entities) or \
+           (self.max_size is not None and self._pending_size >= self.max_size):
+            self.flush()
+
+    def _get_size(self, entity):
+        if self._codec is None:
+            self._codec = _CodecService()
+            self._codec_provider = _CodecServiceProvider(type='xml')
+        return len(self._codec.encode(self._codec_provider, entity, pretty=False))
+
+    def _unlock(self):
+        if self._locked:
+            self._locked = False
+            self._ns.unlock(self.provider, self.target)
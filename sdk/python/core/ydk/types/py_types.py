@@ -21,12 +21,22 @@
         - YLeafList
         - Entity
 """
+import sys as _sys
+import array as _array
+import numbers as _numbers
+import weakref as _weakref
+import functools as _functools
+
 from ydk.ext.types import ChildrenMap
+from ydk.ext.types import Enum as _Enum
 from ydk.ext.types import YLeaf as _YLeaf
 from ydk.ext.types import YLeafList as _YLeafList
 from ydk.ext.types import Entity as _Entity
+from ydk.ext.types import LeafDataList as _LeafDataList
+from ydk.ext.types import YType as _YType
 from ydk.filters import YFilter as _YFilter
 from ydk.errors import YPYModelError as _YPYModelError
+from ydk.errors.error_handler import _raise
 
 
 class YList(list):
@@ -42,11 +52,23 @@ class YList(list):
         block of substatements that holds detailed list information.
 
         A list entry is uniquely identified by the values of the list's keys,
-        if defined.
+        if defined. Entries are indexed by their keys, so ``ylist[key]`` and
+        ``ylist.get(key)`` take constant time. The key is the key leaf value,
+        or a tuple of values for lists with several keys. Integers and
+        slices keep indexing the list by position, use ``get`` to look up
+        an integer key.
+
+        The index follows appends, removals and key leaves assigned through
+        the entity attributes. It is rebuilt if a lookup finds an entry
+        whose key was changed otherwise.
     """
     def __init__(self, parent):
         super(YList, self).__init__()
         self.parent = parent
+        self._key_index = None
+        self._path_index = None
+        self._indexed = None
+        self._indexed_all = True
 
     def __setattr__(self, name, value):
         if name == 'yfilter' and isinstance(value, _YFilter):
@@ -57,12 +79,210 @@ class YList(list):
 
     def append(self, item):
         item.parent = self.parent
+        item.__dict__['_ylist'] = _weakref.ref(self)
         super(YList, self).append(item)
+        if self._indexed is not None:
+            self._index_entry(item)
 
     def extend(self, items):
        for item in items:
            self.append(item)
 
+    def insert(self, index, item):
+        item.parent = self.parent
+        item.__dict__['_ylist'] = _weakref.ref(self)
+        super(YList, self).insert(index, item)
+        self._invalidate_index()
+
+    def remove(self, item):
+        super(YList, self).remove(item)
+        self._invalidate_index()
+
+    def pop(self, index=-1):
+        item = super(YList, self).pop(index)
+        self._invalidate_index()
+        return item
+
+    def clear(self):
+        del self[:]
+
+    def __setitem__(self, index, value):
+        super(YList, self).__setitem__(index, value)
+        self._invalidate_index()
+
+    def __delitem__(self, index):
+        super(YList, self).__delitem__(index)
+        self._invalidate_index()
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    # Python 2 slicing
+    def __setslice__(self, i, j, items):
+        self.__setitem__(slice(i, j), items)
+
+    def __delslice__(self, i, j):
+        self.__delitem__(slice(i, j))
+
+    def __getitem__(self, key):
+        if isinstance(key, (_numbers.Integral, slice)):
+            return super(YList, self).__getitem__(key)
+        entry = self.get(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry
+
+    def get(self, key, default=None):
+        """Return the entry with the given key, or default.
+
+        Args:
+            key: Key leaf value, or a tuple of values for lists with several keys.
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        key = tuple(_key_value_to_str(value) for value in key)
+        entry = self._lookup(0, key)
+        return default if entry is None else entry
+
+    def to_columns(self, leaves):
+        """Return the values of the given leaves of all entries, as a dict
+        of columns keyed by leaf name.
+
+        Integer leaves are returned as array.array of 64 bit integers and
+        decimal64 leaves as array.array of doubles, which numpy.frombuffer
+        takes without a copy. Other leaves are lists of the strings
+        returned by YLeaf.get. Unset leaves are 0 in integer columns, nan
+        in decimal64 columns and None in other columns. Leaves which are
+        not set in any entry are not created.
+
+        Args:
+            leaves (list of str): Leaf attribute names of the list entries.
+
+        Raises:
+            YPYModelError: If a name is not a leaf of the list entries.
+        """
+        columns = []
+        leaf_types = type(self[0])._leaf_types if len(self) > 0 else None
+        for name in leaves:
+            if leaf_types is None:
+                columns.append((name, [], str, None))
+                continue
+            leaf = leaf_types.get(name)
+            if leaf is None or leaf[0] is YLeafList:
+                raise _YPYModelError("'{}' is not a leaf of '{}'"
+                                     .format(name, type(self[0]).__name__))
+            typecode = _COLUMN_TYPECODES.get(leaf[1])
+            if typecode == 'd':
+                columns.append((name, _array.array('d'), float, float('nan')))
+            elif typecode is not None:
+                columns.append((name, _array.array(typecode), int, 0))
+            else:
+                columns.append((name, [], str, None))
+
+        for entry in self:
+            attrs = entry.__dict__
+            for name, column, convert, missing in columns:
+                leaf = attrs.get(name)
+                if leaf is not None and leaf.is_set:
+                    column.append(convert(leaf.get()))
+                else:
+                    column.append(missing)
+        return dict((name, column) for name, column, _, _ in columns)
+
+    def _get_by_segment_path(self, segment_path):
+        """Return the entry with the given segment path, or None."""
+        return self._lookup(1, segment_path)
+
+    def _lookup(self, kind, key):
+        """Look up key in the key index (kind 0) or segment path index (kind 1)."""
+        if self._indexed is None:
+            self._build_index()
+        if not self._indexed_all:
+            for entry in self:
+                if self._get_entry_keys(entry)[kind] == key:
+                    return entry
+            return None
+        entry = (self._key_index, self._path_index)[kind].get(key)
+        if entry is not None and self._get_entry_keys(entry)[kind] != key:
+            # a key leaf was changed without going through the entity
+            self._build_index()
+            entry = (self._key_index, self._path_index)[kind].get(key)
+        return entry
+
+    def _get_entry_keys(self, entry):
+        key_names = getattr(entry, '_key_names', ())
+        key = tuple(_key_value_to_str(getattr(entry, name).get()) for name in key_names)
+        return key, entry.get_segment_path()
+
+    def _index_entry(self, entry):
+        if not getattr(entry, '_key_names', ()):
+            # keyless list or entity generated without key names, lookups
+            # compare every entry
+            self._indexed_all = False
+            return
+        keys = self._get_entry_keys(entry)
+        self._indexed[id(entry)] = keys
+        self._key_index.setdefault(keys[0], entry)
+        self._path_index.setdefault(keys[1], entry)
+
+    def _unindex_entry(self, entry):
+        keys = self._indexed.pop(id(entry), None)
+        if keys is not None:
+            if self._key_index.get(keys[0]) is entry:
+                del self._key_index[keys[0]]
+            if self._path_index.get(keys[1]) is entry:
+                del self._path_index[keys[1]]
+
+    def _reindex_entry(self, entry):
+        """Called when a key leaf of entry changes."""
+        if self._indexed is not None and id(entry) in self._indexed:
+            self._unindex_entry(entry)
+            self._index_entry(entry)
+
+    def _build_index(self):
+        self._key_index, self._path_index, self._indexed = {}, {}, {}
+        self._indexed_all = True
+        for entry in self:
+            self._index_entry(entry)
+
+    def _invalidate_index(self):
+        self._key_index = self._path_index = self._indexed = None
+
+
+def _get_int64_typecode():
+    try:
+        _array.array('q')
+        return 'q', 'Q'
+    except ValueError:
+        # Python 2 has no long long arrays
+        return 'l', 'L'
+
+
+_INT_TYPECODE, _UINT_TYPECODE = _get_int64_typecode()
+_COLUMN_TYPECODES = {
+    _YType.int8: _INT_TYPECODE,
+    _YType.int16: _INT_TYPECODE,
+    _YType.int32: _INT_TYPECODE,
+    _YType.int64: _INT_TYPECODE,
+    _YType.uint8: _UINT_TYPECODE,
+    _YType.uint16: _UINT_TYPECODE,
+    _YType.uint32: _UINT_TYPECODE,
+    _YType.uint64: _UINT_TYPECODE,
+    _YType.decimal64: 'd',
+}
+
+
+def _key_value_to_str(value):
+    """Return value the way YLeaf.get() represents it."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, _Enum.YLeaf):
+        return value.name
+    if isinstance(value, _YLeaf):
+        return value.get()
+    return str(value)
+
 
 class YLeafList(_YLeafList):
     """ Wrapper class for YLeafList, add __repr__ and get list slice
@@ -109,12 +329,251 @@ class YLeafList(_YLeafList):
 
 class Entity(_Entity):
     """ Entity wrapper class overrides get_children method.
+
+        Leafs, leaf-lists, lists and non-presence containers of generated
+        classes are created on first access, from the class level tables
+        _leaf_types, _child_list_names and _child_classes. has_data,
+        has_operation and get_children only look at the ones which were
+        created.
+
+        The same tables drive update_from and to_dict, which assign or
+        export a whole tree from nested dicts and lists.
+
+        Metadata which is the same for all instances of a generated class,
+        like _children_name_map and _children_yang_names, is kept in the
+        class, so the memory of an instance is its leaf values and
+        children.
     """
+    _children_name_map = {}
+    _children_yang_names = frozenset()
+    _child_list_names = ()
+    _leaf_types = {}
+    _key_names = ()
+
     def __init__(self):
         super(Entity, self).__init__()
-        self._local_refs = {}
-        self._children_name_map = {}
-        self._children_yang_names = set()
+        if type(self)._children_yang_names is Entity._children_yang_names:
+            # bundles generated before the tables moved to the class fill
+            # them in __init__, give those instances their own
+            self.__dict__['_children_name_map'] = {}
+            self.__dict__['_children_yang_names'] = set()
+
+    def __setattr__(self, name, value):
+        if name in self._leaf_types:
+            self._set_leaf(name, value)
+            if name in self._key_names:
+                self._on_key_change()
+            return
+        if name in self._child_list_names:
+            raise _YPYModelError("Attempt to assign value of '{}' to YList {}. "
+                                 "Please use list append or extend method."
+                                 .format(value, name))
+        self._check_monkey_patching_error(name, value)
+        try:
+            if isinstance(value, Entity) and name != 'parent':
+                if value.is_presence_container:
+                    value.parent = self
+                elif value.parent is None and value.yang_name in self._children_yang_names:
+                    value.parent = self
+            super(Entity, self).__setattr__(name, value)
+        except TypeError as err:
+            _raise(_YPYModelError(str(err)))
+
+    def set_leaves(self, **values):
+        """Assign several leafs or leaf-lists, e.g.
+        ``ldata.set_leaves(number=1, name='one')``.
+
+        Raises:
+            YPYModelError: If a name is not a leaf or leaf-list of this entity,
+                or a value does not match its type.
+        """
+        for name in values:
+            if name not in self._leaf_types:
+                raise _YPYModelError("'{}' is not a leaf of '{}'"
+                                     .format(name, type(self).__name__))
+        key_changed = False
+        for name, value in values.items():
+            self._set_leaf(name, value)
+            key_changed = key_changed or name in self._key_names
+        if key_changed:
+            self._on_key_change()
+
+    @classmethod
+    def from_dict(cls, data):
+        """Return a new entity populated from data, see update_from."""
+        entity = cls()
+        entity.update_from(data)
+        return entity
+
+    def update_from(self, data):
+        """Assign leafs, leaf-lists and children from a mapping keyed by
+        attribute name, e.g.
+        ``runner.update_from({'one_list': {'ldata': [{'number': 1, 'name': 'one'}]}})``.
+
+        Containers are given as mappings, lists as sequences of mappings
+        and leaf-lists as sequences of values. List entries and leaf-list
+        values are appended to the ones already there.
+
+        Raises:
+            YPYModelError: If a name is not a leaf, leaf-list or child of
+                this entity, or a value does not match its type.
+        """
+        leaf_types = self._leaf_types
+        key_changed = False
+        for name, value in data.items():
+            leaf = leaf_types.get(name)
+            if leaf is not None:
+                if leaf[0] is YLeafList:
+                    getattr(self, name).extend(value)
+                else:
+                    self._set_leaf(name, value)
+                    key_changed = key_changed or name in self._key_names
+                continue
+            child_class = _get_child_class(type(self), name)
+            if child_class is None:
+                raise _YPYModelError("'{}' is not a leaf or child of '{}'"
+                                     .format(name, type(self).__name__))
+            if name in self._child_list_names:
+                ylist = getattr(self, name)
+                for entry_data in value:
+                    entry = child_class()
+                    # keys are set before the entry is indexed by append
+                    entry.update_from(entry_data)
+                    ylist.append(entry)
+                continue
+            child = getattr(self, name)
+            if child is None:
+                # presence container
+                child = child_class()
+                setattr(self, name, child)
+            child.update_from(value)
+        if key_changed:
+            self._on_key_change()
+
+    def to_dict(self):
+        """Return the leafs, leaf-lists and children which have data, as
+        nested dicts and lists keyed by attribute name, in the form taken
+        by update_from. Leaf values are the strings returned by YLeaf.get.
+        """
+        data = {}
+        attrs = self.__dict__
+        for name in self._leaf_names:
+            leaf = attrs.get(name)
+            if leaf is not None and leaf.is_set:
+                data[name] = leaf.get()
+        for name in self._leaf_list_names:
+            leaf_list = attrs.get(name)
+            if leaf_list is not None and len(leaf_list) > 0:
+                data[name] = [leaf.get() for leaf in leaf_list.getYLeafs()]
+        for name in self._child_container_names:
+            child = attrs.get(name)
+            if child is not None:
+                child_data = child.to_dict()
+                if child_data or child.is_presence_container:
+                    data[name] = child_data
+        for name in self._child_list_names:
+            ylist = attrs.get(name)
+            if ylist:
+                data[name] = [entry.to_dict() for entry in ylist]
+        return data
+
+    def _set_leaf(self, name, value):
+        leaf = self.__dict__.get(name)
+        if leaf is None:
+            leaf = getattr(self, name)
+        try:
+            # common types go straight to the matching native setter,
+            # instead of trying every overload of set
+            value_type = type(value)
+            if value_type is str and type(leaf) is _YLeaf:
+                leaf._set_string(value)
+            elif value_type is int and type(leaf) is _YLeaf and _INT64_MIN <= value <= _INT64_MAX:
+                leaf._set_int64(value)
+            elif isinstance(value, _Enum.YLeaf):
+                leaf.set(value.name)
+            elif isinstance(value, _YLeaf):
+                leaf.set(value.get())
+            elif isinstance(value, YLeafList):
+                super(Entity, self).__setattr__(name, value)
+            else:
+                leaf.set(value)
+        except TypeError as err:
+            _raise(_YPYModelError(str(err)))
+
+    def __getattr__(self, name):
+        # only called if name is not found the usual way
+        create = _lazy_attr_factories.get((type(self), name))
+        if create is None:
+            create = _get_lazy_attr_factory(type(self), name)
+            if create is None:
+                raise AttributeError("'{}' object has no attribute '{}'"
+                                     .format(type(self).__name__, name))
+            _lazy_attr_factories[(type(self), name)] = create
+        value = create(self, name)
+        self.__dict__[name] = value
+        return value
+
+    def has_data(self):
+        attrs = self.__dict__
+        for name in self._leaf_names:
+            leaf = attrs.get(name)
+            if leaf is not None and leaf.is_set:
+                return True
+        for name in self._leaf_list_names:
+            leaf_list = attrs.get(name)
+            if leaf_list is not None:
+                for leaf in leaf_list.getYLeafs():
+                    if leaf.yfilter != _YFilter.not_set:
+                        return True
+        for name in self._child_container_names:
+            child = attrs.get(name)
+            if child is not None and (child.is_presence_container or child.has_data()):
+                return True
+        for name in self._child_list_names:
+            for child in attrs.get(name, ()):
+                if child.has_data():
+                    return True
+        return False
+
+    def has_operation(self):
+        if self.yfilter != _YFilter.not_set:
+            return True
+        attrs = self.__dict__
+        for name in self._leaf_names:
+            leaf = attrs.get(name)
+            if leaf is not None and leaf.yfilter != _YFilter.not_set:
+                return True
+        for name in self._leaf_list_names:
+            leaf_list = attrs.get(name)
+            if leaf_list is not None:
+                if leaf_list.yfilter != _YFilter.not_set:
+                    return True
+                for leaf in leaf_list.getYLeafs():
+                    if leaf.is_set:
+                        return True
+        for name in self._child_container_names:
+            child = attrs.get(name)
+            if child is not None and child.has_operation():
+                return True
+        for name in self._child_list_names:
+            for child in attrs.get(name, ()):
+                if child.has_operation():
+                    return True
+        return False
+
+    def _get_leaf_name_data(self):
+        """Return the name and data of the leafs and leaf-lists to encode."""
+        leaf_name_data = _LeafDataList()
+        attrs = self.__dict__
+        for name in self._leaf_names:
+            leaf = attrs.get(name)
+            if leaf is not None and (leaf.is_set or leaf.yfilter != _YFilter.not_set):
+                leaf_name_data.append(leaf.get_name_leafdata())
+        for name in self._leaf_list_names:
+            leaf_list = attrs.get(name)
+            if leaf_list is not None:
+                leaf_name_data.extend(leaf_list.get_name_leafdata())
+        return leaf_name_data
 
     def __eq__(self, other):
         if not isinstance(other, Entity):
@@ -146,16 +605,88 @@ class Entity(_Entity):
         for seg in segs:
             for name in self._children_name_map:
                 if seg == self._children_name_map[name]:
-                    return self.__dict__[name]
-            for name in self._local_refs:
-                if seg == name.lstrip("ydk::seg::"):
-                    return self._local_refs[name]
+                    return getattr(self, name)
+            child = self._local_refs.get("ydk::seg::%s" % seg)
+            if child is not None:
+                return child
         return None
 
+    def _on_key_change(self):
+        """Called after a key leaf is assigned, updates the index of the
+        YList.
+        """
+        ref = self.__dict__.get('_ylist')
+        ylist = ref() if ref is not None else None
+        if ylist is not None:
+            ylist._reindex_entry(self)
+
     def _check_monkey_patching_error(self, name, value):
         obj = self.__dict__.get(name)
-        if obj is None or isinstance(obj, (_YLeaf, YLeafList, YList)):
+        if obj is None:
+            # containers are created on first access, check the value
+            # against the class of the child instead
+            child_class = _get_child_class(type(self), name)
+            if child_class is None or value is None or isinstance(value, child_class):
+                return
+            obj = getattr(self, name)
+            raise _YPYModelError("Invalid value '{!s}' in '{}'"
+                                 .format(value, obj if obj is not None else child_class.__name__))
+        if isinstance(obj, (_YLeaf, YLeafList, YList)):
             return
         if not isinstance(value, obj.__class__):
             raise _YPYModelError("Invalid value '{!s}' in '{}'"
                                  .format(value, obj))
+
+
+_lazy_attr_factories = {}
+_child_class_cache = {}
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _get_lazy_attr_factory(entity_class, name):
+    """Return a function creating attribute name of entity_class instances,
+    or None if it is not a leaf or child of the class.
+    """
+    if name == '_local_refs':
+        return lambda entity, name: {}
+    for klass in entity_class.__mro__:
+        attrs = klass.__dict__
+        leaf = attrs.get('_leaf_types', {}).get(name)
+        if leaf is not None:
+            leaf_class, ytype, yang_name = leaf
+            return lambda entity, name: leaf_class(ytype, yang_name)
+        if name in attrs.get('_child_list_names', ()):
+            return lambda entity, name: YList(entity)
+        if name in attrs.get('_child_classes', {}):
+            # presence containers are set to None by __init__, so only
+            # non-presence containers get here
+            return _functools.partial(_create_child, _get_child_class(entity_class, name))
+    return None
+
+
+def _get_child_class(entity_class, name):
+    """Return the class of child container or list name of entity_class,
+    or None if it is not a child of the class.
+    """
+    key = (entity_class, name)
+    if key in _child_class_cache:
+        return _child_class_cache[key]
+    child_class = None
+    for klass in entity_class.__mro__:
+        qualified_name = klass.__dict__.get('_child_classes', {}).get(name)
+        if qualified_name is not None:
+            # classes are referenced by qualified name, they are not all
+            # defined yet when the class body runs
+            child_class = _sys.modules[klass.__module__]
+            for class_name in qualified_name.split('.'):
+                child_class = getattr(child_class, class_name)
+            break
+    _child_class_cache[key] = child_class
+    return child_class
+
+
+def _create_child(child_class, entity, name):
+    child = child_class()
+    child.parent = entity
+    return child
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+#  ----------------------------------------------------------------
+# Copyright 2017 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+""" Stand-in NETCONF over TCP server for YDK TCP client tests, serving
+many concurrent sessions without a device. Every rpc is answered with an
+ok reply carrying its message-id, or with a data reply of about N bytes
+if the rpc has a <reply-size>N</reply-size> element. The message-id is
+left out of the reply to an rpc with a <no-message-id/> element.
+"""
+__usage__ = """ ./tcp_stub_server.py -b 12308"""
+
+import re
+import sys
+import socket
+import logging
+import argparse
+import threading
+
+if sys.version_info < (3,):
+    import SocketServer as socketserver
+else:
+    import socketserver
+
+logging.basicConfig(level=logging.INFO,
+                    format='%(name)s: %(message)s',
+                    )
+
+FOUR_k = 4096
+EOM_10 = b"]]>]]>"
+EOM_11 = b"\n##\n"
+HELLO = b"""<?xml version="1.0" encoding="UTF-8"?>
+<hello xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+  <capabilities>
+    <capability>urn:ietf:params:netconf:base:1.0</capability>
+    <capability>urn:ietf:params:netconf:base:1.1</capability>
+    </capabilities>
+  <session-id>1</session-id>
+</hello>
+"""
+REPLY = ('<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" '
+         'message-id="%s"><ok/></rpc-reply>')
+DATA_REPLY = ('<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" '
+              'message-id="%s"><data>%s</data></rpc-reply>')
+MESSAGE_ID = re.compile(br'message-id="([^"]*)"')
+REPLY_SIZE = re.compile(br'<reply-size>([0-9]+)</reply-size>')
+NO_MESSAGE_ID = b'<no-message-id/>'
+CHUNK_SIZE = 65536
+
+
+def get_data(size, cache={}):
+    """Return about size bytes of list entries, the last size is cached."""
+    if size not in cache:
+        entry = '<ldata><number>%d</number><name>entry &amp; name</name></ldata>'
+        entry_size = len(entry % 0)
+        cache.clear()
+        cache[size] = ''.join(entry % i for i in range(size // entry_size + 1))
+    return cache[size]
+
+
+def frame_chunks(reply):
+    """Return reply in RFC 6242 chunks."""
+    chunks = []
+    for i in range(0, len(reply), CHUNK_SIZE):
+        chunk = reply[i:i + CHUNK_SIZE]
+        chunks.append(b'\n#%d\n' % len(chunk))
+        chunks.append(chunk)
+    chunks.append(EOM_11)
+    return b''.join(chunks)
+
+
+class StubHandler(socketserver.BaseRequestHandler):
+    """Handles one NETCONF session."""
+
+    def handle(self):
+        self.buffer = b''
+        self.request.sendall(b"Username: ")
+        self.request.recv(FOUR_k)
+        self.request.sendall(b"Password: ")
+        self.request.recv(FOUR_k)
+        self.request.sendall(HELLO + EOM_10)
+        if self.recv_until(EOM_10) is None:
+            return
+        while True:
+            rpc = self.recv_until(EOM_11)
+            if rpc is None:
+                return
+            match = MESSAGE_ID.search(rpc)
+            message_id = match.group(1).decode('utf-8') if match else ''
+            size = REPLY_SIZE.search(rpc)
+            if size:
+                reply = DATA_REPLY % (message_id, get_data(int(size.group(1))))
+            else:
+                reply = REPLY % message_id
+            if NO_MESSAGE_ID in rpc:
+                reply = reply.replace(' message-id="%s"' % message_id, '')
+            self.request.sendall(frame_chunks(reply.encode('utf-8')))
+
+    def recv_until(self, eom):
+        """Return the next message ending with eom, or None when the
+        client closed the session.
+        """
+        while eom not in self.buffer:
+            data = self.request.recv(FOUR_k)
+            if not data:
+                return None
+            self.buffer += data
+        message, self.buffer = self.buffer.split(eom, 1)
+        return message
+
+
+class StubServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """Threaded server, one thread per session."""
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 1024
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog="tcp_stub_server", usage="%(prog)s [options]")
+    parser.add_argument("-b", "--bind", dest='bind', type=int, help="binding port, 12308")
+
+    args = parser.parse_args()
+    # keep thousands of session threads cheap
+    threading.stack_size(256 * 1024)
+
+    server = StubServer(('127.0.0.1', args.bind), StubHandler)
+    server.serve_forever()
@@ -108,6 +108,8 @@ function init_tcp_server {
         print_msg "Could not start tcp server"
         exit $status
     fi
+    print_msg "starting tcp stub server"
+    ./test/tcp_stub_server.py -b 12308 &> /dev/null &
 }
 
 function py_sanity_ydktest {
@@ -178,6 +180,12 @@ function py_sanity_ydktest_test_ncclient {
     run_test sdk/python/core/tests/test_netconf_operations.py
     run_test sdk/python/core/tests/test_opendaylight.py
     run_test sdk/python/core/tests/test_restconf_provider.py
+    run_test sdk/python/core/tests/test_netconf_provider_pool.py
+    run_test sdk/python/core/tests/test_sanity_aio.py
+    run_test sdk/python/core/tests/test_sanity_bulk.py
+    run_test sdk/python/core/tests/test_sanity_diff.py
+    run_test sdk/python/core/tests/test_sanity_transaction.py
+    run_test sdk/python/core/tests/test_sanity_read_iter.py
     run_test sdk/python/core/tests/test_sanity_delete.py
     run_test sdk/python/core/tests/test_sanity_errors.py
     run_test sdk/python/core/tests/test_sanity_filter_read.py
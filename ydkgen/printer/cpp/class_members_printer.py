@@ -156,7 +156,7 @@ class ClassMembersPrinter(object):
 
     def _get_class_inits_many(self, prop):
         if prop.is_many and isinstance(prop.property_type, Class) and not prop.property_type.is_identity():
-            return 'std::vector<std::shared_ptr<%s> > %s;' % (prop.property_type.fully_qualified_cpp_name(), prop.name)
+            return 'ydk::YList<%s> %s;' % (prop.property_type.fully_qualified_cpp_name(), prop.name)
 
     def _get_children(self, clazz):
         class_inits_properties = []
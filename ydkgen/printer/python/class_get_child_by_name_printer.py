@@ -80,18 +80,13 @@ class ClassGetChildByNamePrinter(object):
         self.ctx.lvl_dec()
 
     def _print_class_get_child_many(self, child):
-        self.ctx.writeln('for c in self.%s:' % child.name)
-        self.ctx.lvl_inc()
-        self.ctx.writeln('segment = c.get_segment_path()')
-        self.ctx.writeln('if (segment_path == segment):')
+        self.ctx.writeln('c = self.%s._get_by_segment_path(segment_path)' % child.name)
+        self.ctx.writeln('if c is not None:')
         self.ctx.lvl_inc()
         self.ctx.writeln('return c')
         self.ctx.lvl_dec()
-        self.ctx.lvl_dec()
         self.ctx.writeln('c = %s()' % (child.property_type.qn()))
         self.ctx.writeln('c.parent = self')
-        self.ctx.writeln('local_reference_key = "ydk::seg::%s" % segment_path')
-        self.ctx.writeln('self._local_refs[local_reference_key] = c')
         self.ctx.writeln('self.%s.append(c)' % child.name)
         self.ctx.writeln('return c')
 
@@ -100,7 +95,6 @@ class ClassGetChildByNamePrinter(object):
         self.ctx.lvl_inc()
         self.ctx.writeln('self.%s = %s()' % (child.name, child.property_type.qn()))
         self.ctx.writeln('self.%s.parent = self' % child.name)
-        self.ctx.writeln('self._children_name_map["%s"] = "%s"' % (child.name, child.stmt.arg))
         self.ctx.lvl_dec()
         self.ctx.writeln('return self.%s' % child.name)
 
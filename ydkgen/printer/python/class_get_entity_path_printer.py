@@ -88,11 +88,9 @@ class GetSegmentPathPrinter(object):
                 
             predicates += ']"'
             
-        self.ctx.writeln('path_buffer = ""')
-        path = '%s%s' % (path, predicates)
-        self.ctx.writeln("path_buffer = %s + path_buffer" % path)
-        self.ctx.bline()
-        self.ctx.writeln('return path_buffer')
+        # not cached, a key can change through its YLeaf, e.g.
+        # entry.number.set(2), which the entity does not see
+        self.ctx.writeln('return %s%s' % (path, predicates))
 
     def _print_get_ydk_segment_path_trailer(self, clazz):
         self.ctx.lvl_dec()
@@ -186,6 +184,10 @@ class GetEntityPathPrinter(object):
                 path = "%s%s" % (path, slash)
                 self.ctx.writeln('path_buffer = "%s%%s" %% self.get_segment_path()' % path)
 
+            self.ctx.lvl_dec()
+            self.ctx.writeln('elif ancestor is self.parent:')
+            self.ctx.lvl_inc()
+            self.ctx.writeln('path_buffer = self.get_segment_path()')
             self.ctx.lvl_dec()
             self.ctx.writeln('else:')
             self.ctx.lvl_inc()
@@ -195,24 +197,10 @@ class GetEntityPathPrinter(object):
             self.ctx.lvl_dec()
             self.ctx.bline()
        
-        self.ctx.writeln('leaf_name_data = LeafDataList()')
-        for prop in leafs:
-            if not prop.is_many:
-                self.ctx.writeln('if (self.%s.is_set or self.%s.yfilter != YFilter.not_set):' % (prop.name, prop.name))
-                self.ctx.lvl_inc()
-                self.ctx.writeln('leaf_name_data.append(self.%s.get_name_leafdata())' % (prop.name))
-                self.ctx.lvl_dec()
-        self._print_get_entity_path_leaflists(leafs)
-        self.ctx.bline()
+        self.ctx.writeln('leaf_name_data = self._get_leaf_name_data()')
         self.ctx.writeln('entity_path = EntityPath(path_buffer, leaf_name_data)')
         self.ctx.writeln('return entity_path')
 
-    def _print_get_entity_path_leaflists(self, leafs):
-        leaf_lists = [leaf for leaf in leafs if leaf.is_many]
-        for leaf in leaf_lists:
-            self.ctx.bline()
-            self.ctx.writeln('leaf_name_data.extend(self.%s.get_name_leafdata())' % leaf.name)
-
     def _print_get_entity_path_trailer(self, clazz):
         self.ctx.lvl_dec()
         self.ctx.bline()
@@ -41,12 +41,45 @@ def get_leaf_lists(clazz):
     return leaf_lists
 
 
-def get_lists(clazz):
-    lists = []
-    for child in clazz.owned_elements:
-        if child.stmt.keyword == 'list':
-            lists.append(child)
-    return lists
+def get_leaf_type(clazz, prop):
+    """ Return (leaf class, YType name, YANG name) of a leaf or leaf-list. """
+    leaf_type = None
+    if prop in get_leafs(clazz):
+        leaf_type = 'YLeaf'
+    elif prop in get_leaf_lists(clazz):
+        leaf_type = 'YLeafList'
+
+    if all((prop.stmt.top.arg != clazz.stmt.top.arg,
+            hasattr(prop.stmt.top, 'i_aug_targets') and
+            clazz.stmt.top in prop.stmt.top.i_aug_targets)):
+        name = ':'.join([prop.stmt.top.arg, prop.stmt.arg])
+    else:
+        name = prop.stmt.arg
+    return leaf_type, get_type_name(prop.property_type), name
+
+
+def get_type_name(prop_type):
+    if prop_type.name == 'string':
+        return 'str'
+    elif prop_type.name == 'leafref':
+        return 'str'
+    elif prop_type.name == 'decimal64':
+        return 'str'
+    elif prop_type.name == 'union':
+        return 'str'
+    elif prop_type.name == 'binary':
+        return 'str'
+    elif prop_type.name == 'instance-identifier':
+        return 'str'
+    elif isinstance(prop_type, Bits):
+        return 'bits'
+    elif isinstance(prop_type, Class) and prop_type.is_identity():
+        return 'identityref'
+    elif isinstance(prop_type, Enum):
+        return 'enumeration'
+    elif isinstance(prop_type, DataType):
+        return 'str'
+    return prop_type.name
 
 
 class ClassInitsPrinter(object):
@@ -79,157 +112,18 @@ class ClassInitsPrinter(object):
             self.ctx.writeln('self.yang_parent_name = "%s"' % clazz.owner.stmt.arg)
             if clazz.stmt.search_one('presence') is not None:
                 self.ctx.writeln('self.is_presence_container = True')
-            self._print_init_leafs_and_leaflists(clazz, leafs)
             self._print_init_children(children)
-        self._print_init_lists(clazz)
-
-    def _print_init_leafs_and_leaflists(self, clazz, leafs):
-        yleafs = get_leafs(clazz)
-        yleaf_lists = get_leaf_lists(clazz)
-
-        for prop in leafs:
-            leaf_type = None
-            if prop in yleafs:
-                leaf_type = 'YLeaf'
-            elif prop in yleaf_lists:
-                leaf_type = 'YLeafList'
-
-            self.ctx.bline()
-            if all((prop.stmt.top.arg != clazz.stmt.top.arg,
-                    hasattr(prop.stmt.top, 'i_aug_targets') and
-                    clazz.stmt.top in prop.stmt.top.i_aug_targets)):
-                name = ':'.join([prop.stmt.top.arg, prop.stmt.arg])
-            else:
-                name = prop.stmt.arg
-
-            self.ctx.writeln('self.%s = %s(YType.%s, "%s")'
-                % (prop.name, leaf_type, self._get_type_name(prop.property_type), name))
 
     def _print_init_children(self, children):
-        for child in children:
-            if not child.is_many:
-                self.ctx.bline()
-                if (child.stmt.search_one('presence') is None):
-                    self.ctx.writeln('self.%s = %s()' % (child.name, child.property_type.qn()))
-                    self.ctx.writeln('self.%s.parent = self' % child.name)
-                else:
-                    self.ctx.writeln('self.%s = None' % (child.name))
-                self.ctx.writeln('self._children_name_map["%s"] = "%s"' % (child.name, child.stmt.arg))
-                self.ctx.writeln('self._children_yang_names.add("%s")' % (child.stmt.arg))
-
-    def _print_init_lists(self, clazz):
-        if clazz.is_identity() and len(clazz.extends) == 0:
-            return
-
-        output = []
-        for prop in clazz.properties():
-            if (prop.is_many and
-                isinstance(prop.property_type, Class) and
-                not prop.property_type.is_identity()):
-                output.append('self.%s = YList(self)' % prop.name)
-        if len(output) > 0:
-            self.ctx.bline()
-            self.ctx.writelns(output)
+        # leafs, lists and non-presence containers are created on first
+        # access, see _leaf_types and _child_classes
+        presence_children = [child for child in children
+                             if not child.is_many and child.stmt.search_one('presence') is not None]
+        if len(presence_children) > 0:
             self.ctx.bline()
+        for child in presence_children:
+            self.ctx.writeln('self.%s = None' % (child.name))
 
     def _print_class_inits_trailer(self, clazz):
         self.ctx.lvl_dec()
         self.ctx.bline()
-
-    def _get_type_name(self, prop_type):
-        if prop_type.name == 'string':
-            return 'str'
-        elif prop_type.name == 'leafref':
-            return 'str'
-        elif prop_type.name == 'decimal64':
-            return 'str'
-        elif prop_type.name == 'union':
-            return 'str'
-        elif prop_type.name == 'binary':
-            return 'str'
-        elif prop_type.name == 'instance-identifier':
-            return 'str'
-        elif isinstance(prop_type, Bits):
-            return 'bits'
-        elif isinstance(prop_type, Class) and prop_type.is_identity():
-            return 'identityref'
-        elif isinstance(prop_type, Enum):
-            return 'enumeration'
-        elif isinstance(prop_type, DataType):
-            return 'str'
-        return prop_type.name
-
-class ClassSetAttrPrinter(object):
-
-    def __init__(self, ctx):
-        self.ctx = ctx
-
-    def print_setattr(self, clazz, leafs):
-        yleafs = get_leafs(clazz)
-        yleaf_lists = get_leaf_lists(clazz)
-        ylists = get_lists(clazz)
-
-        if len(yleafs) + len(yleaf_lists) + len(ylists)> 0:
-            self._print_class_setattr_header()
-            self._print_class_setattr_body(clazz, leafs)
-            self._print_class_setattr_trailer()
-
-    def _print_class_setattr_header(self):
-        self.ctx.writeln('def __setattr__(self, name, value):')
-        self.ctx.lvl_inc()
-        self.ctx.writeln('self._check_monkey_patching_error(name, value)')
-        self.ctx.writeln('with _handle_type_error():')
-        self.ctx.lvl_inc()
-
-    def _print_class_setattr_body(self, clazz, leafs):
-        leaf_names = [ '"%s"' % (leaf.name) for leaf in leafs ]
-        separator = ',\n%s%s' % (self.ctx.tab(), ' '*12)
-
-        self.ctx.writeln('if name in self.__dict__ and isinstance(self.__dict__[name], YList):')
-        self.ctx.lvl_inc()
-        self.ctx.writeln('raise YPYModelError("Attempt to assign value of \'{}\' to YList ldata. "')
-        self.ctx.writeln('                    "Please use list append or extend method."')
-        self.ctx.writeln('                    .format(value))')
-        self.ctx.lvl_dec()
-        self.ctx.writeln('if isinstance(value, Enum.YLeaf):')
-        self.ctx.lvl_inc()
-        self.ctx.writeln('value = value.name')
-        self.ctx.lvl_dec()
-        self.ctx.writeln('if name in (%s) and name in self.__dict__:' %
-            separator.join(leaf_names))
-        self.ctx.lvl_inc()
-        self.ctx.writeln('if isinstance(value, YLeaf):')
-        self.ctx.lvl_inc()
-        self.ctx.writeln('self.__dict__[name].set(value.get())')
-        self.ctx.lvl_dec()
-        self.ctx.writeln('elif isinstance(value, YLeafList):')
-        self.ctx.lvl_inc()
-        self.ctx.writeln('super(%s, self).__setattr__(name, value)' % clazz.qn())
-        self.ctx.lvl_dec()
-
-        self.ctx.writeln('else:')
-        self.ctx.lvl_inc()
-        self.ctx.writeln('self.__dict__[name].set(value)')
-        self.ctx.lvl_dec()
-
-        self.ctx.lvl_dec()
-        self.ctx.writeln('else:')
-        self.ctx.lvl_inc()
-        self.ctx.writeln('if hasattr(value, "parent") and name != "parent":')
-        self.ctx.lvl_inc()
-        self.ctx.writeln('if hasattr(value, "is_presence_container") and value.is_presence_container:')
-        self.ctx.lvl_inc()
-        self.ctx.writeln('value.parent = self')
-        self.ctx.lvl_dec()
-        self.ctx.writeln('elif value.parent is None and value.yang_name in self._children_yang_names:')
-        self.ctx.lvl_inc()
-        self.ctx.writeln('value.parent = self')
-        self.ctx.lvl_dec()
-        self.ctx.lvl_dec()
-        self.ctx.writeln('super(%s, self).__setattr__(name, value)' % clazz.qn())
-        self.ctx.lvl_dec()
-
-    def _print_class_setattr_trailer(self):
-        self.ctx.lvl_dec()
-        self.ctx.lvl_dec()
-        self.ctx.bline()
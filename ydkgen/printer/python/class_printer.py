@@ -26,8 +26,7 @@ from ydkgen.printer.file_printer import FilePrinter
 
 # from .bits_printer import BitsPrinter
 from .class_docstring_printer import ClassDocstringPrinter
-from .class_inits_printer import ClassInitsPrinter, ClassSetAttrPrinter
-from .class_has_data_printer import ClassHasDataPrinter
+from .class_inits_printer import ClassInitsPrinter, get_leaf_type
 from .class_get_entity_path_printer import GetEntityPathPrinter, GetSegmentPathPrinter
 from .class_get_child_by_name_printer import ClassGetChildByNamePrinter
 from .class_set_value_printer import ClassSetYLeafPrinter
@@ -65,8 +64,8 @@ class ClassPrinter(FilePrinter):
         leafs = []
         children = []
         self._get_class_members(clazz, leafs, children)
+        self._print_class_descriptors(clazz, leafs, children)
         self._print_class_inits(clazz, leafs, children)
-        self._print_class_setattr(clazz, leafs)
         self._print_child_enums(clazz)
         self._print_child_classes(clazz)
         self._print_class_functions(clazz, leafs, children)
@@ -74,8 +73,6 @@ class ClassPrinter(FilePrinter):
     def _print_class_functions(self, clazz, leafs, children):
         if clazz.is_identity():
             return
-        self._print_class_has_data(clazz, leafs, children)
-        self._print_class_has_operation(clazz, leafs, children)
         self._print_class_get_segment_path(clazz)
         self._print_class_get_entity_path(clazz, leafs)
         self._print_class_get_child_by_name(clazz, children)
@@ -129,6 +126,65 @@ class ClassPrinter(FilePrinter):
             self.ctx.writeln("_revision = '%s'" % revision_stmt.arg)
         self.ctx.bline()
 
+    def _print_class_descriptors(self, clazz, leafs, children):
+        ''' Attribute names of the leafs and children, used by the
+            native entity walker instead of calling back into Python for
+            every node, and of the list keys, in YANG order, used by the
+            YList key index. The YANG names of the children are shared by
+            all instances of the class.'''
+        if clazz.is_identity():
+            return
+        self._print_names_tuple('_leaf_names', [leaf for leaf in leafs if not leaf.is_many])
+        self._print_names_tuple('_leaf_list_names', [leaf for leaf in leafs if leaf.is_many])
+        self._print_names_tuple('_child_container_names', [child for child in children if not child.is_many])
+        self._print_names_tuple('_child_list_names', [child for child in children if child.is_many])
+        key_props = clazz.get_key_props()
+        if len(key_props) > 1:
+            key_props = sorted(key_props, key=lambda prop: clazz.stmt.i_key.index(prop.stmt))
+        self._print_names_tuple('_key_names', key_props)
+        containers = [child for child in children if not child.is_many]
+        self._print_dict('_children_name_map',
+                         ["'%s': '%s'," % (child.name, child.stmt.arg) for child in containers])
+        self._print_children_yang_names(containers)
+        self._print_lazy_attr_tables(clazz, leafs, children)
+        self.ctx.bline()
+
+    def _print_lazy_attr_tables(self, clazz, leafs, children):
+        ''' Leafs and non-presence containers are created on first access
+            from these tables, see ydk.types.Entity. _child_classes also
+            has presence containers and lists, for Entity.update_from.'''
+        entries = []
+        for leaf in leafs:
+            entries.append("'%s': (%s, YType.%s, '%s')," % ((leaf.name,) + get_leaf_type(clazz, leaf)))
+        self._print_dict('_leaf_types', entries)
+        entries = []
+        for child in children:
+            entries.append("'%s': '%s'," % (child.name, child.property_type.qn()))
+        self._print_dict('_child_classes', entries)
+
+    def _print_dict(self, attribute, entries):
+        if len(entries) == 0:
+            self.ctx.writeln('%s = {}' % attribute)
+            return
+        self.ctx.writeln('%s = {' % attribute)
+        self.ctx.lvl_inc()
+        self.ctx.writelns(entries)
+        self.ctx.lvl_dec()
+        self.ctx.writeln('}')
+
+    def _print_children_yang_names(self, children):
+        if len(children) == 0:
+            self.ctx.writeln('_children_yang_names = frozenset()')
+        else:
+            names = ', '.join("'%s'" % child.stmt.arg for child in children)
+            self.ctx.writeln('_children_yang_names = frozenset((%s,))' % names)
+
+    def _print_names_tuple(self, attribute, props):
+        names = ''.join("'%s', " % prop.name for prop in props)
+        if len(props) > 1:
+            names = names[:-2]
+        self.ctx.writeln("%s = (%s)" % (attribute, names.rstrip()))
+
     def _get_class_members(self, clazz, leafs, children):
         for prop in clazz.properties():
             ptype = prop.property_type
@@ -140,15 +196,6 @@ class ClassPrinter(FilePrinter):
     def _print_class_inits(self, clazz, leafs, children):
         ClassInitsPrinter(self.ctx, self.module_namespace_lookup).print_output(clazz, leafs, children)
 
-    def _print_class_setattr(self, clazz, leafs):
-        ClassSetAttrPrinter(self.ctx).print_setattr(clazz, leafs)
-
-    def _print_class_has_data(self, clazz, leafs, children):
-        ClassHasDataPrinter(self.ctx).print_class_has_data(clazz, leafs, children)
-
-    def _print_class_has_operation(self, clazz, leafs, children):
-        ClassHasDataPrinter(self.ctx).print_class_has_operation(clazz, leafs, children)
-
     def _print_class_get_segment_path(self, clazz):
         GetSegmentPathPrinter(self.ctx).print_output(clazz)
 
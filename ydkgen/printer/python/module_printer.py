@@ -45,7 +45,6 @@ class ModulePrinter(FilePrinter):
         self.ctx.writeln("from ydk.types import Entity, EntityPath, Identity, Enum, YType, YLeaf, YLeafList, YList, LeafDataList, Bits, Empty, Decimal64")
         self.ctx.writeln("from ydk.filters import YFilter")
         self.ctx.writeln("from ydk.errors import YPYError, YPYModelError")
-        self.ctx.writeln("from ydk.errors.error_handler import handle_type_error as _handle_type_error")
         self.ctx.bline()
         self.ctx.bline()
 